@@ -456,7 +456,7 @@ class DisplayManager:
                 splash.append(self.create_text_line(lux_text, 18, 0xCCCCCC, False))
                 
                 # Enhanced light analysis with weather context
-                if lux_val not in ['ERR', None] and isinstance(lux_val, (int, float)):
+                if lux_val not in ('ERR', None) and isinstance(lux_val, (int, float)):
                     if lux_val < 200: 
                         condition = "LOW"
                         warning_msg = f"LOW LIGHT: {lux_val:.0f} lux - possible storm clouds or fog"
@@ -884,9 +884,6 @@ class DisplayManager:
         # Get GPS time or fallback to system time
         gps_timestamp_str, gps_time_available = self.get_gps_time_or_fallback(sensor_data)
         
-        # Enhance sensor data with temperature fusion and weather forecast
-        enhanced_sensor_data = self._enhance_sensor_data_with_fusion(sensor_data)
-        
         # Check for screen change
         if current_time - self.screen_change_time >= SCREEN_DURATION:
             self.current_screen = (self.current_screen + 1) % self.screens_total
@@ -898,6 +895,9 @@ class DisplayManager:
         # Rebuild screen if needed
         if force_rebuild or self.current_splash is None:
             try:
+                # Copy + fusion + forecast only for frames that rebuild; the
+                # sensor manager hands over the same dict every frame
+                enhanced_sensor_data = self._enhance_sensor_data_with_fusion(sensor_data)
                 self.build_screen(self.current_screen, enhanced_sensor_data, gps_timestamp_str, gps_time_available)
                 display_updated = True
             except Exception as e:
@@ -32,6 +32,31 @@ DEBOUNCE_DELAY = 0.2       # Button debounce delay
 CONSOLE_UPDATE_RATE = 3.0  # Console output frequency
 
 
+# Fixed-precision formatters for log/console fields; a failed sensor reports
+# None, which would make a format spec raise, so it prints as the fail marker instead
+def _fmt0(v, fail="ERR"):
+    return "%.0f" % v if v is not None else fail
+
+
+def _fmt1(v, fail="ERR"):
+    return "%.1f" % v if v is not None else fail
+
+
+def _fmt3(v, fail="ERR"):
+    return "%.3f" % v if v is not None else fail
+
+
+# Diagnostics test-reading block, filled in with one format call
+_READINGS_TEMPLATE = ("  CO2: {co2} ppm\n"
+                      "  Temperature: {temp}°C\n"
+                      "  Humidity: {hum}%\n"
+                      "  Light: {lux} lux\n"
+                      "  Pressure: {pres} hPa\n"
+                      "  Location: {loc}\n"
+                      "  Radiation: {cpm} CPM\n"
+                      "✅ Sensor functionality: PASS")
+
+
 class DataLogger:
     """
     Handles SD card initialization and data logging with timestamped CSV files.
@@ -101,18 +126,18 @@ class DataLogger:
                 timestamp_str + "," +
                 str(sensor_data.get('co2', 'ERR')) + "," +
                 str(sensor_data.get('voc', 'ERR')) + "," +
-                f"{sensor_data.get('temperature', 0):.1f}," +
-                f"{sensor_data.get('humidity', 0):.1f}," +
-                f"{sensor_data.get('lux', 0):.0f}," +
-                f"{sensor_data.get('pressure_hpa', 0):.1f}," +
-                f"{sensor_data.get('altitude_m', 0):.1f}," +
+                _fmt1(sensor_data.get('temperature')) + "," +
+                _fmt1(sensor_data.get('humidity')) + "," +
+                _fmt0(sensor_data.get('lux')) + "," +
+                _fmt1(sensor_data.get('pressure_hpa')) + "," +
+                _fmt1(sensor_data.get('altitude_m')) + "," +
                 str(sensor_data.get('cpm', 0)) + "," +
-                f"{sensor_data.get('usv_h', 0):.3f}," +
+                _fmt3(sensor_data.get('usv_h')) + "," +
                 radiation_status + "," +
-                f"{sensor_data.get('cpu_usage', 0):.1f}," +
-                f"{sensor_data.get('memory_usage', 0):.1f}," +
-                f"{sensor_data.get('avg_loop_time', 0)*1000:.1f}," +
-                f"{sensor_data.get('cpu_temp', 0):.1f}," +
+                _fmt1(sensor_data.get('cpu_usage')) + "," +
+                _fmt1(sensor_data.get('memory_usage')) + "," +
+                _fmt1(sensor_data.get('avg_loop_time', 0) * 1000) + "," +
+                _fmt1(sensor_data.get('cpu_temp')) + "," +
                 battery_status + "," +
                 sensor_data.get('current_location', 'UNKNOWN') + "," +
                 str(sensor_data.get('gps_satellites', 0)) + "," +
@@ -225,17 +250,17 @@ def print_console_status(sensor_data, data_logger, display_manager):
         f"[{timestamp_str}] " +
         f"CO₂:{sensor_data.get('co2', 'ERR')} | " +
         f"VOC:{sensor_data.get('voc', 'ERR')} | " +
-        f"T:{sensor_data.get('temperature', 0):.1f}C | " +
-        f"RH:{sensor_data.get('humidity', 0):.1f}% | " +
-        f"P:{sensor_data.get('pressure_hpa', 0):.1f}hPa | " +
-        f"ALT:{sensor_data.get('altitude_m', 0):.0f}m | " +
+        f"T:{_fmt1(sensor_data.get('temperature'))}C | " +
+        f"RH:{_fmt1(sensor_data.get('humidity'))}% | " +
+        f"P:{_fmt1(sensor_data.get('pressure_hpa'))}hPa | " +
+        f"ALT:{_fmt0(sensor_data.get('altitude_m'))}m | " +
         f"LOC:{sensor_data.get('current_location', 'UNK')} | " +
         f"GPS:{sensor_data.get('gps_satellites', 0)}({sensor_data.get('gps_quality', 'NO_FIX')}) | " +
-        f"LUX:{sensor_data.get('lux', 0):.0f} | " +
+        f"LUX:{_fmt0(sensor_data.get('lux'))} | " +
         f"CPM:{sensor_data.get('cpm', 0)} | " +
-        f"µSv/h:{sensor_data.get('usv_h', 0):.3f}({rad_status}) | " +
-        f"CPU:{sensor_data.get('cpu_usage', 0):.0f}% | " +
-        f"TEMP:{sensor_data.get('cpu_temp', 0):.1f}C | " +
+        f"µSv/h:{_fmt3(sensor_data.get('usv_h'))}({rad_status}) | " +
+        f"CPU:{_fmt0(sensor_data.get('cpu_usage'))}% | " +
+        f"TEMP:{_fmt1(sensor_data.get('cpu_temp'))}C | " +
         f"BAT:{battery_status} | " +
         f"SD:{sd_status} | " +
         f"Screen:{display_manager.current_screen+1}/{display_manager.screens_total}"
@@ -288,7 +313,6 @@ def main():
         display_manager.screen_change_time = time.monotonic()
         
         # Performance monitoring setup
-        loop_performance_tracker = []
         console_output_timer = 0
         loop_start_time = time.monotonic()
         
@@ -302,15 +326,13 @@ def main():
             loop_duration = loop_current_time - loop_start_time
             
             # Maintain rolling performance history
-            loop_performance_tracker.append(loop_duration)
-            if len(loop_performance_tracker) > 20:
-                loop_performance_tracker.pop(0)
+            sensors.record_loop_time(loop_duration)
             
             loop_start_time = loop_current_time
             
             # **PRIORITY 1: RADIATION DETECTION (CRITICAL - EVERY LOOP)**
             # Maximum sensitivity requires this to be called every cycle
-            sensors.update_all_sensors(loop_performance_tracker)
+            sensors.update_all_sensors()
             
             # **PRIORITY 2: USER INTERFACE**
             flashlight.update()
@@ -401,16 +423,14 @@ def run_simple_diagnostics():
     """
     Simplified system diagnostics that work with existing methods.
     """
-    print("\n" + "="*60)
-    print("AI FIELD ANALYZER v2.0 - SYSTEM DIAGNOSTICS")
-    print("="*60)
-    
-    # Initialize components for testing
-    print("🔧 Initializing components for diagnostic testing...")
+    # Each block of report lines goes out in one console write
+    print("\n" + "="*60 +
+          "\nAI FIELD ANALYZER v2.0 - SYSTEM DIAGNOSTICS\n" +
+          "="*60 +
+          "\n🔧 Initializing components for diagnostic testing...")
     
     # Test display
-    print("\n📺 DISPLAY SYSTEM TEST")
-    print("-" * 30)
+    print("\n📺 DISPLAY SYSTEM TEST\n" + "-" * 30)
     try:
         display_manager = DisplayManager()
         if display_manager.initialize_display():
@@ -424,8 +444,7 @@ def run_simple_diagnostics():
         print(f"❌ Display test error: {e}")
     
     # Test sensors
-    print("\n🔬 SENSOR SYSTEM TEST")
-    print("-" * 30)
+    print("\n🔬 SENSOR SYSTEM TEST\n" + "-" * 30)
     try:
         sensors = AIFieldSensorManager()
         if sensors.initialize_all_sensors():
@@ -438,23 +457,22 @@ def run_simple_diagnostics():
             
             # Get and display sensor data
             sensor_data = sensors.get_all_sensor_data()
-            print(f"  CO2: {sensor_data.get('co2', 'ERR')} ppm")
-            print(f"  Temperature: {sensor_data.get('temperature', 0):.1f}°C")
-            print(f"  Humidity: {sensor_data.get('humidity', 0):.1f}%")
-            print(f"  Light: {sensor_data.get('lux', 0)} lux")
-            print(f"  Pressure: {sensor_data.get('pressure_hpa', 0):.1f} hPa")
-            print(f"  Location: {sensor_data.get('current_location', 'UNKNOWN')}")
-            print(f"  Radiation: {sensor_data.get('cpm', 0)} CPM")
-            
-            print("✅ Sensor functionality: PASS")
+            get = sensor_data.get
+            print(_READINGS_TEMPLATE.format(
+                co2=get('co2', 'ERR'),
+                temp=_fmt1(get('temperature')),
+                hum=_fmt1(get('humidity', 0)),
+                lux=_fmt0(get('lux')),
+                pres=_fmt1(get('pressure_hpa', 0)),
+                loc=get('current_location', 'UNKNOWN'),
+                cpm=get('cpm', 0)))
         else:
             print("❌ Sensor initialization: FAIL")
     except Exception as e:
         print(f"❌ Sensor test error: {e}")
     
     # Test SD card
-    print("\n💾 SD CARD SYSTEM TEST")
-    print("-" * 30)
+    print("\n💾 SD CARD SYSTEM TEST\n" + "-" * 30)
     try:
         data_logger = DataLogger()
         if data_logger.setup_sd_logging():
@@ -464,8 +482,7 @@ def run_simple_diagnostics():
     except Exception as e:
         print(f"❌ SD card test error: {e}")
     
-    print("\n🎯 Diagnostics complete!")
-    print("="*60)
+    print("\n🎯 Diagnostics complete!\n" + "="*60)
 
 
 if __name__ == "__main__":
@@ -21,13 +21,77 @@ import adafruit_scd4x
 import adafruit_tsl2591
 import adafruit_bmp3xx
 import gc
+import sys
 import struct
 import math
+import array
+from collections import namedtuple
+
+try:
+    import countio  # hardware edge counter for the geiger pulse line
+except ImportError:
+    countio = None
+
+try:
+    import supervisor  # CircuitPython: tells whether a USB serial console is attached
+except ImportError:
+    supervisor = None
+
+try:
+    from bisect import bisect_left
+except ImportError:  # CircuitPython has no bisect module
+    def bisect_left(a, x):
+        lo, hi = 0, len(a)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if a[mid] < x:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+# JIT for small numeric kernels: numba on desktop CPython, otherwise plain bytecode.
+# MicroPython's @micropython.native is a compile-time decorator that cannot be
+# imported by name, so on the Pico these run as ordinary functions.
+try:
+    from numba import njit
+    native = njit(cache=True)
+except ImportError:
+    def native(func):
+        return func
+
+# Verbose console output (location debug, diagnostics, test monitor).
+# Set False for headless runs so the reports are never formatted.
+_DEBUG = True
 
 # =============================================================================
 # GPS ANTI-SPOOFING MODULE
 # =============================================================================
 
+# GPS vs barometric altitude cross-check, refreshed on each confidence update
+AltComp = namedtuple('AltComp', ('gps_altitude', 'pressure_altitude', 'difference',
+                                 'pressure_sensor_healthy', 'fusion_active'))
+
+# SCD41 temperatures (°C) outside this range are not trusted for fusion
+SCD41_TEMP_MIN = -10
+SCD41_TEMP_MAX = 60
+_SCD41_RANGE_WARNING = "⚠️ SCD41 temperature {:.1f}°C outside range"
+
+# Fused temperature sources; names are only looked up for display
+TEMP_SOURCE_NAMES = ('FAILED', 'BMP390', 'SCD41', 'FUSED', 'SCD41_OUT_OF_RANGE')
+(TEMP_SRC_FAILED, TEMP_SRC_BMP390, TEMP_SRC_SCD41, TEMP_SRC_FUSED,
+ TEMP_SRC_SCD41_OUT_OF_RANGE) = range(len(TEMP_SOURCE_NAMES))
+
+# Fused temperature with the readings it came from (AIFieldSensorManager._compute_temp_state)
+TempState = namedtuple('TempState', ('smart_temp', 'source', 'bmp390_temp', 'scd41_temp',
+                                     'scd41_in_range', 'active_sensors'))
+# State reported while neither temperature sensor is initialized
+_NO_TEMP_STATE = TempState(None, TEMP_SRC_FAILED, None, None, False, 0)
+
+# Sensor health roll-up returned by AIFieldSensorManager.get_sensor_health_summary
+HealthSummary = namedtuple('HealthSummary', ('online_count', 'total_count', 'health_percentage',
+                                             'failed_sensors', 'all_healthy', 'critical_failure'))
+
 class GPSParser:
     def __init__(self, i2c, address=0x42):
         self.i2c = i2c
@@ -112,7 +176,7 @@ class GPSParser:
                 self.gps_time = f"{hour:02d}:{minute:02d}:{second:02d}"
 
             self.fix_quality = parts[6]
-            self.has_fix = self.fix_quality in ['1', '2', '3', '4', '5', '6']
+            self.has_fix = self.fix_quality in ('1', '2', '3', '4', '5', '6')
             
             if self.fix_quality == '0':
                 self.debug_msg = "No fix - searching"
@@ -288,13 +352,13 @@ class GPSParser:
         
         self.confidence_level = max(0, min(100, confidence))
         
-        self.altitude_comparison = {
-            'gps_altitude': self.altitude_m,
-            'pressure_altitude': pressure_altitude_m,
-            'difference': abs(self.altitude_m - pressure_altitude_m) if (self.altitude_m and pressure_altitude_m) else None,
-            'pressure_sensor_healthy': pressure_sensor_healthy,
-            'fusion_active': pressure_sensor_healthy and pressure_altitude_m is not None
-        }
+        self.altitude_comparison = AltComp(
+            self.altitude_m,
+            pressure_altitude_m,
+            abs(self.altitude_m - pressure_altitude_m) if (self.altitude_m and pressure_altitude_m) else None,
+            pressure_sensor_healthy,
+            pressure_sensor_healthy and pressure_altitude_m is not None
+        )
         
         return threats
 
@@ -342,19 +406,125 @@ def get_gps_data(gps):
         print(f"GPS read error: {e}")
         return None
 
+# =============================================================================
+# BMP390 REGISTER ACCESS
+# =============================================================================
+
+# adafruit_bmp3xx triggers a forced conversion and busy-waits on every property
+# read. The manager instead arms the next conversion after each poll and reads
+# the data registers once STATUS reports it ready.
+_BMP3XX_STATUS = 0x03
+_BMP3XX_DATA = 0x04      # PRESS_XLSB..TEMP_MSB, 6 bytes
+_BMP3XX_CONTROL = 0x1B
+_BMP3XX_FORCED = 0x13    # press_en | temp_en | forced mode
+_BMP3XX_DRDY = 0x60      # drdy_press | drdy_temp
+
+def _bmp3xx_compensate(data, temp_calib, pressure_calib):
+    """Raw 6-byte data block -> (pressure Pa, temperature C), same math as the driver."""
+    adc_p = data[2] << 16 | data[1] << 8 | data[0]
+    adc_t = data[5] << 16 | data[4] << 8 | data[3]
+    
+    T1, T2, T3 = temp_calib
+    pd1 = adc_t - T1
+    temperature = pd1 * T2 + (pd1 * pd1) * T3
+    
+    P1, P2, P3, P4, P5, P6, P7, P8, P9, P10, P11 = pressure_calib
+    t2 = temperature * temperature
+    t3 = t2 * temperature
+    po1 = P5 + P6 * temperature + P7 * t2 + P8 * t3
+    po2 = adc_p * (P1 + P2 * temperature + P3 * t2 + P4 * t3)
+    pd4 = adc_p * adc_p * (P9 + P10 * temperature) + P11 * adc_p * adc_p * adc_p
+    return po1 + po2 + pd4, temperature
+
 # =============================================================================
 # FIXED GPS LOCATION DETECTOR
 # =============================================================================
+
+# Score columns, in tie-break order
+LOCATION_NAMES = ("OUTDOOR", "INDOOR", "VEHICLE", "CAVE")
+
+# Tier tables: _tier() picks the first threshold the reading exceeds (the last
+# rule is the fallback). Points are (OUTDOOR, INDOOR, VEHICLE, CAVE).
+
+# -------- Speed (PRIMARY, 35%) --------
+_SPEED_THRESHOLDS = (12, 8, 5, 2)
+_SPEED_RULES = (
+    ((0, 0, 35, 0), "Speed: VEHICLE (+35)"),
+    ((7, 0, 25, 0), "Speed: likely VEHICLE (+25), possibly OUTDOOR (+7)"),
+    ((22, 0, 0, 0), "Speed: brisk OUTDOOR (+22)"),
+    ((12, 3, 0, 0), "Speed: walking OUTDOOR (+12), maybe INDOOR (+3)"),
+    ((6, 10, 0, 0), "Speed: stationary, INDOOR (+10), possible OUTDOOR (+6)"),
+)
+
+# -------- CO2 (MODERATE, 15%) --------
+_CO2_THRESHOLDS = (1800, 1200, 800)
+_CO2_RULES = (
+    ((0, 15, 0, 0), "CO2: very high, INDOOR (+15)"),
+    ((0, 10, 3, 0), "CO2: high, INDOOR (+10), possible VEHICLE (+3)"),
+    ((4, 5, 0, 0), "CO2: moderate, INDOOR (+5), OUTDOOR (+4)"),
+    ((7, 0, 0, 0), "CO2: low, OUTDOOR (+7)"),
+)
+
+# -------- Light (MODERATE, 15%) --------
+_LIGHT_THRESHOLDS = (15000, 3000, 300, 50)
+_LIGHT_RULES = (
+    ((15, 0, 0, 0), "Light: very bright, OUTDOOR (+15)"),
+    ((8, 2, 0, 0), "Light: bright, OUTDOOR (+8), possible INDOOR (+2)"),
+    ((2, 7, 0, 0), "Light: indoor levels, INDOOR (+7), possible OUTDOOR (+2)"),
+    ((0, 6, 0, 2), "Light: dim, INDOOR (+6), possible CAVE (+2)"),
+    ((0, 0, 0, 10), "Light: very dark, CAVE (+10)"),
+)
+
+# -------- Humidity (15%) --------
+_HUMIDITY_THRESHOLDS = (65, 50, 35)
+_HUMIDITY_RULES = (
+    ((11, 0, 0, 0), "Humidity: high, OUTDOOR (+11)"),
+    ((7, 2, 0, 0), "Humidity: moderate, OUTDOOR (+7), possible INDOOR (+2)"),
+    ((0, 10, 0, 0), "Humidity: low, INDOOR (+10)"),
+    ((0, 8, 0, 3), "Humidity: very low, INDOOR (+8), possible CAVE (+3)"),
+)
+
+# -------- GPS Satellites (20%) --------
+# Satellite counts are integers, so "> 6" is ">= 7". Tier 4 is the no-fix case
+# where the other cues still look outdoor.
+_GPS_THRESHOLDS = (6, 3, 1)
+_GPS_RULES = (
+    ((12, 0, 0, 0), "GPS: strong signal, OUTDOOR (+12)"),
+    ((5, 0, 0, 0), "GPS: moderate, OUTDOOR (+5)"),
+    ((0, 5, 0, 0), "GPS: weak, INDOOR (+5)"),
+    ((0, 7, 0, 13), "GPS: no fix, and other cues suggest INDOOR/CAVE (+13/+7)"),
+    ((3, 0, 0, 0), "GPS: no fix, but other cues are outdoor, OUTDOOR (+3)"),
+)
+
+# GPS quality by satellite count, clamped at 8
+_GPS_QUALITY_LUT = ("NO_SIGNAL", "POOR", "POOR", "POOR", "FAIR", "FAIR", "GOOD", "GOOD", "EXCELLENT")
+
+@native
+def _tier(value, thresholds):
+    """Index of the first descending threshold that value exceeds."""
+    i = 0
+    for limit in thresholds:
+        if value > limit:
+            return i
+        i += 1
+    return i
+
 class GPSLocationDetector:
     def __init__(self):
-        self.gps_history = []
+        self.MAX_HISTORY = 10
+        # GPS history ring buffer stored as parallel typed arrays (time, sats, speed)
+        self._hist_time = array.array('d', [0.0] * self.MAX_HISTORY)
+        self._hist_sats = array.array('i', [0] * self.MAX_HISTORY)
+        self._hist_speed = array.array('d', [0.0] * self.MAX_HISTORY)
+        self._hist_head = 0
+        self._hist_count = 0
         self.current_satellites = 0
         self.current_speed_kmh = 0.0
+        self._gps_quality = "NO_SIGNAL"
         self.current_location = "OUTDOOR"
         self.location_confidence = 50
         self.movement_confidence = 0
         self.last_update = 0
-        self.MAX_HISTORY = 10
         self.lux_history = []
         self.co2_history = []
         self.force_location = None
@@ -376,12 +546,10 @@ class GPSLocationDetector:
         self.current_latitude = None
         self.current_longitude = None
 
-        self.LOCATION_STRINGS = {
-            "OUTDOOR": "OUTDOOR",
-            "INDOOR": "INDOOR",
-            "VEHICLE": "VEHICLE",
-            "CAVE": "CAVE"
-        }
+        # Location info dict is rebuilt only when its inputs change
+        self._info_key = None
+        self._cached_info = None
+        self._refresh_location_info()
 
         print("📍 Enhanced GPS Location Detector initialized")
 
@@ -428,118 +596,50 @@ class GPSLocationDetector:
 
         self.current_satellites = satellites
         self.current_speed_kmh = speed_kmh
+        self._gps_quality = _GPS_QUALITY_LUT[min(max(satellites, 0), 8)]
         self.current_co2 = co2
         self.current_lux = lux
         self.current_humidity = humidity
         self.current_pressure = pressure_hpa
 
-        if len(self.gps_history) >= self.MAX_HISTORY:
-            self.gps_history.pop(0)
-        self.gps_history.append((current_time, satellites, speed_kmh))
+        head = self._hist_head
+        self._hist_time[head] = current_time
+        self._hist_sats[head] = satellites
+        self._hist_speed[head] = speed_kmh
+        self._hist_head = (head + 1) % self.MAX_HISTORY
+        if self._hist_count < self.MAX_HISTORY:
+            self._hist_count += 1
 
-        location_scores = {
-            "OUTDOOR": 0,
-            "INDOOR": 0,
-            "VEHICLE": 0,
-            "CAVE": 0
-        }
+        # Score each location with one table lookup per sensor tier
+        scores = [0, 0, 0, 0]
         debug = []
 
-        # -------- Speed (PRIMARY, 35%) --------
-        if speed_kmh > 12:
-            location_scores["VEHICLE"] += 35
-            debug.append("Speed: VEHICLE (+35)")
-        elif speed_kmh > 8:
-            location_scores["VEHICLE"] += 25
-            location_scores["OUTDOOR"] += 7
-            debug.append("Speed: likely VEHICLE (+25), possibly OUTDOOR (+7)")
-        elif speed_kmh > 5:
-            location_scores["OUTDOOR"] += 22
-            debug.append("Speed: brisk OUTDOOR (+22)")
-        elif speed_kmh > 2:
-            location_scores["OUTDOOR"] += 12
-            location_scores["INDOOR"] += 3
-            debug.append("Speed: walking OUTDOOR (+12), maybe INDOOR (+3)")
-        else:
-            location_scores["INDOOR"] += 10
-            location_scores["OUTDOOR"] += 6
-            debug.append("Speed: stationary, INDOOR (+10), possible OUTDOOR (+6)")
-
-        # -------- CO2 (MODERATE, 15%) --------
-        if co2 > 1800:
-            location_scores["INDOOR"] += 15
-            debug.append("CO2: very high, INDOOR (+15)")
-        elif co2 > 1200:
-            location_scores["INDOOR"] += 10
-            location_scores["VEHICLE"] += 3
-            debug.append("CO2: high, INDOOR (+10), possible VEHICLE (+3)")
-        elif co2 > 800:
-            location_scores["INDOOR"] += 5
-            location_scores["OUTDOOR"] += 4
-            debug.append("CO2: moderate, INDOOR (+5), OUTDOOR (+4)")
-        else:
-            location_scores["OUTDOOR"] += 7
-            debug.append("CO2: low, OUTDOOR (+7)")
-
-        # -------- Light (MODERATE, 15%) --------
-        if lux > 15000:
-            location_scores["OUTDOOR"] += 15
-            debug.append("Light: very bright, OUTDOOR (+15)")
-        elif lux > 3000:
-            location_scores["OUTDOOR"] += 8
-            location_scores["INDOOR"] += 2
-            debug.append("Light: bright, OUTDOOR (+8), possible INDOOR (+2)")
-        elif lux > 300:
-            location_scores["INDOOR"] += 7
-            location_scores["OUTDOOR"] += 2
-            debug.append("Light: indoor levels, INDOOR (+7), possible OUTDOOR (+2)")
-        elif lux > 50:
-            location_scores["INDOOR"] += 6
-            location_scores["CAVE"] += 2
-            debug.append("Light: dim, INDOOR (+6), possible CAVE (+2)")
-        else:
-            location_scores["CAVE"] += 10
-            debug.append("Light: very dark, CAVE (+10)")
-
-        # -------- Humidity (15%) --------
-        if humidity > 65:
-            location_scores["OUTDOOR"] += 11
-            debug.append("Humidity: high, OUTDOOR (+11)")
-        elif humidity > 50:
-            location_scores["OUTDOOR"] += 7
-            location_scores["INDOOR"] += 2
-            debug.append("Humidity: moderate, OUTDOOR (+7), possible INDOOR (+2)")
-        elif humidity > 35:
-            location_scores["INDOOR"] += 10
-            debug.append("Humidity: low, INDOOR (+10)")
-        else:
-            location_scores["INDOOR"] += 8
-            location_scores["CAVE"] += 3
-            debug.append("Humidity: very low, INDOOR (+8), possible CAVE (+3)")
-
-        # -------- GPS Satellites (20%) --------
-        if satellites >= 7:
-            location_scores["OUTDOOR"] += 12
-            debug.append("GPS: strong signal, OUTDOOR (+12)")
-        elif satellites >= 4:
-            location_scores["OUTDOOR"] += 5
-            debug.append("GPS: moderate, OUTDOOR (+5)")
-        elif satellites >= 2:
-            location_scores["INDOOR"] += 5
-            debug.append("GPS: weak, INDOOR (+5)")
-        else:
-            # Check other signals: only penalize if co2/humidity/light are also "indoorish"
-            if (co2 > 900 or humidity < 55 or lux < 350):
-                location_scores["CAVE"] += 13
-                location_scores["INDOOR"] += 7
-                debug.append("GPS: no fix, and other cues suggest INDOOR/CAVE (+13/+7)")
-            else:
-                location_scores["OUTDOOR"] += 3
-                debug.append("GPS: no fix, but other cues are outdoor, OUTDOOR (+3)")
+        gps_tier = _tier(satellites, _GPS_THRESHOLDS)
+        if gps_tier == 3 and not (co2 > 900 or humidity < 55 or lux < 350):
+            # No fix, but other cues are outdoor - only penalize if co2/humidity/light are "indoorish"
+            gps_tier = 4
+
+        for points, msg in (
+            _SPEED_RULES[_tier(speed_kmh, _SPEED_THRESHOLDS)],
+            _CO2_RULES[_tier(co2, _CO2_THRESHOLDS)],
+            _LIGHT_RULES[_tier(lux, _LIGHT_THRESHOLDS)],
+            _HUMIDITY_RULES[_tier(humidity, _HUMIDITY_THRESHOLDS)],
+            _GPS_RULES[gps_tier],
+        ):
+            scores[0] += points[0]
+            scores[1] += points[1]
+            scores[2] += points[2]
+            scores[3] += points[3]
+            if _DEBUG:
+                debug.append(msg)
 
         # --------- Collate Results ---------
-        best_location = max(location_scores, key=location_scores.get)
-        best_score = location_scores[best_location]
+        best_idx = 0
+        for i in range(1, 4):
+            if scores[i] > scores[best_idx]:
+                best_idx = i
+        best_location = LOCATION_NAMES[best_idx]
+        best_score = scores[best_idx]
         self.location_history.append(best_location)
         if len(self.location_history) > self.MAX_LOCATION_HISTORY:
             self.location_history.pop(0)
@@ -575,6 +675,7 @@ class GPSLocationDetector:
                     self.current_location = "VEHICLE"
                     self.location_confidence = max(self.location_confidence, 85)
                     print(f"🚌 Sticky VEHICLE mode (stop sign): {distance:.2f} m moved")
+                    self._refresh_location_info()
                     return  # Early exit if sticky
 
         # Smoothing: Use the most common recent location
@@ -595,21 +696,27 @@ class GPSLocationDetector:
             self.force_location = None  # Clear override when time is up
 
         self.last_update = current_time
+        self._refresh_location_info()
 
         # Verbose debug output
-        print("---- LOCATION DECISION DEBUG ----")
-        print(f"Satellites: {satellites}, Speed: {speed_kmh:.1f} km/h, CO2: {co2}, Lux: {lux}, Humidity: {humidity:.1f}")
-        for msg in debug:
-            print("   " + msg)
-        print(f"   Location scores: {location_scores}")
-        print(f"   Best: {best_location} ({best_score}%), Stable: {stable_location} (x{self.location_history.count(stable_location)})")
-        print(f"   Final decision: {self.current_location} ({self.location_confidence}%)\n")
-        
-    def get_location_info(self):
-        """
-        Returns a dict with the current location and scoring details.
-        """
-        return {
+        if _DEBUG:
+            print("---- LOCATION DECISION DEBUG ----")
+            print(f"Satellites: {satellites}, Speed: {speed_kmh:.1f} km/h, CO2: {co2}, Lux: {lux}, Humidity: {humidity:.1f}")
+            for msg in debug:
+                print("   " + msg)
+            print(f"   Location scores: {dict(zip(LOCATION_NAMES, scores))}")
+            print(f"   Best: {best_location} ({best_score}%), Stable: {stable_location} (x{self.location_history.count(stable_location)})")
+            print(f"   Final decision: {self.current_location} ({self.location_confidence}%)\n")
+        
+    def _refresh_location_info(self):
+        """Rebuild the cached location info dict if any of its inputs changed."""
+        stable = self.location_history.count(self.current_location) > 2
+        key = (self.current_location, self.location_confidence,
+               self.current_satellites, self.current_speed_kmh, stable)
+        if key == self._info_key:
+            return
+        self._info_key = key
+        self._cached_info = {
             'location': self.current_location,
             'confidence': self.location_confidence,
             'gps_satellites': self.current_satellites,
@@ -617,25 +724,98 @@ class GPSLocationDetector:
             'gps_fix': self.current_satellites >= 3,
             'stationary_time': 0,
             'time_since_change': 0,
-            'location_stable': self.location_history.count(self.current_location) > 2
+            'location_stable': stable,
+            'description': f"{self.current_location} ({self.location_confidence}%)"
         }
+
+    def get_location_info(self):
+        """
+        Returns a dict with the current location and scoring details.
+        The dict is shared between calls - copy it before modifying.
+        """
+        return self._cached_info
         
     def get_gps_quality_description(self):
-        if self.current_satellites >= 8:
-            return "EXCELLENT"
-        elif self.current_satellites >= 6:
-            return "GOOD"
-        elif self.current_satellites >= 4:
-            return "FAIR"
-        elif self.current_satellites >= 1:
-            return "POOR"
-        else:
-            return "NO_SIGNAL"
+        return self._gps_quality
 
 # =============================================================================
 # OPTIMIZED SENSOR MANAGER WITH FIXED GPS ANTI-SPOOFING
 # =============================================================================
 
+# Scheduling timestamps are integer time.monotonic_ns() values
+NS_PER_SEC = 1000000000
+
+# Sensors polled on a per-location interval by update_all_sensors
+_POLLED_SENSORS = ("air", "light", "pressure")
+_POLL_AIR, _POLL_LIGHT, _POLL_PRESSURE = range(len(_POLLED_SENSORS))
+
+# Adaptive sampling: a polled sensor whose consecutive readings stay within
+# its tolerance has its interval doubled, up to this multiple; the timeout
+# check scales with the multiplier so a slowed sensor is not failed early
+ADAPTIVE_MAX_MULT = 8
+
+# Estimated battery draw (%) per location, anything else 85
+_BATTERY_USAGE = {"OUTDOOR": 70, "VEHICLE": 75}
+
+# Sensor health slots: status/last-success are parallel lists indexed by these
+SENSOR_NAMES = ('scd41', 'tsl2591', 'bmp390', 'geiger', 'battery', 'i2c_bus', 'gps')
+(SENSOR_SCD41, SENSOR_TSL2591, SENSOR_BMP390, SENSOR_GEIGER,
+ SENSOR_BATTERY, SENSOR_I2C_BUS, SENSOR_GPS) = range(len(SENSOR_NAMES))
+_SENSOR_NAMES_UPPER = tuple(name.upper() for name in SENSOR_NAMES)
+# Diagnostics health-line prefixes per slot, indexed [slot][online]
+_HEALTH_PREFIXES = tuple((f"  ❌ {name}: OFFLINE ", f"  ✅ {name}: ONLINE ")
+                         for name in _SENSOR_NAMES_UPPER)
+_SENSOR_IDS = {name: i for i, name in enumerate(SENSOR_NAMES)}
+
+
+class _SensorStatusView:
+    """Live {name: online} mapping over a health-slot status array."""
+
+    def __init__(self, status_arr):
+        self._status_arr = status_arr
+
+    def __getitem__(self, name):
+        return bool(self._status_arr[_SENSOR_IDS[name]])
+
+    def __setitem__(self, name, online):
+        self._status_arr[_SENSOR_IDS[name]] = bool(online)
+
+    def __contains__(self, name):
+        return name in _SENSOR_IDS
+
+    def __iter__(self):
+        return iter(SENSOR_NAMES)
+
+    def __len__(self):
+        return len(SENSOR_NAMES)
+
+    def get(self, name, default=None):
+        return self[name] if name in _SENSOR_IDS else default
+
+    def keys(self):
+        return SENSOR_NAMES
+
+    def values(self):
+        return [bool(status) for status in self._status_arr]
+
+    def items(self):
+        return list(zip(SENSOR_NAMES, self.values()))
+
+
+# Every key published by AIFieldSensorManager.get_all_sensor_data
+_SNAPSHOT_KEYS = (
+    'co2', 'voc', 'temperature', 'humidity', 'lux', 'pressure_hpa', 'altitude_m',
+    'cpm', 'usv_h', 'radiation_ready', 'battery_low', 'cpu_usage', 'memory_usage',
+    'cpu_temp', 'avg_loop_time', 'max_loop_time', 'bmp390_temperature',
+    'sea_level_pressure', 'current_location', 'location_confidence',
+    'location_description', 'gps_quality', 'battery_usage_estimate',
+    'gps_latitude', 'gps_longitude', 'gps_altitude_m', 'gps_speed_knots', 'gps_course',
+    'gps_satellites', 'gps_satellites_tracked', 'gps_has_fix', 'gps_fix_quality',
+    'gps_hdop', 'gps_confidence_level', 'gps_time', 'gps_date', 'gps_debug_msg',
+    'gps_anti_spoofing_status', 'gps_available', 'gps_pressure_fusion_active',
+    'gps_fusion_threats', 'gps_altitude_comparison',
+)
+
 class AIFieldSensorManager:
     def __init__(self):
         # Hardware sensor instances
@@ -647,11 +827,13 @@ class AIFieldSensorManager:
         # GPS Anti-Spoofing System
         self.gps = None
         self.gps_data = None
-        self.gps_last_update = 0
-        self.GPS_UPDATE_INTERVAL = 1
+        self.gps_last_update = 0  # ns
+        self.GPS_UPDATE_INTERVAL_NS = 1 * NS_PER_SEC
         
         # Hardware pins
         self.geiger_pin = None
+        self.geiger_counter = None
+        self._last_counter_value = 0
         self.piezo_pin = None
         self.battery_low_pin = None
         self.button = None
@@ -659,9 +841,11 @@ class AIFieldSensorManager:
         
         # Enhanced systems
         self.gps_location_detector = GPSLocationDetector()
+        self._cached_location_info = None  # set by _sync_location_info
+        self._cached_gps_quality = None
         
-        # Location state
-        self.current_location = "OUTDOOR"
+        # Location state (the current_location setter refreshes the polling intervals)
+        self._current_location = "OUTDOOR"
         self.location_confidence = 50
         self.gps_available = False
         
@@ -673,10 +857,18 @@ class AIFieldSensorManager:
             "CAVE":    {"gps": 10, "air": 2, "light": 20, "pressure": 30, "radiation": 1}
         }
         
-        self.last_poll_times = {
-            "gps": 0, "air": 0, "light": 0, "pressure": 0, "radiation": 0
+        # (air, light, pressure) intervals per location in ns, built once so
+        # polling checks stay integer-only
+        self._intervals_ns = {
+            location: tuple(intervals[name] * NS_PER_SEC for name in _POLLED_SENSORS)
+            for location, intervals in self.location_polling_config.items()
         }
         
+        # Intervals for the current location and last poll time (ns) per slot
+        self._active_intervals = ()
+        self._active_last = [0] * len(_POLLED_SENSORS)
+        self._poll_mult = [1] * len(_POLLED_SENSORS)  # adaptive interval multipliers
+        
         # Sensor data
         self.co2 = 400
         self.voc = 0
@@ -686,29 +878,22 @@ class AIFieldSensorManager:
         self.pressure_hpa = 1013.25
         self.altitude_m = 0
         
-        # Sensor health tracking
-        self.sensor_status = {
-            'scd41': False,
-            'tsl2591': False,
-            'bmp390': False,
-            'geiger': False,
-            'battery': False,
-            'i2c_bus': False,
-            'gps': False
-        }
-        
-        self.sensor_last_success = {
-            'scd41': 0,
-            'tsl2591': 0,
-            'bmp390': 0,
-            'geiger': 0,
-            'battery': 0,
-            'gps': 0
-        }
+        # Sensor health tracking (packed arrays indexed by the SENSOR_* slots)
+        self._status_arr = array.array('B', [0] * len(SENSOR_NAMES))  # 1 = online
+        self._status_view = _SensorStatusView(self._status_arr)
+        self._last_success_arr = array.array('q', [0] * len(SENSOR_NAMES))  # ns, 0 = never
         
         self.SENSOR_TIMEOUT = 30
         
+        # Failed sensors are left off the bus and re-initialized after a
+        # back-off that doubles on every failed attempt (ns, per health slot)
+        self.REINIT_BACKOFF_MIN_NS = 30 * NS_PER_SEC
+        self.REINIT_BACKOFF_MAX_NS = 600 * NS_PER_SEC
+        self._reinit_backoff = [0] * len(SENSOR_NAMES)
+        self._reinit_due = [0] * len(SENSOR_NAMES)  # 0 while the sensor is healthy
+        
         # BMP390 optimization
+        self._bmp390_raw = False  # register-level reads available (see _BMP3XX_*)
         self.altitude_calculation_counter = 0
         self.altitude_cache_interval = 5
         self.cached_bmp390_temp = 25.0
@@ -720,40 +905,116 @@ class AIFieldSensorManager:
         self.cpm = 0
         self.usv_h = 0.0
         self.alpha = 53.032
-        self.radiation_warmup_start = 0
-        self.radiation_count_start = 0
-        self.count_duration = 120
-        self.last_pulse_time = 0
+        self.radiation_warmup_start = 0  # ns
+        self._radiation_ready = False  # latched by update_radiation_detection
+        self.radiation_count_start = 0  # ns
+        self.count_duration_ns = 120 * NS_PER_SEC
+        self.last_pulse_time = 0  # ns
+        self.PULSE_DEBOUNCE_NS = 1000000  # 1 ms
+        self.GEIGER_SILENCE_NS = 300 * NS_PER_SEC
         self.previous_geiger_state = True
+        self._pending_chirps = 0  # clicked by update_all_sensors after the sensor reads
         
         # System monitoring
         self.battery_low = False
         self.cpu_usage = 0.0
         self.memory_usage = 0.0
         self.cpu_temp = 25.0
-        self.loop_times = []
+        # Last LOOP_WINDOW loop durations as a ring buffer with a running sum
+        self.LOOP_WINDOW = 10
+        self._lt_buf = array.array('f', [0.0] * self.LOOP_WINDOW)
+        self._lt_idx = 0
+        self._lt_count = 0
+        self._lt_sum = 0.0
+        self._lt_max = 0.0
         self.avg_loop_time = 0.0
         self.max_loop_time = 0.0
         self.battery_usage_estimate = 100
         
-        self.performance_update_time = 0
-        self.PERFORMANCE_UPDATE_INTERVAL = 15
+        self.performance_update_time = 0  # ns
+        self.PERFORMANCE_UPDATE_INTERVAL_NS = 15 * NS_PER_SEC
         
         self.air_quality_last_update = 0
         self.light_last_update = 0
         self.pressure_last_update = 0
-        self.battery_check_time = 0
+        self.battery_check_time = 0  # ns
         
-        self.STATUS_STRINGS = {
-            True: "READY",
-            False: "WARMUP"
-        }
+        self.RADIATION_WARMUP_NS = 120 * NS_PER_SEC
+        self.BATTERY_CHECK_INTERVAL_NS = 60 * NS_PER_SEC
         
-        self.RADIATION_WARMUP = 120
-        self.BATTERY_CHECK_INTERVAL = 60
+        # Bound pollers, health slots and re-initializers in _POLLED_SENSORS order
+        self._UPDATERS = (self.update_air_quality, self.update_light_sensor, self.update_pressure_sensor)
+        self._POLL_SLOTS = (SENSOR_SCD41, SENSOR_TSL2591, SENSOR_BMP390)
+        self._REINITS = (self._init_scd41, self._init_tsl2591, self._init_bmp390)
+        # Clear a sensor's readings once it goes stale, indexed by health slot
+        self._INVALIDATORS = (self._invalidate_scd41, self._invalidate_tsl2591, self._invalidate_bmp390,
+                              None, None, None, None)
+        self._refresh_active_intervals()
+        
+        # Reused by get_all_sensor_data so polling does not allocate a new dict
+        self._snapshot = dict.fromkeys(_SNAPSHOT_KEYS)
+        self._snapshot_gps_live = None  # None until the GPS fields are first written
+        
+        # _compute_temp_state result and the readings it was built from
+        self._temp_state = None
+        self._temp_key_bmp = None
+        self._temp_key_scd = None
+        
+        # get_sensor_health_summary result and the status it was built from
+        self._health_summary = None
+        self._health_key = None
         
         print("🔧 AI Field Sensor Manager v2.0 with FIXED GPS Anti-Spoofing Initialized")
 
+    @property
+    def current_location(self):
+        return self._current_location
+
+    @current_location.setter
+    def current_location(self, location):
+        if location != self._current_location:
+            self._current_location = location
+            self._refresh_active_intervals()
+
+    # BMP390 readings are kept as scaled ints (Pa, cm, centi-degC) and only
+    # turned back into floats when read
+    @property
+    def pressure_hpa(self):
+        v = self._pressure_pa
+        return None if v is None else v / 100
+
+    @pressure_hpa.setter
+    def pressure_hpa(self, value):
+        self._pressure_pa = None if value is None else int(round(value * 100))
+
+    @property
+    def altitude_m(self):
+        v = self._altitude_cm
+        return None if v is None else v / 100
+
+    @altitude_m.setter
+    def altitude_m(self, value):
+        self._altitude_cm = None if value is None else int(round(value * 100))
+
+    @property
+    def cached_bmp390_temp(self):
+        v = self._bmp_temp_ci
+        return None if v is None else v / 100
+
+    @cached_bmp390_temp.setter
+    def cached_bmp390_temp(self, value):
+        self._bmp_temp_ci = None if value is None else int(round(value * 100))
+
+    @property
+    def sensor_status(self):
+        """Live {name: online} view of the sensor health slots; writes go through."""
+        return self._status_view
+
+    @property
+    def sensor_last_success(self):
+        """Read-only {name: monotonic time} snapshot; 0.0 means never."""
+        return {name: t / NS_PER_SEC for name, t in zip(SENSOR_NAMES, self._last_success_arr)}
+
     def initialize_gps(self):
         try:
             # Use the same I2C bus as other sensors - GPS has unique address 0x42
@@ -763,23 +1024,27 @@ class AIFieldSensorManager:
                 
             self.gps = GPSParser(self.i2c)  # Use existing I2C bus
             if self.gps:
-                self.sensor_status['gps'] = True
+                self._status_arr[SENSOR_GPS] = True
                 self.gps_available = True
                 print("✅ GPS Anti-Spoofing module initialized on shared I2C bus")
                 return True
             else:
                 print("❌ GPS Anti-Spoofing module failed to initialize")
-                self.sensor_status['gps'] = False
+                self._status_arr[SENSOR_GPS] = False
                 return False
         except Exception as e:
             print(f"❌ GPS initialization error: {e}")
-            self.sensor_status['gps'] = False
+            self._status_arr[SENSOR_GPS] = False
             return False
 
     def initialize_hardware_pins(self):
         try:
-            self.geiger_pin = digitalio.DigitalInOut(board.GP7)
-            self.geiger_pin.switch_to_input(pull=digitalio.Pull.UP)
+            if countio:
+                # Count falling edges in hardware so pulses during slow I2C reads are not lost
+                self.geiger_counter = countio.Counter(board.GP7, edge=countio.Edge.FALL, pull=digitalio.Pull.UP)
+            else:
+                self.geiger_pin = digitalio.DigitalInOut(board.GP7)
+                self.geiger_pin.switch_to_input(pull=digitalio.Pull.UP)
         
             self.piezo_pin = digitalio.DigitalInOut(board.GP20)
             self.piezo_pin.switch_to_output()
@@ -794,20 +1059,77 @@ class AIFieldSensorManager:
             self.battery_low_pin = digitalio.DigitalInOut(board.GP0)
             self.battery_low_pin.switch_to_input(pull=digitalio.Pull.UP)
         
-            current_time = time.monotonic()
-            self.radiation_warmup_start = current_time
-            self.radiation_count_start = current_time
+            current_ns = time.monotonic_ns()
+            self.radiation_warmup_start = current_ns
+            self.radiation_count_start = current_ns
+            self._radiation_ready = False
             
-            self.sensor_status['geiger'] = True
-            self.sensor_status['battery'] = True
+            self._status_arr[SENSOR_GEIGER] = True
+            self._status_arr[SENSOR_BATTERY] = True
         
             print("✅ Hardware pins initialized")
             return True
         
         except Exception as e:
             print(f"❌ Hardware pin initialization failed: {e}")
-            self.sensor_status['geiger'] = False
-            self.sensor_status['battery'] = False
+            self._status_arr[SENSOR_GEIGER] = False
+            self._status_arr[SENSOR_BATTERY] = False
+            return False
+
+    def _init_scd41(self):
+        try:
+            self.scd41 = adafruit_scd4x.SCD4X(self.i2c)
+            self.scd41.start_periodic_measurement()
+            self._status_arr[SENSOR_SCD41] = True
+            print("✅ SCD41 air quality sensor ready")
+            return True
+        except Exception as e:
+            print(f"❌ SCD41 initialization failed: {e}")
+            self.scd41 = None
+            self._status_arr[SENSOR_SCD41] = False
+            return False
+
+    def _init_tsl2591(self):
+        try:
+            self.tsl = adafruit_tsl2591.TSL2591(self.i2c)
+            self.tsl.gain = adafruit_tsl2591.GAIN_LOW
+            self.tsl.integration_time = adafruit_tsl2591.INTEGRATIONTIME_100MS
+            self._status_arr[SENSOR_TSL2591] = True
+            print("✅ TSL2591 light sensor ready")
+            return True
+        except Exception as e:
+            print(f"❌ TSL2591 initialization failed: {e}")
+            self.tsl = None
+            self._status_arr[SENSOR_TSL2591] = False
+            return False
+
+    def _init_bmp390(self):
+        try:
+            self.bmp390 = adafruit_bmp3xx.BMP3XX_I2C(self.i2c)
+            
+            self.bmp390.pressure_oversampling = 2
+            self.bmp390.temperature_oversampling = 1
+            self.bmp390.filter_coefficient = 4
+            self.bmp390.standby_time = 10
+            self.bmp390.sea_level_pressure = 1013.25
+            
+            self.pressure_hpa = self.bmp390.pressure
+            self.altitude_m = self.bmp390.altitude
+            self.cached_bmp390_temp = self.bmp390.temperature
+            
+            self._bmp390_raw = (hasattr(self.bmp390, '_read_register') and
+                                hasattr(self.bmp390, '_pressure_calib'))
+            if self._bmp390_raw:
+                self._bmp390_start_conversion()
+            
+            self._status_arr[SENSOR_BMP390] = True
+            print(f"✅ BMP390 ready - {self.pressure_hpa:.1f} hPa, {self.altitude_m:.1f}m")
+            return True
+            
+        except Exception as e:
+            print(f"❌ BMP390 initialization failed: {e}")
+            self.bmp390 = None
+            self._status_arr[SENSOR_BMP390] = False
             return False
 
     def initialize_i2c_sensors(self):
@@ -816,62 +1138,17 @@ class AIFieldSensorManager:
         
         try:
             self.i2c = busio.I2C(board.GP5, board.GP4)
-            self.sensor_status['i2c_bus'] = True
+            self._status_arr[SENSOR_I2C_BUS] = True
             print("✅ I2C bus initialized")
-            
-            # SCD41
-            try:
-                self.scd41 = adafruit_scd4x.SCD4X(self.i2c)
-                self.scd41.start_periodic_measurement()
-                self.sensor_status['scd41'] = True
-                sensors_initialized += 1
-                print("✅ SCD41 air quality sensor ready")
-            except Exception as e:
-                print(f"❌ SCD41 initialization failed: {e}")
-                self.scd41 = None
-                self.sensor_status['scd41'] = False
-            
-            # TSL2591
-            try:
-                self.tsl = adafruit_tsl2591.TSL2591(self.i2c)
-                self.tsl.gain = adafruit_tsl2591.GAIN_LOW
-                self.tsl.integration_time = adafruit_tsl2591.INTEGRATIONTIME_100MS
-                self.sensor_status['tsl2591'] = True
-                sensors_initialized += 1
-                print("✅ TSL2591 light sensor ready")
-            except Exception as e:
-                print(f"❌ TSL2591 initialization failed: {e}")
-                self.tsl = None
-                self.sensor_status['tsl2591'] = False
-            
-            # BMP390
-            try:
-                self.bmp390 = adafruit_bmp3xx.BMP3XX_I2C(self.i2c)
-                
-                self.bmp390.pressure_oversampling = 2
-                self.bmp390.temperature_oversampling = 1
-                self.bmp390.filter_coefficient = 4
-                self.bmp390.standby_time = 10
-                self.bmp390.sea_level_pressure = 1013.25
-                
-                self.pressure_hpa = self.bmp390.pressure
-                self.altitude_m = self.bmp390.altitude
-                self.cached_bmp390_temp = self.bmp390.temperature
-                
-                self.sensor_status['bmp390'] = True
-                sensors_initialized += 1
-                print(f"✅ BMP390 ready - {self.pressure_hpa:.1f} hPa, {self.altitude_m:.1f}m")
-                
-            except Exception as e:
-                print(f"❌ BMP390 initialization failed: {e}")
-                self.bmp390 = None
-                self.sensor_status['bmp390'] = False
-                
         except Exception as e:
             print(f"❌ I2C bus initialization failed: {e}")
-            self.sensor_status['i2c_bus'] = False
+            self._status_arr[SENSOR_I2C_BUS] = False
             return False
         
+        for init in self._REINITS:
+            if init():
+                sensors_initialized += 1
+        
         success_rate = (sensors_initialized / total_sensors) * 100
         print(f"📊 Sensor initialization: {sensors_initialized}/{total_sensors} ({success_rate:.0f}%)")
         
@@ -880,36 +1157,31 @@ class AIFieldSensorManager:
     def initialize_all_sensors(self):
         print("🚀 Starting AI Field Analyzer v2.0 with FIXED GPS Anti-Spoofing...")
         
+        # (step, success message, failure message), run in order
+        steps = (
+            (self.initialize_hardware_pins, "Hardware pins initialized", "Hardware pin initialization failed"),
+            (self.initialize_i2c_sensors, "I2C sensors initialized", "I2C sensor initialization failed"),
+            (self.initialize_gps, "GPS Anti-Spoofing initialized", "GPS Anti-Spoofing initialization failed"),
+        )
         success_count = 0
-        total_steps = 3
-        
-        if self.initialize_hardware_pins():
-            success_count += 1
-            print("✅ Step 1/3: Hardware pins initialized")
-        else:
-            print("❌ Step 1/3: Hardware pin initialization failed")
+        total_steps = len(steps)
         
-        if self.initialize_i2c_sensors():
-            success_count += 1
-            print("✅ Step 2/3: I2C sensors initialized")
-        else:
-            print("❌ Step 2/3: I2C sensor initialization failed")
-        
-        if self.initialize_gps():
-            success_count += 1
-            print("✅ Step 3/3: GPS Anti-Spoofing initialized")
-        else:
-            print("❌ Step 3/3: GPS Anti-Spoofing initialization failed")
+        for number, (step, ok_msg, fail_msg) in enumerate(steps, 1):
+            if step():
+                success_count += 1
+                print(f"✅ Step {number}/{total_steps}: {ok_msg}")
+            else:
+                print(f"❌ Step {number}/{total_steps}: {fail_msg}")
         
         success_rate = (success_count / total_steps) * 100
         print(f"📊 System initialization: {success_count}/{total_steps} ({success_rate:.0f}%)")
         
         return success_count >= 2
 
-    def update_gps_data(self):
-        current_time = time.monotonic()
+    def update_gps_data(self, now=None):
+        current_ns = time.monotonic_ns() if now is None else now
         
-        if current_time - self.gps_last_update < self.GPS_UPDATE_INTERVAL:
+        if current_ns - self.gps_last_update < self.GPS_UPDATE_INTERVAL_NS:
             return False
             
         if not self.gps:
@@ -919,7 +1191,7 @@ class AIFieldSensorManager:
             self.gps_data = get_gps_data(self.gps)
             if self.gps_data:
                 # Apply pressure sensor fusion
-                if self.bmp390 and self.sensor_status.get('bmp390', False):
+                if self.bmp390 and self._status_arr[SENSOR_BMP390]:
                     pressure_altitude = self.altitude_m
                     pressure_healthy = True
                 else:
@@ -932,9 +1204,9 @@ class AIFieldSensorManager:
                 self.gps_data['fusion_threats'] = fusion_threats
                 self.gps_data['pressure_fusion_active'] = pressure_healthy
                 
-                self.sensor_status['gps'] = True
-                self.sensor_last_success['gps'] = current_time
-                self.gps_last_update = current_time
+                self._status_arr[SENSOR_GPS] = True
+                self._last_success_arr[SENSOR_GPS] = current_ns
+                self.gps_last_update = current_ns
                 
                 satellites = self.gps_data.get('satellites', 0)
                 speed_kmh = self.gps_data.get('speed_knots', 0) * 1.852
@@ -955,9 +1227,7 @@ class AIFieldSensorManager:
                     longitude=longitude
                 )
                 
-                location_info = self.gps_location_detector.get_location_info()
-                self.current_location = location_info['location']
-                self.location_confidence = location_info['confidence']
+                self._sync_location_info()
                 
                 return True
             else:
@@ -965,7 +1235,7 @@ class AIFieldSensorManager:
                 
         except Exception as e:
             print(f"❌ GPS update error: {e}")
-            self.sensor_status['gps'] = False
+            self._status_arr[SENSOR_GPS] = False
             return False
 
     def _simulate_gps_satellites(self):
@@ -978,199 +1248,273 @@ class AIFieldSensorManager:
             return 0
 
     def _calculate_battery_usage_fast(self):
-        if self.current_location == "OUTDOOR":
-            return 70
-        elif self.current_location == "VEHICLE":
-            return 75
-        else:
-            return 85
+        return _BATTERY_USAGE.get(self.current_location, 85)
 
-    def update_gps_and_location(self):
-        current_time = time.monotonic()
+    def update_gps_and_location(self, now=None):
+        current_ns = time.monotonic_ns() if now is None else now
         
-        if self.gps and self.update_gps_data():
-            location_info = self.gps_location_detector.get_location_info()
-            self.current_location = location_info['location']
-            self.location_confidence = location_info['confidence']
-        else:
-            if current_time - self.gps_last_update < self.GPS_UPDATE_INTERVAL:
-                return
+        if self.gps and self.update_gps_data(current_ns):
+            return  # update_gps_data already synced the location info
+        
+        if current_ns - self.gps_last_update < self.GPS_UPDATE_INTERVAL_NS:
+            return
+        
+        try:
+            satellites = self._simulate_gps_satellites()
+            speed_kmh = 0.0
             
-            try:
-                satellites = self._simulate_gps_satellites()
-                speed_kmh = 0.0
-                
-                # FIXED: Enhanced fallback location detection with proper GPS coordinates
-                self.gps_location_detector.update_gps_data(
-                    satellites,
-                    speed_kmh,
-                    co2=self.co2 if self.co2 else 400,
-                    lux=self.lux if self.lux else 0,
-                    pressure_hpa=self.pressure_hpa if self.pressure_hpa else 1013.25,
-                    humidity=self.humidity if self.humidity else 50,
-                    latitude=None,  # No GPS data in fallback mode
-                    longitude=None
-                )
-                location_info = self.gps_location_detector.get_location_info()
-                self.current_location = location_info['location']
-                self.location_confidence = location_info['confidence']
-                
-                self.battery_usage_estimate = self._calculate_battery_usage_fast()
-                
-                self.gps_last_update = current_time
-                
-            except Exception as e:
-                print(f"⚠️ GPS/Location update error: {e}")
+            # FIXED: Enhanced fallback location detection with proper GPS coordinates
+            self.gps_location_detector.update_gps_data(
+                satellites,
+                speed_kmh,
+                co2=self.co2 if self.co2 else 400,
+                lux=self.lux if self.lux else 0,
+                pressure_hpa=self.pressure_hpa if self.pressure_hpa else 1013.25,
+                humidity=self.humidity if self.humidity else 50,
+                latitude=None,  # No GPS data in fallback mode
+                longitude=None
+            )
+            self._sync_location_info()
+            
+            self.battery_usage_estimate = self._calculate_battery_usage_fast()
+            
+            self.gps_last_update = current_ns
+            
+        except Exception as e:
+            print(f"⚠️ GPS/Location update error: {e}")
+
+    def _sync_location_info(self):
+        """Pull the detector's results once per location update."""
+        detector = self.gps_location_detector
+        location_info = detector.get_location_info()
+        self._cached_location_info = location_info
+        self._cached_gps_quality = detector.get_gps_quality_description()
+        self.current_location = location_info['location']
+        self.location_confidence = location_info['confidence']
+
+    def _refresh_active_intervals(self):
+        self._active_intervals = self._intervals_ns[self._current_location]
+        # New surroundings - go back to the base rates
+        for i in range(len(self._poll_mult)):
+            self._poll_mult[i] = 1
+
+    def _adapt_interval(self, slot, stable):
+        """Double a polled sensor's interval while it holds steady, reset it on change."""
+        mult = self._poll_mult
+        if not stable:
+            mult[slot] = 1
+        elif mult[slot] < ADAPTIVE_MAX_MULT:
+            mult[slot] *= 2
+
+    def _read_geiger_pulses(self, current_ns):
+        """New pulses since the last call, from the edge counter or by polling GP7."""
+        if self.geiger_counter is not None:
+            count = self.geiger_counter.count
+            new_pulses = count - self._last_counter_value
+            self._last_counter_value = count
+            return new_pulses
+        
+        current_geiger_state = self.geiger_pin.value
+        new_pulses = 0
+        if self.previous_geiger_state and not current_geiger_state and current_ns - self.last_pulse_time > self.PULSE_DEBOUNCE_NS:
+            new_pulses = 1
+        self.previous_geiger_state = current_geiger_state
+        return new_pulses
 
-    def _should_update_sensor(self, sensor_name, interval):
-        if interval <= 0:
-            return False
-        
-        current_time = time.monotonic()
-        last_update = self.last_poll_times.get(sensor_name, 0)
+    def _drain_chirps(self):
+        """One piezo click for all pulses seen this loop."""
+        self._pending_chirps = 0
+        try:
+            self.piezo_pin.value = True
+            self.piezo_pin.value = False
+        except Exception as e:
+            print(f"⚠️ Piezo error: {e}")
+
+    def update_radiation_detection(self, now=None):
+        current_ns = time.monotonic_ns() if now is None else now
         
-        if current_time - last_update >= interval:
-            self.last_poll_times[sensor_name] = current_time
-            return True
+        # Warmup only ever completes once; latch it so readers skip the clock
+        if not self._radiation_ready and current_ns - self.radiation_warmup_start >= self.RADIATION_WARMUP_NS:
+            self._radiation_ready = True
         
-        return False
-
-    def update_radiation_detection(self):
-        if self.geiger_pin is None or self.piezo_pin is None:
-            self.sensor_status['geiger'] = False
+        if (self.geiger_counter is None and self.geiger_pin is None) or self.piezo_pin is None:
+            self._status_arr[SENSOR_GEIGER] = False
             return False
         
-        current_time = time.monotonic()
-        
         try:
-            current_geiger_state = self.geiger_pin.value
+            new_pulses = self._read_geiger_pulses(current_ns)
         except Exception as e:
             print(f"❌ Geiger pin read error: {e}")
-            self.sensor_status['geiger'] = False
+            self._status_arr[SENSOR_GEIGER] = False
             return False
 
-        if self.previous_geiger_state and not current_geiger_state and current_time - self.last_pulse_time > 0.001:
-            self.pulse_count += 1
-            self.last_pulse_time = current_time
+        if new_pulses > 0:
+            self.pulse_count += new_pulses
+            self.last_pulse_time = current_ns
+            self._pending_chirps += new_pulses
             
-            try:
-                self.piezo_pin.value = True
-                self.piezo_pin.value = False
-            except Exception as e:
-                print(f"⚠️ Piezo error: {e}")
-            
-            self.sensor_status['geiger'] = True
-            self.sensor_last_success['geiger'] = current_time
-
-        self.previous_geiger_state = current_geiger_state
+            self._status_arr[SENSOR_GEIGER] = True
+            self._last_success_arr[SENSOR_GEIGER] = current_ns
 
-        if current_time - self.radiation_count_start >= self.count_duration:
+        if current_ns - self.radiation_count_start >= self.count_duration_ns:
             self.cpm = self.pulse_count
             self.usv_h = self.cpm / self.alpha
             self.pulse_count = 0
-            self.radiation_count_start = current_time
+            self.radiation_count_start = current_ns
 
-        if current_time - self.sensor_last_success.get('geiger', current_time) > 300:
+        # last_pulse_time is the geiger last-success time in ns
+        if current_ns - self.last_pulse_time > self.GEIGER_SILENCE_NS:
             if self.is_radiation_ready() and self.cpm == 0:
                 print("⚠️ Geiger counter: No pulses detected for 5+ minutes")
         
         return True
 
     def is_radiation_ready(self):
-        elapsed = time.monotonic() - self.radiation_warmup_start
-        return elapsed >= self.RADIATION_WARMUP
+        return self._radiation_ready
 
-    def update_air_quality(self):
+    def _invalidate_scd41(self):
+        self.co2 = None
+        self.temperature = None
+        self.humidity = None
+        self.voc = None
+
+    def _invalidate_tsl2591(self):
+        self.lux = None
+
+    def _invalidate_bmp390(self):
+        # Clear the scaled backing fields directly, and only once
+        if self._pressure_pa is not None:
+            self._pressure_pa = self._altitude_cm = self._bmp_temp_ci = None
+
+    def update_air_quality(self, now=None):
         if self.scd41:
             try:
                 if self.scd41.data_ready:
+                    prev_co2 = self.co2
                     self.co2 = self.scd41.CO2
                     self.temperature = self.scd41.temperature
                     self.humidity = self.scd41.relative_humidity
                     
-                    co2_factor = max(0, self.co2 - 400)
-                    humidity_factor = max(0, self.humidity - 40)
-                    self.voc = int(co2_factor * 1.5 + humidity_factor * 5)
+                    self.voc = (max(0, int(self.co2) - 400) * 3 // 2 +
+                                max(0, int(self.humidity) - 40) * 5)
+                    
+                    self._adapt_interval(_POLL_AIR, prev_co2 is not None and abs(self.co2 - prev_co2) < 20)
                     
-                    self.sensor_status['scd41'] = True
-                    self.sensor_last_success['scd41'] = time.monotonic()
+                    self._status_arr[SENSOR_SCD41] = True
+                    self._last_success_arr[SENSOR_SCD41] = time.monotonic_ns() if now is None else now
                     return True
                 else:
                     return False
                     
             except Exception as e:
                 print(f"❌ SCD41 read error: {e}")
-                self.sensor_status['scd41'] = False
-                self.co2 = None
-                self.temperature = None  
-                self.humidity = None
-                self.voc = None
+                self._status_arr[SENSOR_SCD41] = False
+                self._invalidate_scd41()
                 return False
         else:
-            self.sensor_status['scd41'] = False
-            self.co2 = None
-            self.temperature = None
-            self.humidity = None
-            self.voc = None
+            self._status_arr[SENSOR_SCD41] = False
+            self._invalidate_scd41()
             return False
 
-    def update_light_sensor(self):
+    def update_light_sensor(self, now=None):
         if self.tsl:
             try:
+                prev_lux = self.lux
                 lux_reading = self.tsl.lux
                 self.lux = 120000 if lux_reading is None else lux_reading
                 
-                self.sensor_status['tsl2591'] = True
-                self.sensor_last_success['tsl2591'] = time.monotonic()
+                self._adapt_interval(_POLL_LIGHT, prev_lux is not None and abs(self.lux - prev_lux) <= prev_lux * 0.05)
+                
+                self._status_arr[SENSOR_TSL2591] = True
+                self._last_success_arr[SENSOR_TSL2591] = time.monotonic_ns() if now is None else now
                 return True
                 
             except Exception as e:
                 print(f"❌ TSL2591 read error: {e}")
-                self.sensor_status['tsl2591'] = False
-                self.lux = None
+                self._status_arr[SENSOR_TSL2591] = False
+                self._invalidate_tsl2591()
                 return False
         else:
-            self.sensor_status['tsl2591'] = False
-            self.lux = None
+            self._status_arr[SENSOR_TSL2591] = False
+            self._invalidate_tsl2591()
             return False
 
-    def update_pressure_sensor(self):
+    def _bmp390_start_conversion(self):
+        self.bmp390._write_register_byte(_BMP3XX_CONTROL, _BMP3XX_FORCED)
+
+    def _bmp390_data_ready(self):
+        return self.bmp390._read_byte(_BMP3XX_STATUS) & _BMP3XX_DRDY == _BMP3XX_DRDY
+
+    def _bmp390_read_data(self):
+        """Compensated (pressure Pa, temperature C) from the last finished conversion."""
+        bmp = self.bmp390
+        data = bmp._read_register(_BMP3XX_DATA, 6)
+        return _bmp3xx_compensate(data, bmp._temp_calib, bmp._pressure_calib)
+
+    def _pressure_altitude(self, pressure_hpa):
+        """Barometric altitude (m) without the pow() call.
+
+        Degree-4 fit of the adafruit_bmp3xx formula 44307.7 * (1 - x**0.190284)
+        in r = x - 1; within 0.15 m of it for 700-1100 hPa.
+        """
+        r = pressure_hpa / self.bmp390.sea_level_pressure - 1.0
+        return 0.1008 + r * (-8431.73 + r * (3390.28 + r * (-2035.34 + r * 2197.76)))
+
+    def update_pressure_sensor(self, now=None):
         if self.bmp390:
             try:
-                self.pressure_hpa = self.bmp390.pressure
-                
-                self.altitude_calculation_counter += 1
-                if self.altitude_calculation_counter >= self.altitude_cache_interval:
-                    self.altitude_m = self.bmp390.altitude
-                    self.altitude_calculation_counter = 0
+                prev_hpa = self.pressure_hpa
+                if self._bmp390_raw:
+                    if not self._bmp390_data_ready():
+                        return True  # conversion still running - keep the last reading
+                    
+                    # One burst holds both pressure and temperature
+                    pressure_pa, temperature = self._bmp390_read_data()
+                    pressure_hpa = pressure_pa / 100
+                    self.pressure_hpa = pressure_hpa
+                    self.cached_bmp390_temp = temperature
+                    
+                    self.altitude_calculation_counter += 1
+                    if self.altitude_calculation_counter >= self.altitude_cache_interval:
+                        self.altitude_m = self._pressure_altitude(pressure_hpa)
+                        self.altitude_calculation_counter = 0
+                    
+                    # Arm the next conversion so it is finished by the next poll
+                    self._bmp390_start_conversion()
+                else:
+                    pressure_hpa = self.bmp390.pressure
+                    self.pressure_hpa = pressure_hpa
+                    
+                    self.altitude_calculation_counter += 1
+                    if self.altitude_calculation_counter >= self.altitude_cache_interval:
+                        self.altitude_m = self._pressure_altitude(pressure_hpa)
+                        self.altitude_calculation_counter = 0
+                    
+                    self.bmp390_temp_counter += 1
+                    if self.bmp390_temp_counter >= self.bmp390_temp_cache_interval:
+                        self.cached_bmp390_temp = self.bmp390.temperature
+                        self.bmp390_temp_counter = 0
                 
-                self.bmp390_temp_counter += 1
-                if self.bmp390_temp_counter >= self.bmp390_temp_cache_interval:
-                    self.cached_bmp390_temp = self.bmp390.temperature
-                    self.bmp390_temp_counter = 0
+                self._adapt_interval(_POLL_PRESSURE, prev_hpa is not None and abs(pressure_hpa - prev_hpa) < 0.1)
                 
-                self.sensor_status['bmp390'] = True
-                self.sensor_last_success['bmp390'] = time.monotonic()
+                self._status_arr[SENSOR_BMP390] = True
+                self._last_success_arr[SENSOR_BMP390] = time.monotonic_ns() if now is None else now
                 return True
                 
             except Exception as e:
                 print(f"❌ BMP390 read error: {e}")
-                self.sensor_status['bmp390'] = False
-                self.pressure_hpa = None
-                self.altitude_m = None
-                self.cached_bmp390_temp = None
+                self._status_arr[SENSOR_BMP390] = False
+                self._invalidate_bmp390()
                 return False
         else:
-            self.sensor_status['bmp390'] = False
-            self.pressure_hpa = None
-            self.altitude_m = None
-            self.cached_bmp390_temp = None
+            self._status_arr[SENSOR_BMP390] = False
+            self._invalidate_bmp390()
             return False
 
-    def update_system_performance(self, loop_times=None):
-        current_time = time.monotonic()
+    def update_system_performance(self, loop_times=None, now=None):
+        current_ns = time.monotonic_ns() if now is None else now
         
-        if current_time - self.performance_update_time < self.PERFORMANCE_UPDATE_INTERVAL:
+        if current_ns - self.performance_update_time < self.PERFORMANCE_UPDATE_INTERVAL_NS:
             return False
         
         try:
@@ -1179,155 +1523,262 @@ class AIFieldSensorManager:
             self.cpu_temp = 25.0
         
         try:
-            gc.collect()
-            total_memory = gc.mem_alloc() + gc.mem_free()
+            free_memory = gc.mem_free()
             used_memory = gc.mem_alloc()
+            total_memory = free_memory + used_memory
             self.memory_usage = (used_memory / total_memory) * 100
+            # Only collect when the heap is getting tight, not on every refresh
+            if free_memory < total_memory // 5:
+                gc.collect()
         except:
             self.memory_usage = 50
         
         if loop_times:
-            self.loop_times = loop_times[-10:]
-            if self.loop_times:
-                self.avg_loop_time = sum(self.loop_times) / len(self.loop_times)
-                self.max_loop_time = max(self.loop_times)
-                self.cpu_usage = min(100, self.avg_loop_time * 2000)
+            # Caller-kept history: load its newest samples into the window
+            for i in range(max(0, len(loop_times) - self.LOOP_WINDOW), len(loop_times)):
+                self.record_loop_time(loop_times[i])
+        
+        if self._lt_count:
+            self.avg_loop_time = self._lt_sum / self._lt_count
+            self.max_loop_time = self._lt_max
+            self.cpu_usage = min(100, self.avg_loop_time * 2000)
         else:
             self.cpu_usage = 25
         
-        self.performance_update_time = current_time
+        self.performance_update_time = current_ns
         return True
 
-    def check_battery_status(self):
+    def record_loop_time(self, seconds):
+        """Add one main-loop duration to the rolling performance window."""
+        buf = self._lt_buf
+        idx = self._lt_idx
+        old = buf[idx] if self._lt_count == self.LOOP_WINDOW else 0.0
+        buf[idx] = seconds
+        seconds = buf[idx]  # stored precision
+        self._lt_sum += seconds - old
+        if self._lt_count < self.LOOP_WINDOW:
+            self._lt_count += 1
+        
+        if seconds >= self._lt_max:
+            self._lt_max = seconds
+        elif old == self._lt_max:
+            # Evicted the maximum - rescan the filled part of the window
+            self._lt_max = max(buf[i] for i in range(self._lt_count))
+        
+        idx += 1
+        if idx == self.LOOP_WINDOW:
+            idx = 0
+            # Re-sum once per lap so float rounding cannot accumulate
+            self._lt_sum = sum(buf[i] for i in range(self._lt_count))
+        self._lt_idx = idx
+
+    def check_battery_status(self, now=None):
         if self.battery_low_pin is None:
-            self.sensor_status['battery'] = False
+            self._status_arr[SENSOR_BATTERY] = False
             return None
         
-        current_time = time.monotonic()
+        current_ns = time.monotonic_ns() if now is None else now
         
-        if current_time - self.battery_check_time < self.BATTERY_CHECK_INTERVAL:
+        if current_ns - self.battery_check_time < self.BATTERY_CHECK_INTERVAL_NS:
             return self.battery_low
         
         try:
             self.battery_low = not self.battery_low_pin.value
-            self.battery_check_time = current_time
+            self.battery_check_time = current_ns
             
-            self.sensor_status['battery'] = True
-            self.sensor_last_success['battery'] = current_time
+            self._status_arr[SENSOR_BATTERY] = True
+            self._last_success_arr[SENSOR_BATTERY] = current_ns
             return self.battery_low
             
         except Exception as e:
             print(f"❌ Battery monitoring error: {e}")
-            self.sensor_status['battery'] = False
+            self._status_arr[SENSOR_BATTERY] = False
             self.battery_low = None
             return None
 
-    def check_sensor_timeouts(self):
-        current_time = time.monotonic()
-        
-        for sensor_name, last_success in self.sensor_last_success.items():
-            if last_success > 0:
-                time_since_success = current_time - last_success
+    def check_sensor_timeouts(self, now=None):
+        current_ns = time.monotonic_ns() if now is None else now
+        timeout_ns = self.SENSOR_TIMEOUT * NS_PER_SEC
+        cutoffs = [current_ns - timeout_ns] * len(SENSOR_NAMES)
+        # An adaptively slowed sensor gets two of its poll gaps, so a steady
+        # sensor is never timed out between two scheduled reads. The gap runs at
+        # least to now, so a sensor still queued behind the others after its
+        # multiplier was reset keeps the longer gap it was last polled at
+        intervals = self._active_intervals
+        mult = self._poll_mult
+        last = self._active_last
+        for i, slot in enumerate(self._POLL_SLOTS):
+            interval = intervals[i]
+            if interval > 0:
+                gap_ns = 2 * max(interval * mult[i], current_ns - last[i])
+                if gap_ns > timeout_ns:
+                    cutoffs[slot] = current_ns - gap_ns
+        
+        # Single sweep: an online sensor whose last success is older than its
+        # cutoff goes offline; sensors already offline were cleared before
+        status_arr = self._status_arr
+        invalidators = self._INVALIDATORS
+        for i, last_success in enumerate(self._last_success_arr):
+            if status_arr[i] and 0 < last_success < cutoffs[i]:
+                status_arr[i] = False
                 
-                if time_since_success > self.SENSOR_TIMEOUT:
-                    self.sensor_status[sensor_name] = False
-                    
-                    if sensor_name == 'scd41':
-                        self.co2 = None
-                        self.temperature = None
-                        self.humidity = None
-                        self.voc = None
-                    elif sensor_name == 'tsl2591':
-                        self.lux = None
-                    elif sensor_name == 'bmp390':
-                        self.pressure_hpa = None
-                        self.altitude_m = None
-                        self.cached_bmp390_temp = None
+                invalidate = invalidators[i]
+                if invalidate:
+                    invalidate()
 
     def get_sensor_health_summary(self):
-        online_sensors = sum(1 for status in self.sensor_status.values() if status)
-        total_sensors = len(self.sensor_status)
-        
-        failed_sensors = [name.upper() for name, status in self.sensor_status.items() if not status]
-        
-        return {
-            'online_count': online_sensors,
-            'total_count': total_sensors,
-            'health_percentage': (online_sensors / total_sensors) * 100,
-            'failed_sensors': failed_sensors,
-            'all_healthy': len(failed_sensors) == 0,
-            'critical_failure': 'scd41' in [s.lower() for s in failed_sensors] or 'i2c_bus' in [s.lower() for s in failed_sensors]
-        }
+        status_arr = self._status_arr
+        # Rebuild only when a health slot has changed since the last call
+        if self._health_summary is not None and status_arr == self._health_key:
+            return self._health_summary
+        
+        total_sensors = len(status_arr)
+        online_sensors = sum(status_arr)
+        failed_sensors = tuple(_SENSOR_NAMES_UPPER[i] for i in range(total_sensors) if not status_arr[i])
+        
+        self._health_key = status_arr[:]
+        self._health_summary = HealthSummary(
+            online_sensors,
+            total_sensors,
+            online_sensors * 100 // total_sensors,  # whole percent, integer-only
+            failed_sensors,
+            not failed_sensors,
+            not status_arr[SENSOR_SCD41] or not status_arr[SENSOR_I2C_BUS]
+        )
+        return self._health_summary
 
     def set_sea_level_pressure(self, pressure_hpa):
         if self.bmp390:
             self.bmp390.sea_level_pressure = pressure_hpa
             print(f"📊 Sea level pressure set to {pressure_hpa:.1f} hPa")
 
-    def get_temperature_with_smart_failover(self):
-        bmp390_temp = self.cached_bmp390_temp
+    def _temperature_weights(self, bmp390_temp, scd41_temp):
+        """Fusion weights (BMP390, SCD41); a missing or out-of-range reading weighs 0."""
+        w_bmp = 0.65 if bmp390_temp is not None else 0.0
+        w_scd = 0.35 if (scd41_temp is not None and SCD41_TEMP_MIN <= scd41_temp <= SCD41_TEMP_MAX) else 0.0
+        return w_bmp, w_scd
+
+    def _fuse_temperature(self, bmp390_temp, scd41_temp, w_bmp, w_scd):
+        wsum = w_bmp + w_scd
+        if wsum:
+            weighted_temp = (w_bmp * (bmp390_temp or 0) + w_scd * (scd41_temp or 0)) / wsum
+            return weighted_temp, (TEMP_SRC_FUSED if w_bmp and w_scd else (TEMP_SRC_BMP390 if w_bmp else TEMP_SRC_SCD41))
+        if scd41_temp is not None:
+            print(_SCD41_RANGE_WARNING.format(scd41_temp))
+            return None, TEMP_SRC_SCD41_OUT_OF_RANGE
+        return None, TEMP_SRC_FAILED
+
+    def _compute_temp_state(self):
+        """Fused temperature state, recomputed only when a temperature reading changes."""
+        if self.bmp390 is None and self.scd41 is None:
+            # Degraded/boot path: nothing to fuse, and the SCD41 field still
+            # holds its placeholder default
+            return _NO_TEMP_STATE
+        
+        bmp_ci = self._bmp_temp_ci
         scd41_temp = self.temperature
+        state = self._temp_state
+        if state is not None and bmp_ci == self._temp_key_bmp and scd41_temp == self._temp_key_scd:
+            return state
         
-        scd41_in_range = (scd41_temp is not None and -10 <= scd41_temp <= 60)
-        
-        if (bmp390_temp is not None and scd41_temp is not None and scd41_in_range):
-            weighted_temp = (bmp390_temp * 0.65 + scd41_temp * 0.35)
-            return weighted_temp, "FUSED"
-        elif bmp390_temp is not None:
-            return bmp390_temp, "BMP390"
-        elif scd41_temp is not None and scd41_in_range:
-            return scd41_temp, "SCD41"
-        elif scd41_temp is not None and not scd41_in_range:
-            print(f"⚠️ SCD41 temperature {scd41_temp:.1f}°C outside range")
-            return None, "SCD41_OUT_OF_RANGE"
-        else:
-            return None, "FAILED"
-
-    def get_temperature_sensor_status(self):
         bmp390_temp = self.cached_bmp390_temp
-        scd41_temp = self.temperature
+        w_bmp, w_scd = self._temperature_weights(bmp390_temp, scd41_temp)
+        temp_value, temp_source = self._fuse_temperature(bmp390_temp, scd41_temp, w_bmp, w_scd)
         
-        status = {
-            'bmp390_available': bmp390_temp is not None,
-            'bmp390_temp': bmp390_temp,
-            'scd41_available': scd41_temp is not None,
-            'scd41_temp': scd41_temp,
-            'scd41_in_range': (scd41_temp is not None and -10 <= scd41_temp <= 60),
-            'active_sensors': 0,
-            'primary_sensor': None,
-            'temperature_source': None
+        state = TempState(temp_value, temp_source, bmp390_temp, scd41_temp,
+                          w_scd > 0, (w_bmp > 0) + (w_scd > 0))
+        self._temp_state = state
+        self._temp_key_bmp = bmp_ci
+        self._temp_key_scd = scd41_temp
+        return state
+
+    def get_temperature_with_smart_failover(self):
+        """(temperature, TEMP_SRC_* code); TEMP_SOURCE_NAMES maps the code for display."""
+        state = self._compute_temp_state()
+        return state.smart_temp, state.source
+
+    def get_temperature_sensor_status(self):
+        state = self._compute_temp_state()
+        source = TEMP_SOURCE_NAMES[state.source]
+        return {
+            'bmp390_available': state.bmp390_temp is not None,
+            'bmp390_temp': state.bmp390_temp,
+            'scd41_available': state.scd41_temp is not None,
+            'scd41_temp': state.scd41_temp,
+            'scd41_in_range': state.scd41_in_range,
+            'active_sensors': state.active_sensors,
+            'primary_sensor': source,
+            'temperature_source': source,
+            'final_temperature': state.smart_temp
         }
+
+    def _retry_failed(self, slot, now, reinit):
+        """Whether a failed sensor may be polled now, re-initializing it when its back-off expires."""
+        due = self._reinit_due[slot]
+        if due == 0:
+            # Just failed: poll it again at its base rate, since most faults are a
+            # single bad transfer, and re-initialize only if it is still failing
+            self._reinit_backoff[slot] = self.REINIT_BACKOFF_MIN_NS
+            self._reinit_due[slot] = now + self.REINIT_BACKOFF_MIN_NS
+            return True
         
-        if status['bmp390_available']:
-            status['active_sensors'] += 1
-        if status['scd41_available'] and status['scd41_in_range']:
-            status['active_sensors'] += 1
-        
-        temp_value, temp_source = self.get_temperature_with_smart_failover()
-        status['primary_sensor'] = temp_source
-        status['temperature_source'] = temp_source
-        status['final_temperature'] = temp_value
+        if now < due:
+            return False
         
-        return status
+        backoff = min(self._reinit_backoff[slot] * 2, self.REINIT_BACKOFF_MAX_NS)
+        self._reinit_backoff[slot] = backoff
+        self._reinit_due[slot] = now + backoff
+        if reinit is None:
+            return True
+        if not reinit():
+            return False
+        # A fresh driver gets a full SENSOR_TIMEOUT to deliver (the SCD41 needs
+        # ~5 s before its first measurement) before the timeout check fails it
+        self._last_success_arr[slot] = now
+        return True
+
+    def _poll_with_backoff(self, slot, now, poll, reinit=None):
+        status_arr = self._status_arr
+        if not status_arr[slot] and not self._retry_failed(slot, now, reinit):
+            return False
+        last_success = self._last_success_arr
+        before = last_success[slot]
+        poll(now)
+        # Only a real read ends the back-off; a re-initialized sensor that has not
+        # delivered yet keeps escalating if it fails again
+        if status_arr[slot] and last_success[slot] != before:
+            self._reinit_due[slot] = 0
+        return True
 
     def update_all_sensors(self, loop_times=None):
-        self.update_radiation_detection()
-        self.update_gps_and_location()
-        
-        config = self.location_polling_config[self.current_location]
-        
-        if self._should_update_sensor("air", config["air"]):
-            self.update_air_quality()
-        
-        if self._should_update_sensor("light", config["light"]):
-            self.update_light_sensor()
-        
-        if self._should_update_sensor("pressure", config["pressure"]):
-            self.update_pressure_sensor()
-        
-        self.update_system_performance(loop_times)
-        self.check_battery_status()
-        self.check_sensor_timeouts()
+        # One clock read per tick, shared by every update below
+        now = time.monotonic_ns()
+        
+        self.update_radiation_detection(now)
+        self.update_gps_and_location(now)
+        
+        last = self._active_last
+        mult = self._poll_mult
+        updaters = self._UPDATERS
+        slots = self._POLL_SLOTS
+        reinits = self._REINITS
+        for i, interval in enumerate(self._active_intervals):
+            # An interval of 0 disables that sensor at this location
+            if interval > 0 and now - last[i] >= interval * mult[i]:
+                if self._poll_with_backoff(slots[i], now, updaters[i], reinits[i]):
+                    last[i] = now
+                    if not self._status_arr[slots[i]]:
+                        mult[i] = 1  # retry a failed sensor at its base rate
+                    # At most one polled sensor per tick, on top of the GPS
+                    # I2C read above; any other due sensor goes next tick
+                    break
+        
+        self.update_system_performance(loop_times, now)
+        self._poll_with_backoff(SENSOR_BATTERY, now, self.check_battery_status)
+        self.check_sensor_timeouts(now)
+        
+        if self._pending_chirps:
+            self._drain_chirps()
         
         return True
 
@@ -1347,137 +1798,178 @@ class AIFieldSensorManager:
             return "THREAT"
 
     def get_all_sensor_data(self):
-        location_info = self.gps_location_detector.get_location_info()
-        bmp390_temp = self.cached_bmp390_temp if self.bmp390 else None
+        """
+        Returns the current readings as a dict. The same dict is refreshed in
+        place on every call - copy it if it has to outlive the next call.
+        """
+        location_info = self._cached_location_info
+        if location_info is None:
+            self._sync_location_info()
+            location_info = self._cached_location_info
+        snap = self._snapshot
+        
+        snap['co2'] = self.co2
+        snap['voc'] = self.voc
+        snap['temperature'] = self.temperature
+        snap['humidity'] = self.humidity
+        snap['lux'] = self.lux
+        snap['pressure_hpa'] = self.pressure_hpa
+        snap['altitude_m'] = self.altitude_m
+        snap['cpm'] = self.cpm
+        snap['usv_h'] = self.usv_h
+        snap['radiation_ready'] = self.is_radiation_ready()
+        snap['battery_low'] = self.battery_low
+        snap['cpu_usage'] = self.cpu_usage
+        snap['memory_usage'] = self.memory_usage
+        snap['cpu_temp'] = self.cpu_temp
+        snap['avg_loop_time'] = self.avg_loop_time
+        snap['max_loop_time'] = self.max_loop_time
+        snap['bmp390_temperature'] = self.cached_bmp390_temp if self.bmp390 else None
+        snap['sea_level_pressure'] = self.bmp390.sea_level_pressure if self.bmp390 else 1013.25
+        snap['current_location'] = location_info['location']
+        snap['location_confidence'] = location_info['confidence']
+        snap['location_description'] = location_info['description']
+        snap['gps_quality'] = self._cached_gps_quality
+        snap['battery_usage_estimate'] = self.battery_usage_estimate
         
         # GPS data with pressure fusion
-        gps_info = {}
-        if self.gps_data:
-            gps_info = {
-                'gps_latitude': self.gps_data.get('latitude'),
-                'gps_longitude': self.gps_data.get('longitude'),
-                'gps_altitude_m': self.gps_data.get('altitude_m'),
-                'gps_speed_knots': self.gps_data.get('speed_knots'),
-                'gps_course': self.gps_data.get('course'),
-                'gps_satellites': self.gps_data.get('satellites', 0),
-                'gps_satellites_tracked': self.gps_data.get('satellites_tracked', 0),
-                'gps_has_fix': self.gps_data.get('has_fix', False),
-                'gps_fix_quality': self.gps_data.get('fix_quality', '0'),
-                'gps_hdop': self.gps_data.get('hdop', 99.9),
-                'gps_confidence_level': self.gps_data.get('confidence_level', 0),
-                'gps_time': self.gps_data.get('gps_time'),
-                'gps_date': self.gps_data.get('date'),
-                'gps_debug_msg': self.gps_data.get('debug_msg', 'No GPS data'),
-                'gps_anti_spoofing_status': self._get_gps_threat_level(),
-                'gps_available': True,
-                'gps_pressure_fusion_active': self.gps_data.get('pressure_fusion_active', False),
-                'gps_fusion_threats': self.gps_data.get('fusion_threats', []),
-                'gps_altitude_comparison': getattr(self.gps, 'altitude_comparison', None)
-            }
+        gps_data = self.gps_data
+        if gps_data:
+            get = gps_data.get
+            snap['gps_latitude'] = get('latitude')
+            snap['gps_longitude'] = get('longitude')
+            snap['gps_altitude_m'] = get('altitude_m')
+            snap['gps_speed_knots'] = get('speed_knots')
+            snap['gps_course'] = get('course')
+            snap['gps_satellites'] = get('satellites', 0)
+            snap['gps_satellites_tracked'] = get('satellites_tracked', 0)
+            snap['gps_has_fix'] = get('has_fix', False)
+            snap['gps_fix_quality'] = get('fix_quality', '0')
+            snap['gps_hdop'] = get('hdop', 99.9)
+            snap['gps_confidence_level'] = get('confidence_level', 0)
+            snap['gps_time'] = get('gps_time')
+            snap['gps_date'] = get('date')
+            snap['gps_debug_msg'] = get('debug_msg', 'No GPS data')
+            snap['gps_anti_spoofing_status'] = self._get_gps_threat_level()
+            snap['gps_available'] = True
+            snap['gps_pressure_fusion_active'] = get('pressure_fusion_active', False)
+            snap['gps_fusion_threats'] = get('fusion_threats', [])
+            snap['gps_altitude_comparison'] = self.gps.altitude_comparison
+            self._snapshot_gps_live = True
         else:
-            gps_info = {
-                'gps_latitude': None,
-                'gps_longitude': None,
-                'gps_altitude_m': None,
-                'gps_speed_knots': None,
-                'gps_course': None,
-                'gps_satellites': location_info['gps_satellites'],
-                'gps_satellites_tracked': location_info['gps_satellites'],
-                'gps_has_fix': location_info['gps_fix'],
-                'gps_fix_quality': '0',
-                'gps_hdop': 99.9,
-                'gps_confidence_level': 0,
-                'gps_time': None,
-                'gps_date': None,
-                'gps_debug_msg': 'GPS hardware not available',
-                'gps_anti_spoofing_status': 'UNAVAILABLE',
-                'gps_available': False,
-                'gps_pressure_fusion_active': False,
-                'gps_fusion_threats': [],
-                'gps_altitude_comparison': None
-            }
-        
-        base_data = {
-            'co2': self.co2,
-            'voc': self.voc,
-            'temperature': self.temperature,
-            'humidity': self.humidity,
-            'lux': self.lux,
-            'pressure_hpa': self.pressure_hpa,
-            'altitude_m': self.altitude_m,
-            'cpm': self.cpm,
-            'usv_h': self.usv_h,
-            'radiation_ready': self.is_radiation_ready(),
-            'battery_low': self.battery_low,
-            'cpu_usage': self.cpu_usage,
-            'memory_usage': self.memory_usage,
-            'cpu_temp': self.cpu_temp,
-            'avg_loop_time': self.avg_loop_time,
-            'max_loop_time': self.max_loop_time,
-            'bmp390_temperature': bmp390_temp,
-            'sea_level_pressure': self.bmp390.sea_level_pressure if self.bmp390 else 1013.25,
-            'current_location': location_info['location'],
-            'location_confidence': location_info['confidence'],
-            'location_description': f"{location_info['location']} ({location_info['confidence']}%)",
-            'gps_quality': self.gps_location_detector.get_gps_quality_description(),
-            'battery_usage_estimate': self.battery_usage_estimate,
-        }
-        
-        base_data.update(gps_info)
-        return base_data
+            if self._snapshot_gps_live is not False:
+                # Placeholder GPS fields only need writing when GPS drops out
+                snap['gps_latitude'] = None
+                snap['gps_longitude'] = None
+                snap['gps_altitude_m'] = None
+                snap['gps_speed_knots'] = None
+                snap['gps_course'] = None
+                snap['gps_fix_quality'] = '0'
+                snap['gps_hdop'] = 99.9
+                snap['gps_confidence_level'] = 0
+                snap['gps_time'] = None
+                snap['gps_date'] = None
+                snap['gps_debug_msg'] = 'GPS hardware not available'
+                snap['gps_anti_spoofing_status'] = 'UNAVAILABLE'
+                snap['gps_available'] = False
+                snap['gps_pressure_fusion_active'] = False
+                snap['gps_fusion_threats'] = []
+                snap['gps_altitude_comparison'] = None
+                self._snapshot_gps_live = False
+            snap['gps_satellites'] = location_info['gps_satellites']
+            snap['gps_satellites_tracked'] = location_info['gps_satellites']
+            snap['gps_has_fix'] = location_info['gps_fix']
+        
+        return snap
 
     def run_diagnostics(self):
-        print("\n🔧 FIXED GPS Anti-Spoofing System Diagnostics")
-        print("=" * 70)
+        if not _DEBUG:
+            return
+        # Headless field unit: nobody is reading the serial console
+        if supervisor is not None and not supervisor.runtime.serial_connected:
+            return
+        
+        # Collect the whole report and write it to the console once
+        lines = [_DIAG_HEADER]
+        add = lines.append
+        
+        # Attribute lookups hoisted to locals for the loops below
+        last_success_arr = self._last_success_arr
+        status_arr = self._status_arr
+        gps_data = self.gps_data
+        now = time.monotonic_ns()
         
         # Sensor health
-        print("\n📡 SENSOR HEALTH STATUS:")
-        for sensor_name, status in self.sensor_status.items():
-            icon = "✅" if status else "❌"
-            last_success = self.sensor_last_success.get(sensor_name, 0)
-            if last_success > 0:
-                time_since = time.monotonic() - last_success
-                time_str = f"({time_since:.0f}s ago)" if not status else "(Active)"
+        for i, status in enumerate(status_arr):
+            prefix = _HEALTH_PREFIXES[i][status]
+            
+            # Online is the common case and needs no elapsed-time formatting
+            last_success = last_success_arr[i]
+            if status:
+                time_str = "(Active)" if last_success else "(Initialized)"
             else:
-                time_str = "(Never)" if not status else "(Initialized)"
+                time_str = f"({(now - last_success) / NS_PER_SEC:.0f}s ago)" if last_success else "(Never)"
             
-            print(f"  {icon} {sensor_name.upper()}: {'ONLINE' if status else 'OFFLINE'} {time_str}")
+            add(prefix + time_str)
         
         # GPS Anti-Spoofing Status with Pressure Fusion
-        print(f"\n🛡️ GPS ANTI-SPOOFING WITH PRESSURE FUSION:")
-        if self.gps_data:
-            confidence = self.gps_data.get('confidence_level', 0)
+        add(_DIAG_GPS_HEADER)
+        if gps_data:
+            confidence = gps_data.get('confidence_level', 0)
             threat_level = self._get_gps_threat_level()
-            fusion_active = self.gps_data.get('pressure_fusion_active', False)
+            fusion_active = gps_data.get('pressure_fusion_active', False)
             
-            print(f"  Status: {threat_level} ({confidence}% confidence)")
-            print(f"  Pressure Fusion: {'ACTIVE' if fusion_active else 'INACTIVE'}")
+            add(_DIAG_GPS_TEMPLATE.format(
+                threat=threat_level, conf=confidence,
+                fusion='ACTIVE' if fusion_active else 'INACTIVE'))
             
-            if hasattr(self.gps, 'altitude_comparison') and self.gps.altitude_comparison:
-                alt_comp = self.gps.altitude_comparison
-                if alt_comp['fusion_active']:
-                    gps_alt = alt_comp['gps_altitude']
-                    pressure_alt = alt_comp['pressure_altitude']
-                    diff = alt_comp['difference']
-                    
-                    print(f"  GPS Altitude: {gps_alt:.1f}m")
-                    print(f"  Pressure Altitude: {pressure_alt:.1f}m")
-                    print(f"  Difference: {diff:.1f}m")
-                    
-                    if diff > 1000:
-                        print(f"  ⚠️ MAJOR ALTITUDE SPOOFING DETECTED!")
-                    elif diff > 500:
-                        print(f"  ⚠️ MODERATE altitude spoofing detected")
-                    elif diff > 200:
-                        print(f"  ⚠️ Minor altitude spoofing detected")
-                    elif diff > 100:
-                        print(f"  ⚠️ Suspicious altitude difference")
-                    else:
-                        print(f"  ✅ Altitude correlation good")
+            # gps_data is only ever set from a GPSParser, which always has altitude_comparison
+            alt_comp = self.gps.altitude_comparison
+            if alt_comp:
+                if alt_comp.fusion_active:
+                    diff = alt_comp.difference
+                    add(_DIAG_ALT_TEMPLATE.format(
+                        gps_alt=alt_comp.gps_altitude,
+                        pressure_alt=alt_comp.pressure_altitude,
+                        diff=diff))
+                    add(_ALT_MESSAGES[bisect_left(_ALT_THRESHOLDS, diff)])
         else:
-            print(f"  Status: GPS hardware not available")
-        
-        print("\n✅ FIXED GPS Anti-Spoofing diagnostics complete!")
+            add(_DIAG_NO_GPS)
+        
+        add(_DIAG_FOOTER)
+        print("\n".join(lines))
+
+# Altitude difference (m) -> diagnostics verdict; a diff must exceed a threshold to move up
+_ALT_THRESHOLDS = (100, 200, 500, 1000)
+_ALT_MESSAGES = (
+    "  ✅ Altitude correlation good",
+    "  ⚠️ Suspicious altitude difference",
+    "  ⚠️ Minor altitude spoofing detected",
+    "  ⚠️ MODERATE altitude spoofing detected",
+    "  ⚠️ MAJOR ALTITUDE SPOOFING DETECTED!",
+)
+
+# Static run_diagnostics text, built once at import
+_DIAG_HEADER = ("\n🔧 FIXED GPS Anti-Spoofing System Diagnostics\n" + "=" * 70 +
+                "\n\n📡 SENSOR HEALTH STATUS:")
+_DIAG_GPS_HEADER = "\n🛡️ GPS ANTI-SPOOFING WITH PRESSURE FUSION:"
+_DIAG_NO_GPS = "  Status: GPS hardware not available"
+_DIAG_FOOTER = "\n✅ FIXED GPS Anti-Spoofing diagnostics complete!"
+
+# run_diagnostics GPS report blocks, each filled with one format call
+_DIAG_GPS_TEMPLATE = "  Status: {threat} ({conf}% confidence)\n  Pressure Fusion: {fusion}"
+_DIAG_ALT_TEMPLATE = ("  GPS Altitude: {gps_alt:.1f}m\n"
+                      "  Pressure Altitude: {pressure_alt:.1f}m\n"
+                      "  Difference: {diff:.1f}m")
+
+# Constant segments of the test monitor report
+_MON_GPS_STATUS = "\n🛡️ GPS Status: "
+_MON_CONFIDENCE = "   Confidence: "
+_MON_FUSION = "   Pressure Fusion: "
+_MON_NO_GPS = "\n📡 GPS: Hardware not available"
+_MON_LOCATION = "   Location: "
+_MON_CO2 = "   CO2: "
+_MON_RULE = "-" * 50
 
 # Test function
 def main():
@@ -1490,43 +1982,64 @@ def main():
     
     print("Starting FIXED GPS Anti-Spoofing monitoring...")
     
+    update = sensors.update_all_sensors
+    fetch = sensors.get_all_sensor_data
+    
+    # Fixed 2 s cadence: work time comes out of the sleep instead of adding to it
+    interval = 2.0
+    next_deadline = time.monotonic() + interval
+    
     while True:
         try:
-            sensors.update_all_sensors()
-            data = sensors.get_all_sensor_data()
+            update()
+            data = fetch()
+            get = data.get
             
-            if data['gps_available']:
-                print(f"\n🛡️ GPS Status: {data['gps_anti_spoofing_status']}")
-                print(f"   Confidence: {data['gps_confidence_level']}%")
-                print(f"   Pressure Fusion: {'ACTIVE' if data['gps_pressure_fusion_active'] else 'INACTIVE'}")
+            if _DEBUG:
+                lines = []
+                add = lines.append
+                if get('gps_available'):
+                    add(_MON_GPS_STATUS + str(get('gps_anti_spoofing_status')))
+                    add(f"{_MON_CONFIDENCE}{get('gps_confidence_level')}%")
+                    add(_MON_FUSION + ('ACTIVE' if get('gps_pressure_fusion_active') else 'INACTIVE'))
                 
-                alt_comp = data.get('gps_altitude_comparison')
-                if alt_comp and alt_comp['fusion_active']:
-                    diff = alt_comp['difference']
-                    gps_alt = alt_comp['gps_altitude']
-                    pressure_alt = alt_comp['pressure_altitude']
+                    alt_comp = get('gps_altitude_comparison')
+                    if alt_comp and alt_comp.fusion_active:
+                        diff = alt_comp.difference
+                        gps_alt = alt_comp.gps_altitude
+                        pressure_alt = alt_comp.pressure_altitude
                     
-                    # Handle None values safely
-                    if gps_alt is not None and pressure_alt is not None and diff is not None:
-                        print(f"   Altitude: GPS {gps_alt:.0f}m vs Pressure {pressure_alt:.0f}m ({diff:.0f}m diff)")
-                    else:
-                        print(f"   Altitude: GPS data incomplete")
+                        # Handle None values safely
+                        if gps_alt is not None and pressure_alt is not None and diff is not None:
+                            add(f"   Altitude: GPS {gps_alt:.0f}m vs Pressure {pressure_alt:.0f}m ({diff:.0f}m diff)")
+                        else:
+                            add("   Altitude: GPS data incomplete")
                 
-                print(f"   Time: {data['gps_time']} Sats: {data['gps_satellites']}")
-            else:
-                print(f"\n📡 GPS: Hardware not available")
+                    add(f"   Time: {get('gps_time')} Sats: {get('gps_satellites')}")
+                else:
+                    add(_MON_NO_GPS)
             
-            print(f"   Location: {data['current_location']}")
-            print(f"   CO2: {data['co2']} ppm")
-            print("-" * 50)
+                add(_MON_LOCATION + str(get('current_location')))
+                add(f"{_MON_CO2}{get('co2')} ppm")
+                add(_MON_RULE)
+                add("")
+                sys.stdout.write("\n".join(lines))
             
-            time.sleep(2)
+            now = time.monotonic()
+            sleep_for = next_deadline - now
+            next_deadline += interval
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            elif now >= next_deadline:
+                # Overran by more than a full interval - realign instead of bursting
+                next_deadline = now + interval
         except KeyboardInterrupt:
             print("\n🛑 Monitoring stopped")
             break
         except Exception as e:
             print(f"❌ Error: {e}")
             time.sleep(1)
+            next_deadline = time.monotonic() + interval
 
 if __name__ == "__main__":
     main()
@@ -16,54 +16,473 @@ Usage:
 
 import time
 import math
+import array
 import gc
 
+# Recent-reading ring: one packed array per field, indexed by these slots
+_RING_FIELDS = ('pressure', 'temperature', 'humidity', 'lux', 'co2')
+_F_PRESSURE, _F_TEMPERATURE, _F_HUMIDITY, _F_LUX, _F_CO2 = range(len(_RING_FIELDS))
+_RING_TYPECODE = 'f'  # single precision, the same width as a CircuitPython float
+# Bytes per ring slot: the field values and a double timestamp (outdoor flags are bits)
+_RING_SLOT_BYTES = 4 * len(_RING_FIELDS) + 8
+# Fields copied from the sensor manager snapshot, with their fallback values
+# (add_sensor_reading_from_manager reads the snapshot with the same fallbacks)
+_WEATHER_DEFAULTS = (
+    ('pressure_hpa', 1013.25), ('temperature', 20.0), ('humidity', 50.0), ('lux', 1000),
+    ('co2', 400), ('cpm', 0), ('current_location', 'OUTDOOR'), ('location_confidence', 50),
+    ('gps_satellites', 0), ('cpu_temp', 25.0), ('memory_usage', 50.0),
+    # NEW: Additional sensor data if available
+    ('wind_speed', 0), ('wind_direction', 0), ('uv_index', 0), ('altitude', 0),
+)
+# Trend slots: each timeframe's group runs pressure, temp, humidity, light, co2
+_TREND_NAMES = (
+    'pressure_1h', 'temp_1h', 'humidity_1h', 'light_1h', 'co2_1h',
+    'pressure_3h', 'temp_3h', 'humidity_3h', 'light_3h', 'co2_3h',
+    'pressure_24h', 'temp_24h', 'humidity_24h', 'light_24h', 'co2_24h',
+)
+(_T_PRESSURE_1H, _T_TEMP_1H, _T_HUMIDITY_1H, _T_LIGHT_1H, _T_CO2_1H,
+ _T_PRESSURE_3H, _T_TEMP_3H, _T_HUMIDITY_3H, _T_LIGHT_3H, _T_CO2_3H,
+ _T_PRESSURE_24H, _T_TEMP_24H, _T_HUMIDITY_24H, _T_LIGHT_24H, _T_CO2_24H) = range(len(_TREND_NAMES))
+# Factor score tables, indexed by how many of a cascade's thresholds the input
+# crosses (a sum of comparisons) so the kernels need no if/elif ladder
+_PRESSURE_1H_SCORES = (0, 25, 50, 75, 90)      # 1h trend below -0.5/-1/-2/-3 hPa/h
+_PRESSURE_3H_SCORES = (0, 10, 20)              # 3h trend below -1/-2 hPa/h
+_LOW_PRESSURE_SCORES = (0, 15, 30)             # pressure below 1010/1005 hPa
+_DAYLIGHT_SCORES = (0, 20, 40, 70)             # daytime lux below 20000/10000/3000
+_DARKENING_SCORES = (0, 15, 30)                # 1h light change below -0.3/-0.6
+_WIND_SCORES = (0, 15, 25)                     # wind speed above 10/15
+_PRESSURE_VOLATILITY_SCORES = (0, 20, 40, 60)  # pressure volatility above 1/2/3
+_LOW_STABILITY_SCORES = (0, 20, 40)            # stability score below 50/30
+# Storm intensity for probability deciles 6-9; below 60% it is probability - 10
+_STORM_INTENSITY = (65, 75, 85, 95)
+# Classification tiers, most severe first: probability >= 85, 70, 50, 30, then
+# anything lower; the tier index counts the thresholds the probability is under
+_STORM_TIERS = (
+    ("MAJOR_STORM", "MAJOR_WEATHER_EVENT"),
+    ("STORM_LIKELY", "APPROACHING_STORM"),
+    ("WEATHER_CHANGE", "SIGNIFICANT_WEATHER_CHANGE"),
+    ("WEATHER_CHANGE", "MINOR_WEATHER_CHANGE"),
+    ("STABLE", "STABLE_CONDITIONS"),
+)
+# Sensor manager status codes carried in a forecast's 'sensor_manager_status';
+# STATUS_TEXT[code] is the text to show for one
+(STATUS_DISCONNECTED, STATUS_CONNECTED_OUTDOOR, STATUS_CONNECTED_INDOOR,
+ STATUS_CONNECTED_ERROR, STATUS_CONNECTED_VEHICLE, STATUS_CONNECTED_CAVE,
+ STATUS_CONNECTED_UNKNOWN) = range(7)
+STATUS_TEXT = ("DISCONNECTED", "CONNECTED_OUTDOOR", "CONNECTED_INDOOR",
+               "CONNECTED_ERROR", "CONNECTED_VEHICLE", "CONNECTED_CAVE",
+               "CONNECTED_UNKNOWN")
+# Status code per location the sensor manager reports (its LOCATION_NAMES)
+_LOCATION_STATUS = {
+    'OUTDOOR': STATUS_CONNECTED_OUTDOOR,
+    'INDOOR': STATUS_CONNECTED_INDOOR,
+    'VEHICLE': STATUS_CONNECTED_VEHICLE,
+    'CAVE': STATUS_CONNECTED_CAVE,
+}
+# Historical accuracy averages the newest this many logged predictions
+_ACCURACY_WINDOW = 10
+# Method labels and fixed status text carried in every forecast
+_METHOD_FUSION = 'ENHANCED_MULTI_TIMEFRAME_FUSION'
+_PREDICTION_METHOD = 'MULTI_TIMEFRAME_FUSION'
+_PREDICTION_LATENCY = 'Real-time'
+# PICO2 has approximately 520KB RAM total
+_PICO2_TOTAL_RAM = 520 * 1024
+_PICO2_RAM_INV = 1.0 / _PICO2_TOTAL_RAM
+# Storm arrival windows, nearest first; index 0 is below the 30% probability floor
+_TIMING_LABELS = ("No storm expected", "30-90 minutes", "1-3 hours", "2-6 hours",
+                  "4-12 hours", "6-24 hours")
+# Timing rules, nearest window first: (|1h pressure trend|, |3h pressure trend|,
+# pressure volatility) limits, any one of which exceeded selects the label.
+# Unused limits are infinite so every rule compares the same float types.
+_NO_LIMIT = float('inf')
+_TIMING_RULES = (
+    (3.0, _NO_LIMIT, 3.0, _TIMING_LABELS[1]),
+    (2.0, _NO_LIMIT, 2.0, _TIMING_LABELS[2]),
+    (1.0, 1.5, _NO_LIMIT, _TIMING_LABELS[3]),
+    (_NO_LIMIT, 1.0, _NO_LIMIT, _TIMING_LABELS[4]),
+)
+# Volatility covers the newest 60 outdoor readings of these fields
+_VOL_FIELDS = (_F_PRESSURE, _F_TEMPERATURE, _F_HUMIDITY)
+_VOL_WINDOW = 60
+# Weather-side garbage collection: at most once per interval, and only below
+# this fraction of free heap (gc.mem_free/mem_alloc exist only on the device)
+_GC_MIN_INTERVAL = 300
+_GC_LOW_WATER_DIVISOR = 5
+
+# JIT for the numeric kernels: numba on desktop CPython, otherwise plain bytecode.
+# MicroPython's @micropython.native is a compile-time decorator that cannot be
+# imported by name, so on the Pico these run as ordinary functions.
+try:
+    from numba import njit
+    native = njit(cache=True)
+except ImportError:
+    def native(func):
+        return func
+
+# Whole-window reductions for desktop hosts; the Pico runs the plain loops
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _location_status(location):
+    """Status code of a connected sensor manager reporting the given location."""
+    return _LOCATION_STATUS.get(location, STATUS_CONNECTED_UNKNOWN)
+
+
+@native
+def _shifted_sums(values, seqs, start, stop, shift):
+    """(sum, sum of squares) of values minus shift over the ring slots of the
+    sequence numbers held at positions start..stop-1 of the seqs ring."""
+    n = len(values)
+    s1 = 0.0
+    s2 = 0.0
+    for j in range(start, stop):
+        d = values[seqs[j % n] % n] - shift
+        s1 += d
+        s2 += d * d
+    return s1, s2
+
+
+@native
+def _pressure_score(p1, p3, pressure):
+    """Storm score from the 1h/3h pressure trends and the absolute pressure."""
+    # Short-term pressure changes (1h) - Most critical: slow, moderate, rapid, severe drop
+    score = _PRESSURE_1H_SCORES[(p1 < -0.5) + (p1 < -1.0) + (p1 < -2.0) + (p1 < -3.0)]
+    
+    # Medium-term pressure changes (3h) - Confirmation: moderate, sustained drop
+    score += _PRESSURE_3H_SCORES[(p3 < -1.0) + (p3 < -2.0)]
+    
+    # Absolute pressure consideration: low, very low pressure
+    score += _LOW_PRESSURE_SCORES[(pressure < 1010) + (pressure < 1005)]
+    
+    return score if score < 100 else 100
+
+
+@native
+def _instability_score(temp_1h, humid_1h, temp_3h, temperature, humidity):
+    """Storm score from front signatures, convection potential and 3h temperature change."""
+    score = 0
+    
+    # Cold front detection
+    if temp_1h < -2.0 and humid_1h > 10.0:
+        score += 80  # Strong cold front
+    elif temp_1h < -1.0 and humid_1h > 5.0:
+        score += 60  # Moderate cold front
+    
+    # Warm front detection
+    elif temp_1h > 2.0 and humid_1h > 15.0:
+        score += 70  # Strong warm front
+    elif temp_1h > 1.0 and humid_1h > 10.0:
+        score += 50  # Moderate warm front
+    
+    # Convective instability
+    if temperature > 25 and humidity > 80:
+        score += 40  # High convection potential
+    elif temperature > 20 and humidity > 85:
+        score += 30  # Moderate convection potential
+    
+    # Multi-timeframe temperature analysis
+    if abs(temp_3h) > 3.0:
+        score += 20  # Significant temperature change
+    
+    return score if score < 100 else 100
+
+
+@native
+def _environmental_score(hour, lux, light_1h, co2_1h, wind_speed):
+    """Storm score from daytime light and its trend, CO2 change and wind."""
+    score = 0
+    
+    # Light/cloud analysis
+    if 6 <= hour <= 18:
+        # Partly cloudy, cloudy, very dark during day
+        score += _DAYLIGHT_SCORES[(lux < 20000) + (lux < 10000) + (lux < 3000)]
+        
+        # Light change analysis: gradual, rapid darkening
+        score += _DARKENING_SCORES[(light_1h < -0.3) + (light_1h < -0.6)]
+    
+    # CO2 analysis (can indicate weather changes)
+    if abs(co2_1h) > 50:
+        score += 15  # Significant CO2 change
+    
+    # Wind analysis (if available): moderate, high wind speed
+    score += _WIND_SCORES[(wind_speed > 10) + (wind_speed > 15)]
+    
+    return score if score < 100 else 100
+
+
+@native
+def _fused_storm_probability(pressure, instability, environmental, patterns, volatility,
+                             month, hour, seasonal, diurnal):
+    """Weighted factor scores with the seasonal/diurnal adjustments, clamped to 0-100."""
+    # Multi-timeframe pressure 35%, atmospheric instability 25%, environmental
+    # conditions 20%, pattern recognition 10%, volatility and stability 10%
+    storm_score = (pressure * 0.35 + instability * 0.25 + environmental * 0.20 +
+                   patterns * 0.10 + volatility * 0.10)
+    
+    # Seasonal adjustment: summer storms most, spring/fall moderate, winter least
+    if seasonal:
+        if 6 <= month <= 8:
+            storm_score = storm_score * 1.1
+        elif 3 <= month <= 5 or 9 <= month <= 11:
+            storm_score = storm_score * 1.05
+        else:
+            storm_score = storm_score * 0.9
+    
+    # Diurnal adjustment: afternoon/evening peak, quieter mornings
+    if diurnal:
+        if 14 <= hour <= 20:
+            storm_score = storm_score * 1.1
+        elif 6 <= hour <= 10:
+            storm_score = storm_score * 0.95
+        else:
+            storm_score = storm_score * 1.0
+    
+    return 0 if storm_score <= 0 else (storm_score if storm_score < 100 else 100)
+
+
+@native
+def _pattern_indicators(pressure_trends, volatilities, stabilities, head, k):
+    """Storm indicators over the k patterns before head in the parallel pattern
+    rings: falling pressure, high volatility and low stability count once each."""
+    n = len(pressure_trends)
+    count = 0
+    for j in range(head - k, head):
+        i = j % n
+        if pressure_trends[i] < -1.0:
+            count += 1
+        if volatilities[i] > 2.0:
+            count += 1
+        if stabilities[i] < 50:
+            count += 1
+    return count
+
+
+@native
+def _volatility_score(pressure_volatility, stability):
+    """Storm score from pressure volatility and the stability score."""
+    # High volatility can indicate unstable conditions: low, moderate, high
+    score = _PRESSURE_VOLATILITY_SCORES[(pressure_volatility > 1.0) + (pressure_volatility > 2.0) +
+                                        (pressure_volatility > 3.0)]
+    
+    # Low stability indicates potential for weather changes: moderate, low stability
+    score += _LOW_STABILITY_SCORES[(stability < 50) + (stability < 30)]
+    
+    return score if score < 100 else 100
+
+
+@native
+def _confidence_score(outdoor_count, pressure_volatility, pattern_confidence, trend_1h, trend_3h):
+    """Prediction confidence from data quality, stability, the pattern factor and trend agreement."""
+    # Data quality factor
+    data_quality = outdoor_count * 2
+    if data_quality > 100:
+        data_quality = 100
+    
+    # Sensor stability factor
+    sensor_stability = 100 - pressure_volatility * 10
+    if sensor_stability > 100:
+        sensor_stability = 100
+    
+    # Multi-timeframe agreement
+    trends_1h = abs(trend_1h)
+    trends_3h = abs(trend_3h)
+    
+    if trends_1h > 0.1 and trends_3h > 0.1:
+        trend_agreement = 100 - abs(trends_1h - trends_3h) * 20
+    else:
+        trend_agreement = 50
+    
+    # Overall confidence
+    confidence = (data_quality * 0.3 + sensor_stability * 0.25 + 
+                 pattern_confidence * 0.2 + trend_agreement * 0.25)
+    
+    return 0 if confidence <= 0 else (confidence if confidence < 100 else 100)
+
+
+@native
+def _memory_bytes(fixed_bytes, hourly_count, daily_count):
+    """(hourly, daily, total) estimated bytes for the given summary counts."""
+    hourly_bytes = hourly_count * 80  # ~80 bytes per hourly summary
+    daily_bytes = daily_count * 60    # ~60 bytes per daily summary
+    return hourly_bytes, daily_bytes, fixed_bytes + hourly_bytes + daily_bytes
+
+
+class _History:
+    """
+    Fixed-capacity history that overwrites its oldest entry once full.
+    Stands in for deque(maxlen=...), whose CircuitPython port has no indexing.
+    """
+    
+    def __init__(self, maxlen):
+        self._items = [None] * maxlen
+        self._head = 0
+        self._count = 0
+    
+    def append(self, item):
+        self._items[self._head] = item
+        self._head = (self._head + 1) % len(self._items)
+        if self._count < len(self._items):
+            self._count += 1
+    
+    def __len__(self):
+        return self._count
+    
+    def __getitem__(self, index):
+        """Entry by position, oldest first; negative positions count from the newest."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("history index out of range")
+        return self._items[(self._head - self._count + index) % len(self._items)]
+
+
+class _HourlySummary:
+    """One hourly summary of the outdoor readings; fields are also readable by key."""
+    __slots__ = ('timestamp', 'avg_pressure', 'avg_temperature', 'avg_humidity', 'avg_lux',
+                 'avg_co2', 'min_pressure', 'max_pressure', 'reading_count')
+    
+    def __init__(self, timestamp, avg_pressure, avg_temperature, avg_humidity, avg_lux,
+                 avg_co2, min_pressure, max_pressure, reading_count):
+        self.timestamp = timestamp
+        self.avg_pressure = avg_pressure
+        self.avg_temperature = avg_temperature
+        self.avg_humidity = avg_humidity
+        self.avg_lux = avg_lux
+        self.avg_co2 = avg_co2
+        self.min_pressure = min_pressure
+        self.max_pressure = max_pressure
+        self.reading_count = reading_count
+    
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+
+# Static console text, joined once at import and written with a single print
+_INIT_BANNER = "\n".join((
+    "🌐 Enhanced Weather Manager initialized for PICO2",
+    "💾 Enhanced memory allocation: 3h recent + 24h hourly + 7d daily",
+    "🧠 Advanced pattern recognition and multi-timeframe analysis",
+    "📡 Ready to provide professional weather forecasting",
+))
+
+_DIAG_FOOTER_BLOCK = "\n".join((
+    "\n✅ Enhanced weather diagnostics complete!",
+    "🚀 PICO2 optimization: Active",
+    "💡 Advanced features: Enabled",
+))
+
+_MEMORY_COMPARISON_BLOCK = "\n".join((
+    "\n📊 ENHANCED MEMORY COMPARISON:",
+    "  Sensor Manager: ~50% system memory (your existing code)",
+    "  Enhanced Weather: ~1.5KB additional memory",
+    "  PICO2 RAM Usage: ~0.3% of total 520KB RAM",
+    "  Performance Impact: Negligible",
+))
+
+_ENHANCED_BENEFITS_BLOCK = "\n".join((
+    "\n🎯 ENHANCED BENEFITS:",
+    "  ✅ Multi-timeframe analysis (1h, 3h, 24h trends)",
+    "  ✅ Advanced pattern recognition with learning",
+    "  ✅ Volatility and stability metrics",
+    "  ✅ Enhanced storm classification and intensity",
+    "  ✅ 97%+ weather prediction accuracy",
+    "  ✅ Seasonal and diurnal adjustments",
+    "  ✅ Historical data summaries",
+    "  ✅ Real-time performance monitoring",
+    "  ✅ Memory-efficient sliding windows",
+    "  ✅ PICO2 optimized algorithms",
+))
+
+_CAPABILITIES_BLOCK = "\n".join((
+    "\n🌩️ ENHANCED WEATHER CAPABILITIES:",
+    "  🎯 Storm Prediction: 97-99% accuracy",
+    "  🕐 Timing Precision: ±15 min to 1 hour",
+    "  📊 Storm Intensity: 0-100% scale",
+    "  🔍 Storm Types: 8 detailed classifications",
+    "  📈 Multi-timeframe: 1h, 3h, 24h analysis",
+    "  🧠 Pattern Learning: 50 pattern memory",
+    "  📍 Location Awareness: Indoor/Outdoor detection",
+    "  ⚡ Real-time Updates: Every 60 seconds",
+    "  🔋 Power Efficient: Optimized for PICO2",
+    "  💾 Memory Efficient: <0.5% of PICO2 RAM",
+))
+
 class WeatherManager:
     """
     Enhanced weather prediction system optimized for PICO2 with double RAM.
     Expanded data storage, multi-timeframe analysis, and advanced algorithms.
     """
     
-    def __init__(self, sensor_manager=None):
+    def __init__(self, sensor_manager=None, fixed_location=None, verbose=False):
+        # Status and error messages go to the console (USB serial on the Pico) only when set
+        self.verbose = verbose
+        
         # Reference to external sensor manager
         self.sensor_manager = sensor_manager
+        # Its get_all_sensor_data, bound once so each fetch skips the method lookup
+        self._get_all_sensor_data = sensor_manager.get_all_sensor_data if sensor_manager else None
+        # 'OUTDOOR' or 'INDOOR' for a unit installed in one place; None follows the sensors
+        self.fixed_location = fixed_location
         
         # ENHANCED: Expanded memory footprint for better predictions
-        self.recent_readings = []       # Last 180 readings (3 hours @ 1min intervals)
-        self.hourly_summaries = []      # Last 24 hourly summaries (1 day)
-        self.daily_summaries = []       # Last 7 daily summaries (1 week)
-        
         self.max_recent_readings = 180  # 3 hours of data
         self.max_hourly_summaries = 24  # 24 hours of data
         self.max_daily_summaries = 7    # 7 days of data
-        
-        # ENHANCED: Multi-timeframe trend calculations
-        self.trends = {
-            # Short-term trends (1 hour)
-            'pressure_1h': 0.0,
-            'temp_1h': 0.0,
-            'humidity_1h': 0.0,
-            'light_1h': 0.0,
-            'co2_1h': 0.0,
-            
-            # Medium-term trends (3 hours)
-            'pressure_3h': 0.0,
-            'temp_3h': 0.0,
-            'humidity_3h': 0.0,
-            'light_3h': 0.0,
-            'co2_3h': 0.0,
-            
-            # Long-term trends (24 hours)
-            'pressure_24h': 0.0,
-            'temp_24h': 0.0,
-            'humidity_24h': 0.0,
-            'light_24h': 0.0,
-            'co2_24h': 0.0
-        }
+        self._storage_total_inv = 1.0 / (self.max_recent_readings + self.max_hourly_summaries +
+                                         self.max_daily_summaries)
+        
+        self.hourly_summaries = _History(self.max_hourly_summaries)  # Last 24 hourly summaries (1 day)
+        self.daily_summaries = _History(self.max_daily_summaries)    # Last 7 daily summaries (1 week)
+        
+        # Last 180 readings (3 hours @ 1min intervals) as a ring of preallocated
+        # per-field arrays (_F_* slots); the oldest slot is overwritten once full
+        n = self.max_recent_readings
+        self._ring = tuple(array.array(_RING_TYPECODE, [0.0] * n) for _ in _RING_FIELDS)
+        self._ring_time = array.array('d', [0.0] * n)
+        self._ring_outdoor = bytearray((n + 7) // 8)  # Outdoor-valid flag per slot, one bit each
+        # Zero-copy NumPy views of the field arrays where NumPy is available
+        self._ring_np = tuple(np.frombuffer(a, dtype=np.float32) for a in self._ring) if np else None
+        self._ring_seq = 0              # Readings ever written; the next slot is seq % n
+        self._ring_count = 0            # Readings held
+        self._ring_outdoor_count = 0    # Outdoor-valid readings held
+        self._last_outdoor_seq = -1     # Sequence number of the newest outdoor reading
+        
+        # Companion ring of the outdoor readings' sequence numbers, oldest first,
+        # so outdoor-only passes never scan indoor slots
+        self._outdoor_seqs = array.array('l', [0] * n)
+        self._outdoor_total = 0         # Outdoor readings ever written
+        
+        # Per-timeframe sequence number where the oldest-reading search resumes
+        self._span_start = {_T_PRESSURE_1H: 0, _T_PRESSURE_3H: 0}
+        # Per-timeframe (oldest sequence, 1 / its lux); 0.0 when the lux is too low to compare
+        self._oldest_lux_recip = {_T_PRESSURE_1H: (-1, 0.0), _T_PRESSURE_3H: (-1, 0.0)}
+        
+        # Running shifted sums over the volatility window (_VOL_FIELDS order);
+        # resynced from the ring once per window to shed accumulated rounding
+        self._vol_shift = [0.0] * len(_VOL_FIELDS)
+        self._vol_sum = [0.0] * len(_VOL_FIELDS)
+        self._vol_sum2 = [0.0] * len(_VOL_FIELDS)
+        self._vol_n = 0                 # Newest outdoor readings in the window
+        self._vol_adds = 0              # Additions since the last resync
+        
+        # ENHANCED: Multi-timeframe trend calculations (1h, 3h, 24h), indexed by
+        # the _T_* slots; trends_dict names them for callers
+        self.trends = array.array(_RING_TYPECODE, [0.0] * len(_TREND_NAMES))
         
         # ENHANCED: Advanced pattern recognition
-        self.pattern_history = []       # Store weather patterns for learning
         self.max_patterns = 50          # Store last 50 patterns
+        # Pattern history for learning, one packed column per feature; _ph_head is
+        # the next slot to overwrite and _ph_n the patterns held
+        self._ph_ptrend = array.array(_RING_TYPECODE, [0.0] * self.max_patterns)
+        self._ph_vol = array.array(_RING_TYPECODE, [0.0] * self.max_patterns)
+        self._ph_stab = array.array(_RING_TYPECODE, [0.0] * self.max_patterns)
+        self._ph_time = array.array('d', [0.0] * self.max_patterns)
+        self._ph_head = 0
+        self._ph_n = 0
+        self._pattern_confidence = 0    # 5 per stored pattern, saturating at 100
         
         # ENHANCED: Volatility and stability metrics
         self.volatility_metrics = {
@@ -79,66 +498,123 @@ class WeatherManager:
         self.storm_classification = "CLEAR"
         self.storm_intensity = 0        # NEW: Storm intensity (0-100)
         self.storm_type_detail = "NONE" # NEW: Detailed storm type
-        self.last_outdoor_reading = None
+        # Latest outdoor reading, one attribute per field (has_outdoor is False until the first)
+        self.has_outdoor = False
+        self.last_time = 0.0
+        self.last_timestamp = 0.0
+        self.last_pressure = 0.0
+        self.last_temperature = 0.0
+        self.last_humidity = 0.0
+        self.last_lux = 0
+        self.last_co2 = 0
+        self.last_cpm = 0
+        self.last_location = None
+        self.last_wind_speed = 0
+        self.last_wind_direction = 0
+        self.last_uv_index = 0
+        self.last_altitude = 0
+        self.last_cpu_temp = 0
+        self.last_memory_usage = 0
+        self._last_forecast = None      # get_enhanced_weather_forecast result for the latest reading
+        # Sensor manager status seen by the latest fetch, and its monotonic time
+        self._sensor_status = STATUS_DISCONNECTED
+        self._sensor_status_time = -1.0
+        
+        # Reused for every reading so collection does not allocate new dicts
+        self._weather_data = {}
+        self._conditions = {}           # _get_current_conditions result, refilled in place
+        self._performance = {}          # _get_system_performance result, refilled in place
+        self._forecast = {}             # get_enhanced_weather_forecast result, refilled in place
+        self._data_points = {}          # Its 'data_points' block
+        self._pressure_summary = {}     # Its 'atmospheric_pressure' block
+        self._memory_key = None         # (hourly, daily) summary counts of _memory_usage
+        self._memory_usage = None
         
         # ENHANCED: Seasonal and diurnal adjustments
         self.seasonal_adjustments = True
         self.diurnal_adjustments = True
         
+        # Fit the 1h/3h trends by least squares over the whole timeframe instead of
+        # from its two end readings; only honoured where NumPy is available
+        self.least_squares_trend = False
+        
+        # Local hour/month, refreshed at most once per wall-clock minute
+        self._lt_minute = -1
+        self._cur_hour = 0
+        self._cur_month = 1
+        
         # Interface tracking
         self.total_readings = 0
         self.outdoor_readings = 0
         self.last_update_time = 0
         self.update_interval = 60.0     # Update every 60 seconds for better resolution
+        self._last_gc = time.monotonic()
         
         # ENHANCED: Performance metrics
-        self.prediction_accuracy_log = []
         self.max_accuracy_log = 100
-        
-        print("🌐 Enhanced Weather Manager initialized for PICO2")
-        print("💾 Enhanced memory allocation: 3h recent + 24h hourly + 7d daily")
-        print("🧠 Advanced pattern recognition and multi-timeframe analysis")
-        print("📡 Ready to provide professional weather forecasting")
+        self.prediction_accuracy_log = _History(self.max_accuracy_log)
+        self._accuracy_sum = 0.0        # Sum of the newest _ACCURACY_WINDOW log entries
+        
+        # Preallocated structures for the memory estimate: the ring, the pattern
+        # columns, the packed trends and ~300 bytes of system overhead
+        self._fixed_memory = (self.max_recent_readings * _RING_SLOT_BYTES + len(self._ring_outdoor),
+                              self.max_patterns * 20,
+                              len(self.trends) * self.trends.itemsize,
+                              300)
+        self._fixed_memory_total = sum(self._fixed_memory)
+        
+        # A fixed install knows its location, so prediction skips the location guards
+        if fixed_location == 'OUTDOOR':
+            self.calculate_enhanced_storm_probability = self._calc_outdoor_only
+        elif fixed_location == 'INDOOR':
+            self.calculate_enhanced_storm_probability = self._return_indoor_mode
+        
+        if verbose:
+            print(_INIT_BANNER)
     
     def connect_sensor_manager(self, sensor_manager):
         """Connect to external sensor manager"""
         self.sensor_manager = sensor_manager
-        print("✅ Connected to AIFieldSensorManager")
+        self._get_all_sensor_data = sensor_manager.get_all_sensor_data if sensor_manager else None
+        if self.verbose:
+            print("✅ Connected to AIFieldSensorManager")
     
     def get_sensor_data_from_manager(self):
         """Get sensor data from AIFieldSensorManager with enhanced error handling"""
-        if not self.sensor_manager:
-            print("⚠️ No sensor manager connected")
+        sensor_data = self._fetch_sensor_data()
+        if sensor_data is None:
+            return None
+        
+        # ENHANCED: More comprehensive data extraction (into the reused dict)
+        weather_data = self._weather_data
+        get = sensor_data.get
+        for key, default in _WEATHER_DEFAULTS:
+            weather_data[key] = get(key, default)
+        if self.fixed_location:
+            weather_data['current_location'] = self.fixed_location
+        
+        return weather_data
+    
+    def _fetch_sensor_data(self):
+        """The sensor manager's own reading dict, or None; records the manager status."""
+        get_all_sensor_data = self._get_all_sensor_data
+        if get_all_sensor_data is None:
+            if self.verbose:
+                print("⚠️ No sensor manager connected")
             return None
         
         try:
-            sensor_data = self.sensor_manager.get_all_sensor_data()
-            
-            # ENHANCED: More comprehensive data extraction
-            weather_data = {
-                'pressure_hpa': sensor_data.get('pressure_hpa', 1013.25),
-                'temperature': sensor_data.get('temperature', 20.0),
-                'humidity': sensor_data.get('humidity', 50.0),
-                'lux': sensor_data.get('lux', 1000),
-                'co2': sensor_data.get('co2', 400),
-                'cpm': sensor_data.get('cpm', 0),
-                'current_location': sensor_data.get('current_location', 'OUTDOOR'),
-                'location_confidence': sensor_data.get('location_confidence', 50),
-                'gps_satellites': sensor_data.get('gps_satellites', 0),
-                'cpu_temp': sensor_data.get('cpu_temp', 25.0),
-                'memory_usage': sensor_data.get('memory_usage', 50.0),
-                # NEW: Additional sensor data if available
-                'wind_speed': sensor_data.get('wind_speed', 0),
-                'wind_direction': sensor_data.get('wind_direction', 0),
-                'uv_index': sensor_data.get('uv_index', 0),
-                'altitude': sensor_data.get('altitude', 0)
-            }
-            
-            return weather_data
-            
+            sensor_data = get_all_sensor_data()
         except Exception as e:
-            print(f"❌ Error getting data from sensor manager: {e}")
+            self._sensor_status = STATUS_CONNECTED_ERROR
+            self._sensor_status_time = time.monotonic()
+            if self.verbose:
+                print(f"❌ Error getting data from sensor manager: {e}")
             return None
+        
+        self._sensor_status = _location_status(sensor_data.get('current_location'))
+        self._sensor_status_time = time.monotonic()
+        return sensor_data
     
     def add_sensor_reading_from_manager(self):
         """Enhanced reading collection with multi-timeframe processing"""
@@ -148,46 +624,42 @@ class WeatherManager:
         if current_time - self.last_update_time < self.update_interval:
             return False
         
-        # Get data from sensor manager
-        sensor_data = self.get_sensor_data_from_manager()
+        # Get data from sensor manager; its dict is read directly, with the
+        # _WEATHER_DEFAULTS fallbacks, rather than copied first
+        sensor_data = self._fetch_sensor_data()
         if not sensor_data:
             return False
-        
-        # ENHANCED: Create comprehensive weather data point
-        reading = {
-            'time': current_time,
-            'timestamp': time.time(),  # UTC timestamp for seasonal calculations
-            'pressure': sensor_data['pressure_hpa'],
-            'temperature': sensor_data['temperature'],
-            'humidity': sensor_data['humidity'],
-            'lux': sensor_data['lux'],
-            'co2': sensor_data['co2'],
-            'cpm': sensor_data['cpm'],
-            'location': sensor_data['current_location'],
-            'outdoor_valid': sensor_data['current_location'] == 'OUTDOOR',
-            # NEW: Additional data
-            'wind_speed': sensor_data['wind_speed'],
-            'wind_direction': sensor_data['wind_direction'],
-            'uv_index': sensor_data['uv_index'],
-            'altitude': sensor_data['altitude'],
-            'cpu_temp': sensor_data['cpu_temp'],
-            'memory_usage': sensor_data['memory_usage']
-        }
+        get = sensor_data.get
+        values = (get('pressure_hpa', 1013.25), get('temperature', 20.0), get('humidity', 50.0),
+                  get('lux', 1000), get('co2', 400))
+        location = self.fixed_location or get('current_location', 'OUTDOOR')
         
         # ENHANCED: Memory-efficient sliding window with multiple timeframes
-        self.recent_readings.append(reading)
-        if len(self.recent_readings) > self.max_recent_readings:
-            self.recent_readings.pop(0)
+        outdoor_valid = self._ring_push(current_time, values, location)
         
         # Update counters
         self.total_readings += 1
-        if reading['outdoor_valid']:
+        if outdoor_valid:
             self.outdoor_readings += 1
-            self.last_outdoor_reading = reading
+            # ENHANCED: Full data point, kept only for the latest outdoor reading
+            self.last_time = current_time
+            self.last_timestamp = time.time()  # UTC timestamp for seasonal calculations
+            (self.last_pressure, self.last_temperature, self.last_humidity,
+             self.last_lux, self.last_co2) = values
+            self.last_cpm = get('cpm', 0)
+            self.last_location = location
+            # NEW: Additional data
+            self.last_wind_speed = get('wind_speed', 0)
+            self.last_wind_direction = get('wind_direction', 0)
+            self.last_uv_index = get('uv_index', 0)
+            self.last_altitude = get('altitude', 0)
+            self.last_cpu_temp = get('cpu_temp', 25.0)
+            self.last_memory_usage = get('memory_usage', 50.0)
+            self.has_outdoor = True
         
         # ENHANCED: Multi-timeframe trend analysis
-        if len(self.recent_readings) >= 5:
-            self._update_enhanced_trends()
+        if self._ring_count >= 5:
+            self._update_enhanced_trends(current_time)
         
         # ENHANCED: Pattern recognition
         self._update_pattern_recognition()
@@ -196,53 +668,234 @@ class WeatherManager:
         self._calculate_volatility_metrics()
         
         # ENHANCED: Periodic cleanup and summarization
-        self._maintain_data_structures()
+        self._maintain_data_structures(current_time)
         
         self.last_update_time = current_time
         return True
     
-    def _update_enhanced_trends(self):
-        """ENHANCED: Calculate trends across multiple timeframes"""
-        outdoor_readings = [r for r in self.recent_readings if r['outdoor_valid']]
+    def _is_outdoor(self, i):
+        """Whether ring slot i holds an outdoor-valid reading."""
+        return self._ring_outdoor[i >> 3] & (1 << (i & 7))
+    
+    def _ring_push(self, current_time, values, location):
+        """Write a reading (values in _RING_FIELDS order) into the ring; returns whether it is outdoor-valid."""
+        # A failed sensor reports None; such a reading never takes part in the analysis
+        outdoor_valid = location == 'OUTDOOR' and None not in values
+        
+        seq = self._ring_seq
+        i = seq % self.max_recent_readings
+        if self._ring_count == self.max_recent_readings:
+            # Evicting the oldest reading, which may still be in the volatility window
+            if self._is_outdoor(i):
+                if self._vol_n == self._ring_outdoor_count:
+                    self._vol_drop_tail()
+                self._ring_outdoor_count -= 1
+        else:
+            self._ring_count += 1
+        
+        self._ring_time[i] = current_time
+        if outdoor_valid:
+            ring = self._ring
+            ring[_F_PRESSURE][i] = values[_F_PRESSURE]
+            ring[_F_TEMPERATURE][i] = values[_F_TEMPERATURE]
+            ring[_F_HUMIDITY][i] = values[_F_HUMIDITY]
+            ring[_F_LUX][i] = values[_F_LUX]
+            ring[_F_CO2][i] = values[_F_CO2]
+            self._ring_outdoor[i >> 3] |= 1 << (i & 7)
+        else:
+            self._ring_outdoor[i >> 3] &= ~(1 << (i & 7))
+        self._ring_seq = seq + 1
+        if outdoor_valid:
+            self._outdoor_seqs[self._outdoor_total % self.max_recent_readings] = seq
+            self._outdoor_total += 1
+            self._ring_outdoor_count += 1
+            self._last_outdoor_seq = seq
+            self._vol_add(seq)
+        return outdoor_valid
+    
+    def _outdoor_bounds(self, window):
+        """
+        (start, stop) positions in _outdoor_seqs of the outdoor readings among the
+        newest `window`; slot of position j is _outdoor_seqs[j % n] % n.
+        """
+        n = self.max_recent_readings
+        seqs = self._outdoor_seqs
+        total = self._outdoor_total
+        first_seq = self._ring_seq - min(window, self._ring_count)
+        k = total
+        while k > total - self._ring_outdoor_count and seqs[(k - 1) % n] >= first_seq:
+            k -= 1
+        return k, total
+    
+    def _outdoor_slots(self, window):
+        """Ring slots of the outdoor readings among the newest `window`, oldest first."""
+        n = self.max_recent_readings
+        seqs = self._outdoor_seqs
+        start, stop = self._outdoor_bounds(window)
+        return [seqs[j % n] % n for j in range(start, stop)]
+    
+    def _vol_add(self, seq):
+        """Bring the outdoor reading at seq into the volatility window."""
+        self._vol_n += 1
+        if self._vol_n > _VOL_WINDOW:
+            self._vol_drop_tail()
+        
+        self._vol_adds += 1
+        if self._vol_adds >= _VOL_WINDOW:
+            self._vol_resync()
+            return
         
-        if len(outdoor_readings) < 2:
+        i = seq % self.max_recent_readings
+        ring = self._ring
+        shift = self._vol_shift
+        for k, field in enumerate(_VOL_FIELDS):
+            d = ring[field][i] - shift[k]
+            self._vol_sum[k] += d
+            self._vol_sum2[k] += d * d
+    
+    def _vol_drop_tail(self):
+        """Take the oldest reading out of the volatility window."""
+        n = self.max_recent_readings
+        i = self._outdoor_seqs[(self._outdoor_total - self._vol_n) % n] % n
+        ring = self._ring
+        shift = self._vol_shift
+        for k, field in enumerate(_VOL_FIELDS):
+            d = ring[field][i] - shift[k]
+            self._vol_sum[k] -= d
+            self._vol_sum2[k] -= d * d
+        self._vol_n -= 1
+    
+    def _vol_resync(self):
+        """Recompute the window sums exactly, shifted by the newest reading."""
+        self._vol_adds = 0
+        n = self.max_recent_readings
+        seqs = self._outdoor_seqs
+        total = self._outdoor_total
+        start = total - self._vol_n
+        newest = self._last_outdoor_seq % n
+        ring = self._ring
+        ring_np = self._ring_np
+        if ring_np:
+            slots = [seqs[j % n] % n for j in range(start, total)]
+        for k, field in enumerate(_VOL_FIELDS):
+            values = ring[field]
+            shift = values[newest]
+            self._vol_shift[k] = shift
+            if ring_np:
+                d = ring_np[field][slots] - np.float64(shift)
+                self._vol_sum[k] = float(d.sum())
+                self._vol_sum2[k] = float(d.dot(d))
+            else:
+                self._vol_sum[k], self._vol_sum2[k] = _shifted_sums(values, seqs, start, total, shift)
+    
+    def _vol_std(self, k):
+        """Population standard deviation of volatility field k over the window."""
+        count = self._vol_n
+        if count < 2:
+            return 0.0
+        inv_n = 1.0 / count
+        mean = self._vol_sum[k] * inv_n
+        variance = self._vol_sum2[k] * inv_n - mean * mean
+        return math.sqrt(variance) if variance > 0.0 else 0.0
+    
+    def _timeframe_span(self, group, cutoff_time):
+        """
+        (oldest, newest) outdoor ring slots at or after cutoff_time, (-1, -1) if fewer
+        than two. The cutoff only moves forward, so the oldest-slot search resumes
+        where the previous call for this timeframe (trend group) stopped.
+        """
+        n = self.max_recent_readings
+        times = self._ring_time
+        first_seq = self._ring_seq - self._ring_count
+        newest = self._last_outdoor_seq
+        if newest < first_seq or times[newest % n] < cutoff_time:
+            return -1, -1
+        
+        outdoor = self._ring_outdoor
+        seq = max(self._span_start[group], first_seq)
+        while seq < newest:
+            i = seq % n
+            if outdoor[i >> 3] & (1 << (i & 7)) and times[i] >= cutoff_time:
+                break
+            seq += 1
+        self._span_start[group] = seq
+        if seq >= newest:
+            return -1, -1
+        return seq % n, newest % n
+    
+    def _update_enhanced_trends(self, current_time):
+        """ENHANCED: Calculate trends across multiple timeframes"""
+        if self._ring_outdoor_count < 2:
             return
         
         # Calculate trends for different timeframes
-        self._calculate_timeframe_trends(outdoor_readings, 60, '1h')    # 1 hour
-        self._calculate_timeframe_trends(outdoor_readings, 180, '3h')   # 3 hours
+        self._calculate_timeframe_trends(60, _T_PRESSURE_1H, current_time)    # 1 hour
+        self._calculate_timeframe_trends(180, _T_PRESSURE_3H, current_time)   # 3 hours
         
         # Calculate 24h trends from hourly summaries if available
         if len(self.hourly_summaries) >= 2:
             self._calculate_daily_trends()
     
-    def _calculate_timeframe_trends(self, readings, max_age_minutes, suffix):
-        """Calculate trends for a specific timeframe"""
-        current_time = time.monotonic()
+    def _calculate_timeframe_trends(self, max_age_minutes, group, current_time):
+        """Calculate trends for a specific timeframe, written to the trend group starting at `group`"""
         cutoff_time = current_time - (max_age_minutes * 60)
         
-        # Filter readings within timeframe
-        timeframe_readings = [r for r in readings if r['time'] >= cutoff_time]
-        
-        if len(timeframe_readings) < 2:
+        # Oldest and newest outdoor readings within timeframe
+        oldest, newest = self._timeframe_span(group, cutoff_time)
+        if oldest < 0:
             return
         
-        oldest = timeframe_readings[0]
-        newest = timeframe_readings[-1]
-        time_diff = (newest['time'] - oldest['time']) / 3600  # Convert to hours
+        time_diff = (self._ring_time[newest] - self._ring_time[oldest]) / 3600  # Convert to hours
         
         if time_diff > 0:
+            trends = self.trends
+            lux = self._ring[_F_LUX]
+            
             # Calculate trends (change per hour)
-            self.trends[f'pressure_{suffix}'] = (newest['pressure'] - oldest['pressure']) / time_diff
-            self.trends[f'temp_{suffix}'] = (newest['temperature'] - oldest['temperature']) / time_diff
-            self.trends[f'humidity_{suffix}'] = (newest['humidity'] - oldest['humidity']) / time_diff
-            self.trends[f'co2_{suffix}'] = (newest['co2'] - oldest['co2']) / time_diff
+            if self.least_squares_trend and self._ring_np:
+                self._fit_timeframe_trends(group)
+            else:
+                ring = self._ring
+                pressure = ring[_F_PRESSURE]
+                temperature = ring[_F_TEMPERATURE]
+                humidity = ring[_F_HUMIDITY]
+                co2 = ring[_F_CO2]
+                
+                per_hour = 1.0 / time_diff
+                trends[group] = (pressure[newest] - pressure[oldest]) * per_hour
+                trends[group + 1] = (temperature[newest] - temperature[oldest]) * per_hour
+                trends[group + 2] = (humidity[newest] - humidity[oldest]) * per_hour
+                trends[group + 4] = (co2[newest] - co2[oldest]) * per_hour
             
-            # Light trend (relative change)
-            if oldest['lux'] > 100:
-                self.trends[f'light_{suffix}'] = (newest['lux'] - oldest['lux']) / oldest['lux']
+            # Light trend (relative change); the reciprocal is only
+            # recomputed when the timeframe's oldest reading moves on
+            oldest_seq, recip = self._oldest_lux_recip[group]
+            if oldest_seq != self._span_start[group]:
+                recip = 1.0 / lux[oldest] if lux[oldest] > 100 else 0.0
+                self._oldest_lux_recip[group] = (self._span_start[group], recip)
+            if recip:
+                trends[group + 3] = (lux[newest] - lux[oldest]) * recip
             else:
-                self.trends[f'light_{suffix}'] = 0.0
+                trends[group + 3] = 0.0
+    
+    def _fit_timeframe_trends(self, group):
+        """
+        Least-squares slopes (per hour) of pressure, temperature, humidity and CO2
+        over every outdoor reading in the timeframe; NumPy hosts only.
+        """
+        slots = self._outdoor_slots(self._ring_seq - self._span_start[group])
+        hours = np.frombuffer(self._ring_time, dtype=np.float64)[slots]
+        hours = (hours - hours[0]) * (1.0 / 3600)
+        ring_np = self._ring_np
+        columns = np.stack((ring_np[_F_PRESSURE][slots], ring_np[_F_TEMPERATURE][slots],
+                            ring_np[_F_HUMIDITY][slots], ring_np[_F_CO2][slots]), axis=1)
+        slopes = np.polyfit(hours, columns.astype(np.float64), 1)[0]
+        
+        trends = self.trends
+        trends[group] = slopes[0]
+        trends[group + 1] = slopes[1]
+        trends[group + 2] = slopes[2]
+        trends[group + 4] = slopes[3]
     
     def _calculate_daily_trends(self):
         """Calculate 24-hour trends from hourly summaries"""
@@ -254,280 +907,209 @@ class WeatherManager:
         time_diff = len(self.hourly_summaries)  # Hours
         
         if time_diff > 0:
-            self.trends['pressure_24h'] = (newest['avg_pressure'] - oldest['avg_pressure']) / time_diff
-            self.trends['temp_24h'] = (newest['avg_temperature'] - oldest['avg_temperature']) / time_diff
-            self.trends['humidity_24h'] = (newest['avg_humidity'] - oldest['avg_humidity']) / time_diff
-            self.trends['co2_24h'] = (newest['avg_co2'] - oldest['avg_co2']) / time_diff
+            trends = self.trends
+            trends[_T_PRESSURE_24H] = (newest.avg_pressure - oldest.avg_pressure) / time_diff
+            trends[_T_TEMP_24H] = (newest.avg_temperature - oldest.avg_temperature) / time_diff
+            trends[_T_HUMIDITY_24H] = (newest.avg_humidity - oldest.avg_humidity) / time_diff
+            trends[_T_CO2_24H] = (newest.avg_co2 - oldest.avg_co2) / time_diff
             
-            if oldest['avg_lux'] > 100:
-                self.trends['light_24h'] = (newest['avg_lux'] - oldest['avg_lux']) / oldest['avg_lux']
+            if oldest.avg_lux > 100:
+                trends[_T_LIGHT_24H] = (newest.avg_lux - oldest.avg_lux) / oldest.avg_lux
             else:
-                self.trends['light_24h'] = 0.0
+                trends[_T_LIGHT_24H] = 0.0
     
     def _calculate_volatility_metrics(self):
         """ENHANCED: Calculate volatility and stability metrics"""
-        outdoor_readings = [r for r in self.recent_readings if r['outdoor_valid']]
-        
-        if len(outdoor_readings) < 10:
+        if self._ring_outdoor_count < 10:
             return
         
-        # Calculate standard deviations for volatility
-        pressures = [r['pressure'] for r in outdoor_readings[-60:]]  # Last hour
-        temps = [r['temperature'] for r in outdoor_readings[-60:]]
-        humidities = [r['humidity'] for r in outdoor_readings[-60:]]
-        
-        def calculate_std(values):
-            if len(values) < 2:
-                return 0.0
-            mean = sum(values) / len(values)
-            variance = sum((x - mean) ** 2 for x in values) / len(values)
-            return math.sqrt(variance)
-        
-        self.volatility_metrics['pressure_volatility'] = calculate_std(pressures)
-        self.volatility_metrics['temp_volatility'] = calculate_std(temps)
-        self.volatility_metrics['humidity_volatility'] = calculate_std(humidities)
+        # Standard deviations over the last hour, from the running window sums
+        self.volatility_metrics['pressure_volatility'] = self._vol_std(0)
+        self.volatility_metrics['temp_volatility'] = self._vol_std(1)
+        self.volatility_metrics['humidity_volatility'] = self._vol_std(2)
         
         # Calculate stability score (inverse of volatility)
         volatility_sum = (self.volatility_metrics['pressure_volatility'] / 10.0 +
                          self.volatility_metrics['temp_volatility'] / 5.0 +
                          self.volatility_metrics['humidity_volatility'] / 20.0)
         
-        self.volatility_metrics['stability_score'] = max(0, 100 - volatility_sum * 20)
+        stability = 100 - volatility_sum * 20
+        self.volatility_metrics['stability_score'] = stability if stability > 0 else 0
     
     def _update_pattern_recognition(self):
         """ENHANCED: Pattern recognition for weather prediction"""
-        if len(self.recent_readings) < 30:
+        if self._ring_count < 30:
             return
         
-        # Create pattern signature from recent trends
-        pattern = {
-            'pressure_trend': self.trends.get('pressure_1h', 0),
-            'temp_trend': self.trends.get('temp_1h', 0),
-            'humidity_trend': self.trends.get('humidity_1h', 0),
-            'volatility': self.volatility_metrics.get('pressure_volatility', 0),
-            'stability': self.volatility_metrics.get('stability_score', 0),
-            'timestamp': time.time()
-        }
+        # Record the pattern signature from recent trends
+        i = self._ph_head
+        self._ph_ptrend[i] = self.trends[_T_PRESSURE_1H]
+        self._ph_vol[i] = self.volatility_metrics.get('pressure_volatility', 0)
+        self._ph_stab[i] = self.volatility_metrics.get('stability_score', 0)
+        self._ph_time[i] = time.time()
+        self._ph_head = (i + 1) % self.max_patterns
+        if self._ph_n < self.max_patterns:
+            self._ph_n += 1
+            if self._pattern_confidence < 100:
+                self._pattern_confidence += 5
+    
+    def _collect_if_heap_low(self):
+        """Run gc.collect() when the heap is tight, at most every _GC_MIN_INTERVAL seconds."""
+        now = time.monotonic()
+        if now - self._last_gc < _GC_MIN_INTERVAL:
+            return
+        self._last_gc = now
         
-        # Add to pattern history
-        self.pattern_history.append(pattern)
-        if len(self.pattern_history) > self.max_patterns:
-            self.pattern_history.pop(0)
+        try:
+            free_memory = gc.mem_free()
+            total_memory = free_memory + gc.mem_alloc()
+        except AttributeError:
+            return  # CPython's gc reports no heap figures
+        
+        if free_memory < total_memory // _GC_LOW_WATER_DIVISOR:
+            gc.collect()
+            reclaimed = gc.mem_free() - free_memory
+            if reclaimed > 0 and self.verbose:
+                print(f"🧹 Weather GC reclaimed {reclaimed} bytes")
     
-    def _maintain_data_structures(self):
+    def _maintain_data_structures(self, current_time):
         """ENHANCED: Maintain data structures and create summaries"""
-        current_time = time.monotonic()
+        self._collect_if_heap_low()
         
         # Create hourly summaries every hour
-        if len(self.recent_readings) >= 60:  # At least 1 hour of data
-            last_hour_readings = self.recent_readings[-60:]
-            outdoor_readings = [r for r in last_hour_readings if r['outdoor_valid']]
+        if self._ring_count >= 60:  # At least 1 hour of data
+            start, stop = self._outdoor_bounds(60)
             
-            if outdoor_readings:
-                hourly_summary = {
-                    'timestamp': current_time,
-                    'avg_pressure': sum(r['pressure'] for r in outdoor_readings) / len(outdoor_readings),
-                    'avg_temperature': sum(r['temperature'] for r in outdoor_readings) / len(outdoor_readings),
-                    'avg_humidity': sum(r['humidity'] for r in outdoor_readings) / len(outdoor_readings),
-                    'avg_lux': sum(r['lux'] for r in outdoor_readings) / len(outdoor_readings),
-                    'avg_co2': sum(r['co2'] for r in outdoor_readings) / len(outdoor_readings),
-                    'min_pressure': min(r['pressure'] for r in outdoor_readings),
-                    'max_pressure': max(r['pressure'] for r in outdoor_readings),
-                    'reading_count': len(outdoor_readings)
-                }
+            if stop > start:
+                if self._ring_np:
+                    # Gather the window once per field and reduce it in NumPy
+                    slots = self._outdoor_slots(60)
+                    pressure, temperature, humidity, lux, co2 = (
+                        field[slots].astype(np.float64) for field in self._ring_np)
+                    sp, st, sh, sl, sc = (float(c.sum()) for c in (pressure, temperature, humidity, lux, co2))
+                    min_p = float(pressure.min())
+                    max_p = float(pressure.max())
+                else:
+                    pressure, temperature, humidity, lux, co2 = self._ring
+                    
+                    # One pass over the window's slots accumulates every field of the summary
+                    n = self.max_recent_readings
+                    seqs = self._outdoor_seqs
+                    sp = st = sh = sl = sc = 0.0
+                    min_p = max_p = pressure[seqs[start % n] % n]
+                    for j in range(start, stop):
+                        i = seqs[j % n] % n
+                        p = pressure[i]
+                        sp += p
+                        if p < min_p:
+                            min_p = p
+                        elif p > max_p:
+                            max_p = p
+                        st += temperature[i]
+                        sh += humidity[i]
+                        sl += lux[i]
+                        sc += co2[i]
+                
+                count = stop - start
+                inv_n = 1.0 / count
+                hourly_summary = _HourlySummary(current_time, sp * inv_n, st * inv_n, sh * inv_n,
+                                                sl * inv_n, sc * inv_n, min_p, max_p, count)
                 
                 # Add to hourly summaries
                 self.hourly_summaries.append(hourly_summary)
-                if len(self.hourly_summaries) > self.max_hourly_summaries:
-                    self.hourly_summaries.pop(0)
-        
-        # Periodic garbage collection for memory management
-        if self.total_readings % 100 == 0:
-            gc.collect()
     
-    def calculate_enhanced_storm_probability(self):
-        """ENHANCED: Advanced fusion algorithm with multi-timeframe analysis"""
-        if not self.last_outdoor_reading or len(self.recent_readings) < 5:
+    def calculate_enhanced_storm_probability(self, detail=False):
+        """
+        ENHANCED: Advanced fusion algorithm with multi-timeframe analysis. The
+        factor scores, trends and volatility metrics are only included with detail.
+        """
+        if not self.has_outdoor or self._ring_count < 5:
             return self._return_insufficient_data()
         
-        if self.last_outdoor_reading['location'] != 'OUTDOOR':
+        if self.last_location != 'OUTDOOR':
             return self._return_indoor_mode()
         
-        outdoor_readings = [r for r in self.recent_readings if r['outdoor_valid']]
-        if len(outdoor_readings) < 5:
+        if self._ring_outdoor_count < 5:
             return self._return_waiting_data()
         
-        # ENHANCED: Multi-factor analysis with expanded weighting
-        storm_score = 0
-        factor_scores = {}
-        
-        # FACTOR 1: Multi-timeframe Pressure Analysis (35% weight)
-        pressure_score = self._analyze_pressure_patterns()
-        factor_scores['pressure'] = pressure_score
-        storm_score += pressure_score * 0.35
-        
-        # FACTOR 2: Atmospheric Instability (25% weight)
-        instability_score = self._analyze_atmospheric_instability()
-        factor_scores['instability'] = instability_score
-        storm_score += instability_score * 0.25
-        
-        # FACTOR 3: Environmental Conditions (20% weight)
-        environmental_score = self._analyze_environmental_conditions()
-        factor_scores['environmental'] = environmental_score
-        storm_score += environmental_score * 0.20
+        return self._fuse_storm_factors(detail)
+    
+    def _calc_outdoor_only(self, detail=False):
+        """calculate_enhanced_storm_probability for a fixed outdoor install: only the data-count guard remains"""
+        if self._ring_outdoor_count < 5:
+            return self._return_insufficient_data()
         
-        # FACTOR 4: Pattern Recognition (10% weight)
+        return self._fuse_storm_factors(detail)
+    
+    def _fuse_storm_factors(self, detail):
+        """Score, adjust and classify the storm probability from the current state"""
+        self._refresh_local_time()
+        
+        # ENHANCED: Multi-factor analysis, each factor a scalar kernel fed straight
+        # from the trend slots and latest reading, fused with the time-of-year/day
+        # adjustments in one more kernel
+        trends = self.trends
+        metrics = self.volatility_metrics
+        pressure_score = _pressure_score(trends[_T_PRESSURE_1H], trends[_T_PRESSURE_3H], self.last_pressure)
+        instability_score = _instability_score(trends[_T_TEMP_1H], trends[_T_HUMIDITY_1H],
+                                               trends[_T_TEMP_3H], self.last_temperature,
+                                               self.last_humidity)
+        environmental_score = _environmental_score(self._cur_hour, self.last_lux, trends[_T_LIGHT_1H],
+                                                   trends[_T_CO2_1H], self.last_wind_speed)
         pattern_score = self._analyze_weather_patterns()
-        factor_scores['patterns'] = pattern_score
-        storm_score += pattern_score * 0.10
-        
-        # FACTOR 5: Volatility and Stability (10% weight)
-        volatility_score = self._analyze_volatility()
-        factor_scores['volatility'] = volatility_score
-        storm_score += volatility_score * 0.10
-        
-        # Apply seasonal and diurnal adjustments
-        if self.seasonal_adjustments:
-            storm_score = self._apply_seasonal_adjustments(storm_score)
-        
-        if self.diurnal_adjustments:
-            storm_score = self._apply_diurnal_adjustments(storm_score)
+        volatility_score = _volatility_score(metrics['pressure_volatility'], metrics['stability_score'])
         
         # Final probability and confidence
-        self.storm_probability = min(100, max(0, storm_score))
+        self.storm_probability = _fused_storm_probability(
+            pressure_score, instability_score, environmental_score, pattern_score, volatility_score,
+            self._cur_month, self._cur_hour, self.seasonal_adjustments, self.diurnal_adjustments)
         self.prediction_confidence = self._calculate_enhanced_confidence()
         
         # ENHANCED: Storm classification and intensity
         self._classify_storm_enhanced()
         
-        return {
+        result = {
             'probability': self.storm_probability,
             'confidence': self.prediction_confidence,
-            'method': 'ENHANCED_MULTI_TIMEFRAME_FUSION',
+            'method': _METHOD_FUSION,
             'storm_type': self.storm_classification,
             'storm_type_detail': self.storm_type_detail,
-            'storm_intensity': self.storm_intensity,
-            'factor_scores': factor_scores,
-            'trends': self.trends,
-            'volatility_metrics': self.volatility_metrics,
-            'pattern_count': len(self.pattern_history)
+            'storm_intensity': self.storm_intensity
         }
+        if detail:
+            result['factor_scores'] = {
+                'pressure': pressure_score,
+                'instability': instability_score,
+                'environmental': environmental_score,
+                'patterns': pattern_score,
+                'volatility': volatility_score
+            }
+            result['trends'] = self.trends_dict
+            result['volatility_metrics'] = self.volatility_metrics
+            result['pattern_count'] = self._ph_n
+        return result
     
-    def _analyze_pressure_patterns(self):
-        """ENHANCED: Multi-timeframe pressure analysis"""
-        score = 0
-        
-        # Short-term pressure changes (1h) - Most critical
-        if self.trends['pressure_1h'] < -3.0:
-            score += 90  # Severe pressure drop
-        elif self.trends['pressure_1h'] < -2.0:
-            score += 75  # Rapid pressure drop
-        elif self.trends['pressure_1h'] < -1.0:
-            score += 50  # Moderate pressure drop
-        elif self.trends['pressure_1h'] < -0.5:
-            score += 25  # Slow pressure drop
-        
-        # Medium-term pressure changes (3h) - Confirmation
-        if self.trends['pressure_3h'] < -2.0:
-            score += 20  # Sustained pressure drop
-        elif self.trends['pressure_3h'] < -1.0:
-            score += 10  # Moderate sustained drop
-        
-        # Absolute pressure consideration
-        if self.last_outdoor_reading['pressure'] < 1005:
-            score += 30  # Very low pressure
-        elif self.last_outdoor_reading['pressure'] < 1010:
-            score += 15  # Low pressure
-        
-        return min(100, score)
-    
-    def _analyze_atmospheric_instability(self):
-        """ENHANCED: Advanced atmospheric instability analysis"""
-        score = 0
-        
-        # Temperature-humidity coupling
-        temp_1h = self.trends['temp_1h']
-        humid_1h = self.trends['humidity_1h']
-        
-        # Cold front detection
-        if temp_1h < -2.0 and humid_1h > 10.0:
-            score += 80  # Strong cold front
-        elif temp_1h < -1.0 and humid_1h > 5.0:
-            score += 60  # Moderate cold front
-        
-        # Warm front detection
-        elif temp_1h > 2.0 and humid_1h > 15.0:
-            score += 70  # Strong warm front
-        elif temp_1h > 1.0 and humid_1h > 10.0:
-            score += 50  # Moderate warm front
-        
-        # Convective instability
-        current = self.last_outdoor_reading
-        if current['temperature'] > 25 and current['humidity'] > 80:
-            score += 40  # High convection potential
-        elif current['temperature'] > 20 and current['humidity'] > 85:
-            score += 30  # Moderate convection potential
-        
-        # Multi-timeframe temperature analysis
-        if abs(self.trends['temp_3h']) > 3.0:
-            score += 20  # Significant temperature change
-        
-        return min(100, score)
-    
-    def _analyze_environmental_conditions(self):
-        """ENHANCED: Environmental conditions analysis"""
-        score = 0
-        current = self.last_outdoor_reading
-        
-        # Light/cloud analysis
-        current_hour = time.localtime().tm_hour
-        is_daytime = 6 <= current_hour <= 18
-        
-        if is_daytime:
-            if current['lux'] < 3000:
-                score += 70  # Very dark during day
-            elif current['lux'] < 10000:
-                score += 40  # Cloudy conditions
-            elif current['lux'] < 20000:
-                score += 20  # Partly cloudy
-            
-            # Light change analysis
-            if self.trends['light_1h'] < -0.6:
-                score += 30  # Rapid darkening
-            elif self.trends['light_1h'] < -0.3:
-                score += 15  # Gradual darkening
-        
-        # CO2 analysis (can indicate weather changes)
-        if abs(self.trends['co2_1h']) > 50:
-            score += 15  # Significant CO2 change
-        
-        # Wind analysis (if available)
-        if current['wind_speed'] > 15:
-            score += 25  # High wind speed
-        elif current['wind_speed'] > 10:
-            score += 15  # Moderate wind
-        
-        return min(100, score)
+    def _refresh_local_time(self):
+        """Cache the local hour and month used by the time-of-day/season factors."""
+        minute = int(time.time() // 60)
+        if minute != self._lt_minute:
+            lt = time.localtime()
+            self._lt_minute = minute
+            self._cur_hour = lt.tm_hour
+            self._cur_month = lt.tm_mon
     
     def _analyze_weather_patterns(self):
         """ENHANCED: Pattern recognition analysis"""
-        if len(self.pattern_history) < 5:
+        if self._ph_n < 5:
             return 0
         
         score = 0
         
-        # Analyze recent pattern similarity to historical storm patterns
-        recent_patterns = self.pattern_history[-5:]
-        
-        # Look for patterns that historically preceded storms
-        storm_indicators = 0
-        for pattern in recent_patterns:
-            if pattern['pressure_trend'] < -1.0:
-                storm_indicators += 1
-            if pattern['volatility'] > 2.0:
-                storm_indicators += 1
-            if pattern['stability'] < 50:
-                storm_indicators += 1
+        # Look for recent patterns that historically preceded storms
+        head = self._ph_head
+        if head < 5:
+            head += self.max_patterns  # Keep the range ascending across the wrap
+        storm_indicators = _pattern_indicators(self._ph_ptrend, self._ph_vol, self._ph_stab, head, 5)
         
         # Score based on pattern indicators
         if storm_indicators >= 8:
@@ -541,130 +1123,45 @@ class WeatherManager:
         
         return score
     
-    def _analyze_volatility(self):
-        """ENHANCED: Volatility analysis"""
-        score = 0
-        
-        # High volatility can indicate unstable conditions
-        if self.volatility_metrics['pressure_volatility'] > 3.0:
-            score += 60  # High pressure volatility
-        elif self.volatility_metrics['pressure_volatility'] > 2.0:
-            score += 40  # Moderate pressure volatility
-        elif self.volatility_metrics['pressure_volatility'] > 1.0:
-            score += 20  # Low pressure volatility
-        
-        # Low stability indicates potential for weather changes
-        if self.volatility_metrics['stability_score'] < 30:
-            score += 40  # Low stability
-        elif self.volatility_metrics['stability_score'] < 50:
-            score += 20  # Moderate stability
-        
-        return min(100, score)
-    
-    def _apply_seasonal_adjustments(self, score):
-        """Apply seasonal adjustments to storm probability"""
-        # This is a simplified seasonal adjustment
-        # In a real implementation, you might use local climate data
-        month = time.localtime().tm_mon
-        
-        # Summer months (higher storm activity)
-        if month in [6, 7, 8]:
-            return score * 1.1
-        # Spring/Fall (moderate adjustment)
-        elif month in [3, 4, 5, 9, 10, 11]:
-            return score * 1.05
-        # Winter (lower storm activity)
-        else:
-            return score * 0.9
-    
-    def _apply_diurnal_adjustments(self, score):
-        """Apply daily cycle adjustments"""
-        hour = time.localtime().tm_hour
-        
-        # Afternoon/evening peak storm times
-        if 14 <= hour <= 20:
-            return score * 1.1
-        # Morning hours (lower storm activity)
-        elif 6 <= hour <= 10:
-            return score * 0.95
-        # Night hours (moderate activity)
-        else:
-            return score * 1.0
-    
     def _calculate_enhanced_confidence(self):
         """ENHANCED: Calculate prediction confidence"""
-        outdoor_readings = [r for r in self.recent_readings if r['outdoor_valid']]
-        
-        # Data quality factor
-        data_quality = min(100, len(outdoor_readings) * 2)
-        
-        # Sensor stability factor
-        sensor_stability = min(100, 100 - self.volatility_metrics['pressure_volatility'] * 10)
-        
-        # Pattern recognition factor
-        pattern_confidence = min(100, len(self.pattern_history) * 5)
-        
-        # Multi-timeframe agreement
-        trends_1h = abs(self.trends.get('pressure_1h', 0))
-        trends_3h = abs(self.trends.get('pressure_3h', 0))
-        
-        if trends_1h > 0.1 and trends_3h > 0.1:
-            trend_agreement = 100 - abs(trends_1h - trends_3h) * 20
-        else:
-            trend_agreement = 50
-        
-        # Overall confidence
-        confidence = (data_quality * 0.3 + sensor_stability * 0.25 + 
-                     pattern_confidence * 0.2 + trend_agreement * 0.25)
-        
-        return min(100, max(0, confidence))
+        trends = self.trends
+        return _confidence_score(self._ring_outdoor_count,
+                                 self.volatility_metrics['pressure_volatility'],
+                                 self._pattern_confidence,
+                                 trends[_T_PRESSURE_1H], trends[_T_PRESSURE_3H])
     
     def _classify_storm_enhanced(self):
         """ENHANCED: Advanced storm classification"""
         prob = self.storm_probability
         
         # Determine storm intensity
-        if prob >= 90:
-            self.storm_intensity = 95
-        elif prob >= 80:
-            self.storm_intensity = 85
-        elif prob >= 70:
-            self.storm_intensity = 75
-        elif prob >= 60:
-            self.storm_intensity = 65
+        decile = int(prob) // 10
+        if decile >= 6:
+            intensity = _STORM_INTENSITY[(decile if decile < 9 else 9) - 6]
         else:
-            self.storm_intensity = max(0, prob - 10)
+            intensity = prob - 10 if prob > 10 else 0
         
         # Detailed storm classification
-        if prob >= 85:
-            if self.trends['pressure_1h'] < -3.0:
-                self.storm_classification = "SEVERE_STORM"
-                self.storm_type_detail = "SEVERE_THUNDERSTORM"
+        tier = (prob < 85) + (prob < 70) + (prob < 50) + (prob < 30)
+        classification, detail = _STORM_TIERS[tier]
+        
+        # The two storm tiers are refined by what is driving them
+        if tier == 0:
+            if self.trends[_T_PRESSURE_1H] < -3.0:
+                classification, detail = "SEVERE_STORM", "SEVERE_THUNDERSTORM"
             elif self.volatility_metrics['pressure_volatility'] > 3.0:
-                self.storm_classification = "SEVERE_STORM"
-                self.storm_type_detail = "SEVERE_WEATHER_SYSTEM"
-            else:
-                self.storm_classification = "MAJOR_STORM"
-                self.storm_type_detail = "MAJOR_WEATHER_EVENT"
-        elif prob >= 70:
-            if self.trends['temp_1h'] < -2.0:
-                self.storm_classification = "STORM_LIKELY"
-                self.storm_type_detail = "COLD_FRONT_STORM"
-            elif self.trends['temp_1h'] > 2.0:
-                self.storm_classification = "STORM_LIKELY"
-                self.storm_type_detail = "WARM_FRONT_STORM"
-            else:
-                self.storm_classification = "STORM_LIKELY"
-                self.storm_type_detail = "APPROACHING_STORM"
-        elif prob >= 50:
-            self.storm_classification = "WEATHER_CHANGE"
-            self.storm_type_detail = "SIGNIFICANT_WEATHER_CHANGE"
-        elif prob >= 30:
-            self.storm_classification = "WEATHER_CHANGE"
-            self.storm_type_detail = "MINOR_WEATHER_CHANGE"
-        else:
-            self.storm_classification = "STABLE"
-            self.storm_type_detail = "STABLE_CONDITIONS"
+                classification, detail = "SEVERE_STORM", "SEVERE_WEATHER_SYSTEM"
+        elif tier == 1:
+            temp_1h = self.trends[_T_TEMP_1H]
+            if temp_1h < -2.0:
+                detail = "COLD_FRONT_STORM"
+            elif temp_1h > 2.0:
+                detail = "WARM_FRONT_STORM"
+        
+        self.storm_intensity = intensity
+        self.storm_classification = classification
+        self.storm_type_detail = detail
     
     def _return_insufficient_data(self):
         """Return insufficient data response"""
@@ -677,13 +1174,14 @@ class WeatherManager:
             'storm_intensity': 0
         }
     
-    def _return_indoor_mode(self):
-        """Return indoor mode response"""
+    def _return_indoor_mode(self, detail=False):
+        """Return indoor mode response (detail only matches calculate_enhanced_storm_probability)"""
+        location = self.fixed_location or self.last_location
         return {
             'probability': 0,
             'confidence': 0,
             'method': 'PREDICTION_PAUSED',
-            'storm_type': f"INDOOR_MODE_{self.last_outdoor_reading['location']}",
+            'storm_type': f"INDOOR_MODE_{location}",
             'storm_type_detail': 'INDOOR_OPERATION',
             'storm_intensity': 0
         }
@@ -699,14 +1197,20 @@ class WeatherManager:
             'storm_intensity': 0
         }
     
-    def get_enhanced_weather_forecast(self):
-        """ENHANCED: Get comprehensive weather forecast"""
-        
-        # Try to get fresh data from sensor manager
-        self.add_sensor_reading_from_manager()
+    def get_enhanced_weather_forecast(self, include_memory=False):
+        """
+        ENHANCED: Get comprehensive weather forecast. The memory analysis and
+        system performance blocks are only filled in when include_memory is set.
+        The same dict is refilled on every new reading - copy it to keep it.
+        """
+        
+        # Try to get fresh data from sensor manager; with nothing new ingested
+        # every input is unchanged, so the last forecast still stands
+        if not self.add_sensor_reading_from_manager() and self._last_forecast is not None:
+            return self._set_memory_blocks(self._last_forecast, include_memory)
         
         # Calculate enhanced forecast
-        result = self.calculate_enhanced_storm_probability()
+        result = self.calculate_enhanced_storm_probability(detail=True)
         
         # ENHANCED: Multi-timeframe timing estimation
         timing = self._estimate_storm_timing(result['probability'])
@@ -714,155 +1218,174 @@ class WeatherManager:
         # ENHANCED: Confidence breakdown
         confidence_breakdown = self._get_confidence_breakdown()
         
-        # Get current sensor manager status
-        sensor_status = "DISCONNECTED"
-        if self.sensor_manager:
+        # Get current sensor manager status, reusing this tick's fetch when there was one
+        sensor_status = STATUS_DISCONNECTED
+        if time.monotonic() - self._sensor_status_time < self.update_interval:
+            sensor_status = self._sensor_status
+        elif self._get_all_sensor_data is not None:
             try:
-                mgr_data = self.sensor_manager.get_all_sensor_data()
-                sensor_status = f"CONNECTED_{mgr_data.get('current_location', 'UNKNOWN')}"
+                mgr_data = self._get_all_sensor_data()
+                sensor_status = _location_status(mgr_data.get('current_location'))
             except:
-                sensor_status = "CONNECTED_ERROR"
-        
-        # ENHANCED: Memory usage analysis
-        memory_info = self.get_enhanced_memory_usage()
-        
-        return {
-            # Core predictions
-            'storm_probability': result['probability'],
-            'storm_intensity': result.get('storm_intensity', 0),
-            'confidence': result['confidence'],
-            'storm_type': result['storm_type'],
-            'storm_type_detail': result.get('storm_type_detail', 'UNKNOWN'),
-            'arrival_timing': timing,
-            'method': result['method'],
-            
-            # ENHANCED: Accuracy and performance
-            'accuracy_estimate': f"{90 + (result['confidence'] * 0.08):.0f}%",
-            'prediction_method': 'MULTI_TIMEFRAME_FUSION',
-            'data_quality_score': confidence_breakdown['data_quality'],
-            
-            # ENHANCED: System status
-            'sensor_manager_status': sensor_status,
-            'memory_usage': memory_info,
-            'system_performance': self._get_system_performance(),
-            
-            # ENHANCED: Data points
-            'data_points': {
-                'total': self.total_readings,
-                'outdoor': self.outdoor_readings,
-                'recent_readings': len(self.recent_readings),
-                'hourly_summaries': len(self.hourly_summaries),
-                'daily_summaries': len(self.daily_summaries),
-                'patterns_stored': len(self.pattern_history)
-            },
-            
-            # ENHANCED: Detailed analysis
-            'trends': result.get('trends', {}),
-            'volatility_metrics': result.get('volatility_metrics', {}),
-            'factor_breakdown': result.get('factor_scores', {}),
-            'confidence_breakdown': confidence_breakdown,
-            
-            # ENHANCED: Environmental conditions
-            'current_conditions': self._get_current_conditions(),
-            'atmospheric_pressure': {
-                'current': self.last_outdoor_reading['pressure'] if self.last_outdoor_reading else 0,
-                'trend_1h': self.trends.get('pressure_1h', 0),
-                'trend_3h': self.trends.get('pressure_3h', 0),
-                'trend_24h': self.trends.get('pressure_24h', 0)
-            },
-            
-            # System info
-            'last_update': self.last_update_time,
-            'update_interval': self.update_interval,
-            'enhanced_features': True,
-            'pico2_optimized': True
-        }
+                sensor_status = STATUS_CONNECTED_ERROR
+        
+        trends = self.trends
+        
+        # Refill the pooled forecast dicts in place
+        forecast = self._forecast
+        
+        # Core predictions
+        forecast['storm_probability'] = result['probability']
+        forecast['storm_intensity'] = result.get('storm_intensity', 0)
+        forecast['confidence'] = result['confidence']
+        forecast['storm_type'] = result['storm_type']
+        forecast['storm_type_detail'] = result.get('storm_type_detail', 'UNKNOWN')
+        forecast['arrival_timing'] = timing
+        forecast['method'] = result['method']
+        
+        # ENHANCED: Accuracy and performance
+        forecast['accuracy_estimate'] = str(round(90 + result['confidence'] * 0.08)) + "%"
+        forecast['prediction_method'] = _PREDICTION_METHOD
+        forecast['data_quality_score'] = confidence_breakdown['data_quality']
+        
+        # ENHANCED: System status
+        forecast['sensor_manager_status'] = sensor_status
+        
+        # ENHANCED: Data points
+        data_points = self._data_points
+        data_points['total'] = self.total_readings
+        data_points['outdoor'] = self.outdoor_readings
+        data_points['recent_readings'] = self._ring_count
+        data_points['hourly_summaries'] = len(self.hourly_summaries)
+        data_points['daily_summaries'] = len(self.daily_summaries)
+        data_points['patterns_stored'] = self._ph_n
+        forecast['data_points'] = data_points
+        
+        # ENHANCED: Detailed analysis
+        forecast['trends'] = result.get('trends', {})
+        forecast['volatility_metrics'] = result.get('volatility_metrics', {})
+        forecast['factor_breakdown'] = result.get('factor_scores', {})
+        forecast['confidence_breakdown'] = confidence_breakdown
+        
+        # ENHANCED: Environmental conditions
+        forecast['current_conditions'] = self._get_current_conditions()
+        pressure = self._pressure_summary
+        pressure['current'] = self.last_pressure if self.has_outdoor else 0
+        pressure['trend_1h'] = trends[_T_PRESSURE_1H]
+        pressure['trend_3h'] = trends[_T_PRESSURE_3H]
+        pressure['trend_24h'] = trends[_T_PRESSURE_24H]
+        forecast['atmospheric_pressure'] = pressure
+        
+        # System info
+        forecast['last_update'] = self.last_update_time
+        forecast['update_interval'] = self.update_interval
+        forecast['enhanced_features'] = True
+        forecast['pico2_optimized'] = True
+        
+        self._last_forecast = forecast
+        return self._set_memory_blocks(forecast, include_memory)
+    
+    def _set_memory_blocks(self, forecast, include_memory):
+        """Add the memory analysis and system performance blocks to a forecast,
+        or drop them when not asked for so a cached forecast never carries stale ones."""
+        if include_memory:
+            forecast['memory_usage'] = self.get_enhanced_memory_usage()
+            forecast['system_performance'] = self._get_system_performance()
+        else:
+            forecast.pop('memory_usage', None)
+            forecast.pop('system_performance', None)
+        return forecast
     
     def _estimate_storm_timing(self, probability):
         """ENHANCED: Multi-factor storm timing estimation"""
         if probability < 30:
-            return "No storm expected"
+            return _TIMING_LABELS[0]
         
         # Base timing on pressure trend rate
-        pressure_1h = abs(self.trends.get('pressure_1h', 0))
-        pressure_3h = abs(self.trends.get('pressure_3h', 0))
+        trends = self.trends
+        pressure_1h = abs(trends[_T_PRESSURE_1H])
+        pressure_3h = abs(trends[_T_PRESSURE_3H])
         
         # Factor in volatility
         volatility = self.volatility_metrics.get('pressure_volatility', 0)
         
-        # Estimate timing
-        if pressure_1h > 3.0 or volatility > 3.0:
-            return "30-90 minutes"
-        elif pressure_1h > 2.0 or volatility > 2.0:
-            return "1-3 hours"
-        elif pressure_1h > 1.0 or pressure_3h > 1.5:
-            return "2-6 hours"
-        elif pressure_3h > 1.0:
-            return "4-12 hours"
-        else:
-            return "6-24 hours"
+        # Estimate timing: the nearest window whose rule holds
+        for limit_1h, limit_3h, limit_volatility, label in _TIMING_RULES:
+            if pressure_1h > limit_1h or pressure_3h > limit_3h or volatility > limit_volatility:
+                return label
+        return _TIMING_LABELS[5]
     
     def _get_confidence_breakdown(self):
         """ENHANCED: Detailed confidence analysis"""
-        outdoor_readings = [r for r in self.recent_readings if r['outdoor_valid']]
-        
+        data_quality = self._ring_outdoor_count * 2
+        sensor_stability = 100 - self.volatility_metrics.get('pressure_volatility', 0) * 10
         return {
-            'data_quality': min(100, len(outdoor_readings) * 2),
-            'sensor_stability': min(100, 100 - self.volatility_metrics.get('pressure_volatility', 0) * 10),
-            'pattern_recognition': min(100, len(self.pattern_history) * 5),
+            'data_quality': data_quality if data_quality < 100 else 100,
+            'sensor_stability': sensor_stability if sensor_stability < 100 else 100,
+            'pattern_recognition': self._pattern_confidence,
             'multi_timeframe_agreement': self._calculate_timeframe_agreement(),
             'historical_accuracy': self._get_historical_accuracy()
         }
     
     def _calculate_timeframe_agreement(self):
         """Calculate agreement between different timeframe trends"""
-        trends_1h = abs(self.trends.get('pressure_1h', 0))
-        trends_3h = abs(self.trends.get('pressure_3h', 0))
+        trends = self.trends
+        trends_1h = abs(trends[_T_PRESSURE_1H])
+        trends_3h = abs(trends[_T_PRESSURE_3H])
         
         if trends_1h > 0.1 and trends_3h > 0.1:
-            return max(0, 100 - abs(trends_1h - trends_3h) * 20)
+            agreement = 100 - abs(trends_1h - trends_3h) * 20
+            return agreement if agreement > 0 else 0
         return 50
     
     def _get_historical_accuracy(self):
         """Get historical prediction accuracy"""
-        if len(self.prediction_accuracy_log) < 5:
+        count = len(self.prediction_accuracy_log)
+        if count < 5:
             return 95  # Default high accuracy
         
-        return sum(self.prediction_accuracy_log[-10:]) / len(self.prediction_accuracy_log[-10:])
+        return self._accuracy_sum / (count if count < _ACCURACY_WINDOW else _ACCURACY_WINDOW)
+    
+    def record_prediction_accuracy(self, accuracy):
+        """Log the accuracy (%) of a verified prediction, keeping the rolling window sum."""
+        log = self.prediction_accuracy_log
+        if len(log) >= _ACCURACY_WINDOW:
+            self._accuracy_sum -= log[-_ACCURACY_WINDOW]
+        log.append(accuracy)
+        self._accuracy_sum += accuracy
     
     def _get_current_conditions(self):
         """ENHANCED: Get current environmental conditions"""
-        if not self.last_outdoor_reading:
+        if not self.has_outdoor:
             return {}
         
-        current = self.last_outdoor_reading
-        return {
-            'temperature_c': current['temperature'],
-            'humidity_percent': current['humidity'],
-            'pressure_hpa': current['pressure'],
-            'light_lux': current['lux'],
-            'co2_ppm': current['co2'],
-            'radiation_cpm': current['cpm'],
-            'wind_speed': current.get('wind_speed', 0),
-            'wind_direction': current.get('wind_direction', 0),
-            'uv_index': current.get('uv_index', 0),
-            'location': current['location'],
-            'timestamp': current.get('timestamp', 0)
-        }
+        conditions = self._conditions
+        conditions['temperature_c'] = self.last_temperature
+        conditions['humidity_percent'] = self.last_humidity
+        conditions['pressure_hpa'] = self.last_pressure
+        conditions['light_lux'] = self.last_lux
+        conditions['co2_ppm'] = self.last_co2
+        conditions['radiation_cpm'] = self.last_cpm
+        conditions['wind_speed'] = self.last_wind_speed
+        conditions['wind_direction'] = self.last_wind_direction
+        conditions['uv_index'] = self.last_uv_index
+        conditions['location'] = self.last_location
+        conditions['timestamp'] = self.last_timestamp
+        return conditions
     
     def _get_system_performance(self):
         """ENHANCED: Get system performance metrics"""
-        if not self.last_outdoor_reading:
+        if not self.has_outdoor:
             return {}
         
-        return {
-            'cpu_temperature': self.last_outdoor_reading.get('cpu_temp', 0),
-            'memory_usage_percent': self.last_outdoor_reading.get('memory_usage', 0),
-            'readings_per_minute': 60 / self.update_interval,
-            'data_processing_efficiency': self._calculate_processing_efficiency(),
-            'prediction_latency': 'Real-time',
-            'storage_efficiency': self._calculate_storage_efficiency()
-        }
+        performance = self._performance
+        performance['cpu_temperature'] = self.last_cpu_temp
+        performance['memory_usage_percent'] = self.last_memory_usage
+        performance['readings_per_minute'] = 60 / self.update_interval
+        performance['data_processing_efficiency'] = self._calculate_processing_efficiency()
+        performance['prediction_latency'] = _PREDICTION_LATENCY
+        performance['storage_efficiency'] = self._calculate_storage_efficiency()
+        return performance
     
     def _calculate_processing_efficiency(self):
         """Calculate data processing efficiency"""
@@ -871,33 +1394,60 @@ class WeatherManager:
         
         # Efficiency based on outdoor reading ratio
         outdoor_ratio = self.outdoor_readings / self.total_readings
-        return min(100, outdoor_ratio * 100 + 50)
+        efficiency = outdoor_ratio * 100 + 50
+        return efficiency if efficiency < 100 else 100
     
     def _calculate_storage_efficiency(self):
-        """Calculate storage efficiency"""
-        total_possible = self.max_recent_readings + self.max_hourly_summaries + self.max_daily_summaries
-        total_used = len(self.recent_readings) + len(self.hourly_summaries) + len(self.daily_summaries)
+        """Calculate storage efficiency as a percentage of the history capacity"""
+        total_used = self._ring_count + len(self.hourly_summaries) + len(self.daily_summaries)
         
-        return f"{(total_used / total_possible * 100):.1f}%"
+        return total_used * self._storage_total_inv * 100.0
+    
+    @property
+    def last_outdoor_reading(self):
+        """The latest outdoor reading as a dict, built on demand for callers; None before the first."""
+        if not self.has_outdoor:
+            return None
+        return {
+            'outdoor_valid': True,
+            'time': self.last_time,
+            'timestamp': self.last_timestamp,
+            'pressure': self.last_pressure,
+            'temperature': self.last_temperature,
+            'humidity': self.last_humidity,
+            'lux': self.last_lux,
+            'co2': self.last_co2,
+            'cpm': self.last_cpm,
+            'location': self.last_location,
+            'wind_speed': self.last_wind_speed,
+            'wind_direction': self.last_wind_direction,
+            'uv_index': self.last_uv_index,
+            'altitude': self.last_altitude,
+            'cpu_temp': self.last_cpu_temp,
+            'memory_usage': self.last_memory_usage
+        }
+    
+    @property
+    def trends_dict(self):
+        """The trends keyed by name, built on demand for callers."""
+        return dict(zip(_TREND_NAMES, self.trends))
     
     def get_enhanced_memory_usage(self):
         """ENHANCED: Detailed memory usage analysis"""
-        # Calculate memory usage for each data structure
-        recent_memory = len(self.recent_readings) * 120  # ~120 bytes per enhanced reading
-        hourly_memory = len(self.hourly_summaries) * 80   # ~80 bytes per hourly summary
-        daily_memory = len(self.daily_summaries) * 60     # ~60 bytes per daily summary
-        pattern_memory = len(self.pattern_history) * 40   # ~40 bytes per pattern
-        trend_memory = len(self.trends) * 8               # ~8 bytes per trend value
-        overhead_memory = 300                             # System overhead
+        # Only the summary counts vary; everything else is preallocated
+        key = (len(self.hourly_summaries), len(self.daily_summaries))
+        if key == self._memory_key:
+            return self._memory_usage
         
-        total_bytes = (recent_memory + hourly_memory + daily_memory + 
-                      pattern_memory + trend_memory + overhead_memory)
+        # Calculate memory usage for each data structure
+        recent_memory, pattern_memory, trend_memory, overhead_memory = self._fixed_memory
+        hourly_memory, daily_memory, total_bytes = _memory_bytes(self._fixed_memory_total, key[0], key[1])
         
-        # PICO2 has approximately 520KB RAM total
-        pico2_total_ram = 520 * 1024  # 520KB in bytes
-        usage_percent = (total_bytes / pico2_total_ram) * 100
+        usage_percent = total_bytes * _PICO2_RAM_INV * 100
+        available_bytes = _PICO2_TOTAL_RAM - total_bytes
         
-        return {
+        self._memory_key = key
+        self._memory_usage = {
             'total_bytes': total_bytes,
             'recent_readings_bytes': recent_memory,
             'hourly_summaries_bytes': hourly_memory,
@@ -906,18 +1456,19 @@ class WeatherManager:
             'trends_bytes': trend_memory,
             'overhead_bytes': overhead_memory,
             'ram_usage_percent': f"{usage_percent:.2f}%",
-            'ram_available_bytes': pico2_total_ram - total_bytes,
-            'memory_efficiency': f"{((pico2_total_ram - total_bytes) / pico2_total_ram * 100):.1f}%"
+            'ram_available_bytes': available_bytes,
+            'memory_efficiency': f"{(available_bytes * _PICO2_RAM_INV * 100):.1f}%"
         }
+        return self._memory_usage
     
     # Maintain backwards compatibility
     def get_weather_forecast(self):
         """Backwards compatible method - calls enhanced forecast"""
         return self.get_enhanced_weather_forecast()
     
-    def calculate_storm_probability(self):
+    def calculate_storm_probability(self, detail=False):
         """Backwards compatible method - calls enhanced calculation"""
-        return self.calculate_enhanced_storm_probability()
+        return self.calculate_enhanced_storm_probability(detail)
     
     def get_memory_usage(self):
         """Backwards compatible method - calls enhanced memory usage"""
@@ -925,81 +1476,86 @@ class WeatherManager:
     
     def run_enhanced_diagnostics(self):
         """ENHANCED: Comprehensive weather system diagnostics"""
-        print("\n🌤️ Enhanced Weather System Diagnostics (PICO2)")
-        print("=" * 60)
+        # Collect the whole report and write it to the console once
+        lines = ["\n🌤️ Enhanced Weather System Diagnostics (PICO2)", "=" * 60]
+        add = lines.append
         
         # Connection status
-        print(f"📡 Sensor Manager: {'✅ Connected' if self.sensor_manager else '❌ Not Connected'}")
+        add(f"📡 Sensor Manager: {'✅ Connected' if self.sensor_manager else '❌ Not Connected'}")
         
         if self.sensor_manager:
             try:
                 sensor_data = self.get_sensor_data_from_manager()
                 if sensor_data:
-                    print(f"📍 Current Location: {sensor_data['current_location']}")
-                    print(f"🎯 Location Confidence: {sensor_data['location_confidence']}%")
-                    print(f"📊 GPS Satellites: {sensor_data['gps_satellites']}")
-                    print(f"🌡️ CPU Temperature: {sensor_data['cpu_temp']:.1f}°C")
-                    print(f"💾 Sensor Memory: {sensor_data['memory_usage']:.1f}%")
+                    add(f"📍 Current Location: {sensor_data['current_location']}")
+                    add(f"🎯 Location Confidence: {sensor_data['location_confidence']}%")
+                    add(f"📊 GPS Satellites: {sensor_data['gps_satellites']}")
+                    add(f"🌡️ CPU Temperature: {sensor_data['cpu_temp']:.1f}°C")
+                    add(f"💾 Sensor Memory: {sensor_data['memory_usage']:.1f}%")
                 else:
-                    print("❌ Unable to get sensor data")
+                    add("❌ Unable to get sensor data")
             except Exception as e:
-                print(f"❌ Sensor data error: {e}")
+                add(f"❌ Sensor data error: {e}")
         
         # ENHANCED: Weather system status
-        print(f"\n🌦️ Enhanced Weather System:")
-        print(f"  Total Readings: {self.total_readings}")
-        print(f"  Outdoor Readings: {self.outdoor_readings}")
-        print(f"  Recent Data Points: {len(self.recent_readings)}/{self.max_recent_readings}")
-        print(f"  Hourly Summaries: {len(self.hourly_summaries)}/{self.max_hourly_summaries}")
-        print(f"  Daily Summaries: {len(self.daily_summaries)}/{self.max_daily_summaries}")
-        print(f"  Pattern History: {len(self.pattern_history)}/{self.max_patterns}")
+        add(f"\n🌦️ Enhanced Weather System:")
+        add(f"  Total Readings: {self.total_readings}")
+        add(f"  Outdoor Readings: {self.outdoor_readings}")
+        add(f"  Recent Data Points: {self._ring_count}/{self.max_recent_readings}")
+        add(f"  Hourly Summaries: {len(self.hourly_summaries)}/{self.max_hourly_summaries}")
+        add(f"  Daily Summaries: {len(self.daily_summaries)}/{self.max_daily_summaries}")
+        add(f"  Pattern History: {self._ph_n}/{self.max_patterns}")
         
         # ENHANCED: Memory analysis
         memory_info = self.get_enhanced_memory_usage()
-        print(f"\n💾 Enhanced Memory Analysis:")
-        print(f"  Total Usage: {memory_info['total_bytes']} bytes ({memory_info['ram_usage_percent']})")
-        print(f"  Recent Readings: {memory_info['recent_readings_bytes']} bytes")
-        print(f"  Hourly Summaries: {memory_info['hourly_summaries_bytes']} bytes")
-        print(f"  Pattern History: {memory_info['pattern_history_bytes']} bytes")
-        print(f"  Available RAM: {memory_info['ram_available_bytes']} bytes")
-        print(f"  Memory Efficiency: {memory_info['memory_efficiency']}")
+        add(f"\n💾 Enhanced Memory Analysis:")
+        add(f"  Total Usage: {memory_info['total_bytes']} bytes ({memory_info['ram_usage_percent']})")
+        add(f"  Recent Readings: {memory_info['recent_readings_bytes']} bytes")
+        add(f"  Hourly Summaries: {memory_info['hourly_summaries_bytes']} bytes")
+        add(f"  Pattern History: {memory_info['pattern_history_bytes']} bytes")
+        add(f"  Available RAM: {memory_info['ram_available_bytes']} bytes")
+        add(f"  Memory Efficiency: {memory_info['memory_efficiency']}")
         
         # ENHANCED: Trend analysis
-        print(f"\n📈 Multi-Timeframe Trends:")
-        print(f"  Pressure (1h/3h/24h): {self.trends.get('pressure_1h', 0):.2f} / {self.trends.get('pressure_3h', 0):.2f} / {self.trends.get('pressure_24h', 0):.2f} hPa/h")
-        print(f"  Temperature (1h/3h/24h): {self.trends.get('temp_1h', 0):.2f} / {self.trends.get('temp_3h', 0):.2f} / {self.trends.get('temp_24h', 0):.2f} °C/h")
-        print(f"  Humidity (1h/3h/24h): {self.trends.get('humidity_1h', 0):.2f} / {self.trends.get('humidity_3h', 0):.2f} / {self.trends.get('humidity_24h', 0):.2f} %/h")
+        trends = self.trends
+        add(f"\n📈 Multi-Timeframe Trends:")
+        add(f"  Pressure (1h/3h/24h): {trends[_T_PRESSURE_1H]:.2f} / {trends[_T_PRESSURE_3H]:.2f} / {trends[_T_PRESSURE_24H]:.2f} hPa/h")
+        add(f"  Temperature (1h/3h/24h): {trends[_T_TEMP_1H]:.2f} / {trends[_T_TEMP_3H]:.2f} / {trends[_T_TEMP_24H]:.2f} °C/h")
+        add(f"  Humidity (1h/3h/24h): {trends[_T_HUMIDITY_1H]:.2f} / {trends[_T_HUMIDITY_3H]:.2f} / {trends[_T_HUMIDITY_24H]:.2f} %/h")
         
         # ENHANCED: Volatility metrics
-        print(f"\n📊 Volatility Metrics:")
-        print(f"  Pressure Volatility: {self.volatility_metrics.get('pressure_volatility', 0):.2f}")
-        print(f"  Temperature Volatility: {self.volatility_metrics.get('temp_volatility', 0):.2f}")
-        print(f"  Humidity Volatility: {self.volatility_metrics.get('humidity_volatility', 0):.2f}")
-        print(f"  Stability Score: {self.volatility_metrics.get('stability_score', 0):.1f}%")
+        add(f"\n📊 Volatility Metrics:")
+        add(f"  Pressure Volatility: {self.volatility_metrics.get('pressure_volatility', 0):.2f}")
+        add(f"  Temperature Volatility: {self.volatility_metrics.get('temp_volatility', 0):.2f}")
+        add(f"  Humidity Volatility: {self.volatility_metrics.get('humidity_volatility', 0):.2f}")
+        add(f"  Stability Score: {self.volatility_metrics.get('stability_score', 0):.1f}%")
         
         # Current enhanced forecast
-        forecast = self.get_enhanced_weather_forecast()
-        print(f"\n🎯 Enhanced Current Forecast:")
-        print(f"  Storm Probability: {forecast['storm_probability']}%")
-        print(f"  Storm Intensity: {forecast['storm_intensity']}%")
-        print(f"  Storm Type: {forecast['storm_type']}")
-        print(f"  Storm Detail: {forecast['storm_type_detail']}")
-        print(f"  Arrival Timing: {forecast['arrival_timing']}")
-        print(f"  Confidence: {forecast['confidence']}%")
-        print(f"  Accuracy Estimate: {forecast['accuracy_estimate']}")
-        print(f"  Method: {forecast['method']}")
+        forecast = self.get_enhanced_weather_forecast(include_memory=True)
+        add(f"\n🎯 Enhanced Current Forecast:")
+        add(f"  Storm Probability: {forecast['storm_probability']}%")
+        add(f"  Storm Intensity: {forecast['storm_intensity']}%")
+        add(f"  Storm Type: {forecast['storm_type']}")
+        add(f"  Storm Detail: {forecast['storm_type_detail']}")
+        add(f"  Arrival Timing: {forecast['arrival_timing']}")
+        add(f"  Confidence: {forecast['confidence']}%")
+        add(f"  Accuracy Estimate: {forecast['accuracy_estimate']}")
+        add(f"  Method: {forecast['method']}")
         
         # ENHANCED: Performance metrics
         perf = forecast['system_performance']
-        print(f"\n⚡ System Performance:")
-        print(f"  CPU Temperature: {perf.get('cpu_temperature', 0):.1f}°C")
-        print(f"  Processing Efficiency: {perf.get('data_processing_efficiency', 0):.1f}%")
-        print(f"  Readings/Minute: {perf.get('readings_per_minute', 0):.1f}")
-        print(f"  Storage Efficiency: {perf.get('storage_efficiency', 'N/A')}")
-        
-        print("\n✅ Enhanced weather diagnostics complete!")
-        print("🚀 PICO2 optimization: Active")
-        print("💡 Advanced features: Enabled")
+        add(f"\n⚡ System Performance:")
+        add(f"  CPU Temperature: {perf.get('cpu_temperature', 0):.1f}°C")
+        add(f"  Processing Efficiency: {perf.get('data_processing_efficiency', 0):.1f}%")
+        add(f"  Readings/Minute: {perf.get('readings_per_minute', 0):.1f}")
+        storage_efficiency = perf.get('storage_efficiency')
+        if storage_efficiency is None:
+            add("  Storage Efficiency: N/A")
+        else:
+            add(f"  Storage Efficiency: {storage_efficiency:.1f}%")
+        
+        add(_DIAG_FOOTER_BLOCK)
+        print("\n".join(lines))
 
 
 def demonstrate_enhanced_integration():
@@ -1017,7 +1573,7 @@ def demonstrate_enhanced_integration():
     
     # 2. Initialize ENHANCED weather system and connect
     from weather_manager import WeatherManager
-    weather = WeatherManager()
+    weather = WeatherManager(verbose=True)
     weather.connect_sensor_manager(sensors)
     
     # 3. Enhanced main loop with advanced features:
@@ -1044,40 +1600,9 @@ def demonstrate_enhanced_integration():
     print("ENHANCED INTEGRATION EXAMPLE:")
     print(integration_example)
     
-    print("\n📊 ENHANCED MEMORY COMPARISON:")
-    print("  Sensor Manager: ~50% system memory (your existing code)")
-    print("  Enhanced Weather: ~1.5KB additional memory")
-    print("  PICO2 RAM Usage: ~0.3% of total 520KB RAM")
-    print("  Performance Impact: Negligible")
-    
-    print("\n🎯 ENHANCED BENEFITS:")
-    benefits = [
-        "✅ Multi-timeframe analysis (1h, 3h, 24h trends)",
-        "✅ Advanced pattern recognition with learning",
-        "✅ Volatility and stability metrics",
-        "✅ Enhanced storm classification and intensity",
-        "✅ 97%+ weather prediction accuracy",
-        "✅ Seasonal and diurnal adjustments",
-        "✅ Historical data summaries",
-        "✅ Real-time performance monitoring",
-        "✅ Memory-efficient sliding windows",
-        "✅ PICO2 optimized algorithms"
-    ]
-    
-    for benefit in benefits:
-        print(f"  {benefit}")
-    
-    print("\n🌩️ ENHANCED WEATHER CAPABILITIES:")
-    print("  🎯 Storm Prediction: 97-99% accuracy")
-    print("  🕐 Timing Precision: ±15 min to 1 hour")
-    print("  📊 Storm Intensity: 0-100% scale")
-    print("  🔍 Storm Types: 8 detailed classifications")
-    print("  📈 Multi-timeframe: 1h, 3h, 24h analysis")
-    print("  🧠 Pattern Learning: 50 pattern memory")
-    print("  📍 Location Awareness: Indoor/Outdoor detection")
-    print("  ⚡ Real-time Updates: Every 60 seconds")
-    print("  🔋 Power Efficient: Optimized for PICO2")
-    print("  💾 Memory Efficient: <0.5% of PICO2 RAM")
+    print(_MEMORY_COMPARISON_BLOCK)
+    print(_ENHANCED_BENEFITS_BLOCK)
+    print(_CAPABILITIES_BLOCK)
 
 
 def test_enhanced_weather_system():
@@ -1086,7 +1611,7 @@ def test_enhanced_weather_system():
     print("=" * 60)
     
     # Initialize enhanced weather system
-    weather = WeatherManager()
+    weather = WeatherManager(verbose=True)
     
     # Test enhanced diagnostics
     weather.run_enhanced_diagnostics()
@@ -1100,7 +1625,7 @@ def test_enhanced_weather_system():
     print(f"  Timing: {forecast['arrival_timing']}")
     print(f"  Confidence: {forecast['confidence']}%")
     print(f"  Accuracy: {forecast['accuracy_estimate']}")
-    print(f"  Status: {forecast['sensor_manager_status']}")
+    print(f"  Status: {STATUS_TEXT[forecast['sensor_manager_status']]}")
     
     # Test memory efficiency
     memory = weather.get_enhanced_memory_usage()